@@ -18,6 +18,24 @@ from prompts.resume_prompts import RESUME_OPTIMIZATION_PROMPT, LATEX_RESUME_PROM
 
 logger = setup_logger(__name__)
 
+# Marker that starts each section of the optimization response
+_OPTIMIZATION_SECTION_MARKER = "###"
+
+# Result key for each section, by a phrase in its lowercased title; checked in order
+_OPTIMIZATION_SECTION_KEYS = (
+    ("optimized resume", "optimized_resume"),
+    ("changes made", "changes_made"),
+    ("keywords added", "keywords_added"),
+    ("summary", "optimization_summary"),
+    ("score", "optimization_score"),
+)
+
+# Leading list marker on a "changes made" line
+_BULLET_CHARS = "-*\u2022 \t"
+
+# First number in the "score" section
+_SCORE_RE = re.compile(r"\d+(?:\.\d+)?")
+
 class ResumeOptimizerAgent:
     """
     Agent responsible for optimizing resumes based on job descriptions
@@ -111,48 +129,42 @@ class ResumeOptimizerAgent:
             "optimization_score": 0.0
         }
         
-        # Simple parsing based on section headers
-        sections = llm_response.split("###")
-        
-        for section in sections:
-            section = section.strip()
-            if not section:
+        # Collect the sections by result key; the title is the first line of each
+        sections = {}
+        for section in llm_response.split(_OPTIMIZATION_SECTION_MARKER):
+            title, _, content = section.strip().partition("\n")
+            content = content.strip()
+            if not content:
                 continue
                 
-            # Extract section title and content
-            lines = section.split("\n", 1)
-            if len(lines) < 2:
-                continue
-                
-            title = lines[0].strip().lower()
-            content = lines[1].strip()
-            
-            # Map to result structure
-            if "optimized resume" in title:
-                result["optimized_resume"] = content
-            elif "changes made" in title:
-                result["changes_made"] = [
-                    change.strip() 
-                    for change in content.split("-") 
-                    if change.strip()
-                ]
-            elif "keywords added" in title:
-                result["keywords_added"] = [
-                    keyword.strip() 
-                    for keyword in content.split(",") 
-                    if keyword.strip()
-                ]
-            elif "summary" in title:
-                result["optimization_summary"] = content
-            elif "score" in title:
-                try:
-                    # Extract just the number
-                    score_match = re.search(r'(\d+(\.\d+)?)', content)
-                    if score_match:
-                        result["optimization_score"] = float(score_match.group(1))
-                except ValueError:
-                    # If conversion fails, keep default
-                    pass
+            title = title.strip().lower()
+            for phrase, key in _OPTIMIZATION_SECTION_KEYS:
+                if phrase in title:
+                    sections[key] = content
+                    break
+        
+        # Map to result structure
+        if "optimized_resume" in sections:
+            result["optimized_resume"] = sections["optimized_resume"]
+        if "changes_made" in sections:
+            result["changes_made"] = [
+                change
+                for change in (line.lstrip(_BULLET_CHARS).strip() for line in sections["changes_made"].splitlines())
+                if change
+            ]
+        if "keywords_added" in sections:
+            result["keywords_added"] = [
+                keyword.strip() 
+                for keyword in sections["keywords_added"].split(",") 
+                if keyword.strip()
+            ]
+        if "optimization_summary" in sections:
+            result["optimization_summary"] = sections["optimization_summary"]
+        if "optimization_score" in sections:
+            # Extract just the number; if there is none, keep the default
+            score_match = _SCORE_RE.search(sections["optimization_score"])
+            if score_match:
+                result["optimization_score"] = float(score_match.group())
         
         return result
     
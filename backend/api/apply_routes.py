@@ -3,7 +3,9 @@ Application-related API routes
 """
 
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
+import orjson
 
 from backend.models.application import ApplicationResponse, ApplicationCreate, ApplicationStatusUpdate
 from backend.services.application_engine import ApplicationEngine
@@ -37,6 +39,20 @@ async def get_applications(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve applications: {str(e)}")
 
+@router.get("/stream")
+async def stream_applications(
+    status: Optional[str] = None,
+    limit: int = 1000
+):
+    """
+    Stream applications as newline-delimited JSON, without building the whole list in memory
+    """
+    async def ndjson():
+        async for application in application_engine.db_manager.iter_applications(limit=limit, filters={"status": status}):
+            yield orjson.dumps(application) + b"\n"
+            
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
 @router.get("/{application_id}", response_model=ApplicationResponse)
 async def get_application(application_id: int):
     """
@@ -3,6 +3,7 @@ Resume-related API routes
 """
 
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 
 from backend.models.resume import ResumeResponse, ResumeCreate
@@ -41,7 +42,7 @@ async def optimize_resume(
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Resume optimization failed: {str(e)}")
 
-@router.get("/", response_model=List[ResumeResponse])
+@router.get("/", response_model=List[ResumeResponse], response_class=ORJSONResponse)
 async def get_resumes():
     """
     Get all resumes
@@ -52,7 +53,7 @@ async def get_resumes():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve resumes: {str(e)}")
 
-@router.get("/{resume_id}", response_model=ResumeResponse)
+@router.get("/{resume_id}", response_model=ResumeResponse, response_class=ORJSONResponse)
 async def get_resume(resume_id: int):
     """
     Get a specific resume by ID
@@ -2,12 +2,13 @@
 Configuration module for AI Job Hunt system
 """
 
-from .settings import settings, Settings, OllamaSettings, OpenAISettings, DatabaseSettings
+from .settings import settings, Settings, OllamaSettings, OpenAISettings, LLMSettings, DatabaseSettings
 
 __all__ = [
     'settings',
     'Settings',
     'OllamaSettings',
     'OpenAISettings',
+    'LLMSettings',
     'DatabaseSettings'
 ]
@@ -36,10 +36,26 @@ class OpenAISettings(BaseSettings):
         env_file = ".env"
         extra = "ignore"  # Allow extra fields from env
 
+class LLMSettings(BaseSettings):
+    """Provider-independent LLM client settings"""
+    max_concurrency: int = Field(default=8)  # concurrent completion requests
+    cache_size: int = Field(default=256)  # cached low-temperature completions, 0 disables
+    retry_attempts: int = Field(default=3)  # tries per completion on timeouts, 5xx and 429
+    breaker_threshold: int = Field(default=5)  # consecutive failures before failing fast
+    breaker_cooldown: float = Field(default=30.0)  # seconds to fail fast before trying again
+    
+    class Config:
+        env_prefix = "LLM_"
+        env_file = ".env"
+        extra = "ignore"  # Allow extra fields from env
+
 class DatabaseSettings(BaseSettings):
     """Database settings"""
     url: str = Field(default="sqlite:///job_applications.db")
     connect_args: Dict[str, Any] = Field(default={"check_same_thread": False})
+    pool_size: int = Field(default=4)  # Read-only connections alongside the single writer
+    wal: bool = Field(default=True)  # Disable on network filesystems that lack shared memory
+    acquire_timeout: float = Field(default=30.0)  # Seconds to wait for a free read connection
     
     class Config:
         env_prefix = "DB_"
@@ -72,10 +88,13 @@ class ApplicationSettings(BaseSettings):
         extra = "ignore"  # Allow extra fields from env
 
 class ResumeSettings(BaseSettings):
-    """Resume generator settings"""
+    """Resume parser and generator settings"""
     output_dir: Path = Field(default=Path("data/resumes/latex"))
     auto_compile_latex: bool = Field(default=False)
     latex_template_dir: Path = Field(default=Path("data/templates/latex"))
+    parse_workers: int = Field(default=2)  # processes parsing uploads, 0 parses in a thread
+    parse_cache_path: Path = Field(default=Path("data/cache/parsed_resumes.db"))
+    parse_cache_days: int = Field(default=30)  # days parsed resumes stay cached on disk, 0 disables
     
     class Config:
         env_prefix = "RESUME_"
@@ -97,6 +116,7 @@ class Settings(BaseSettings):
     # Component settings
     ollama: OllamaSettings = Field(default_factory=OllamaSettings)
     openai: OpenAISettings = Field(default_factory=OpenAISettings)
+    llm: LLMSettings = Field(default_factory=LLMSettings)
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     paths: PathSettings = Field(default_factory=PathSettings)
     application: ApplicationSettings = Field(default_factory=ApplicationSettings)
@@ -4,6 +4,7 @@ Main application entry point
 """
 
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
@@ -13,18 +14,41 @@ import uvicorn
 load_dotenv()
 
 # Import API routers
-from backend.api.resume_routes import router as resume_router
-from backend.api.job_routes import router as job_router
-from backend.api.apply_routes import router as apply_router
-from backend.api.dashboard_routes import router as dashboard_router
+from backend.api.resume_routes import router as resume_router, resume_parser, resume_optimizer
+from backend.api.job_routes import router as job_router, job_analyzer
+from backend.api.apply_routes import router as apply_router, application_engine
+from backend.api.dashboard_routes import router as dashboard_router, db_manager as dashboard_db_manager
 
 # Configure logging
 from backend.utils.logger import setup_logger
 logger = setup_logger()
 logger = setup_logger()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release shared clients when the server shuts down"""
+    yield
+    # Close the pooled HTTP sessions of the routers' LLM services
+    llm_services = {
+        resume_optimizer.llm_service,
+        job_analyzer.llm_service,
+        application_engine.application_agent.llm_service
+    }
+    for llm_service in llm_services:
+        await llm_service.close()
+    
+    # Stop the resume upload parsing workers
+    resume_parser.close()
+    
+    # Flush queued activity writes and stop the database connection threads;
+    # left open, their non-daemon threads keep the interpreter from exiting
+    db_managers = {dashboard_db_manager, application_engine.db_manager}
+    for db_manager in db_managers:
+        await db_manager.close()
+
 # Create FastAPI app
 app = FastAPI(
+    lifespan=lifespan,
     title="AI Job Hunt API",
     description="API for AI-powered job application automation system",
     version="1.0.0",
@@ -2,17 +2,38 @@
 Resume-related data models
 """
 
-from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional, Dict, Any
+import re
+import sys
+from dataclasses import dataclass
+from pydantic import BaseModel, Field
+from typing import Annotated, List, Optional, Dict, Any
 from datetime import datetime
 
-class Skill(BaseModel):
+# Cheap email shape check, validated by pydantic wherever a Contact is nested
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Leaf value types are plain slotted dataclasses: they are created in bulk
+# while parsing resumes, and pydantic still validates them whenever they are
+# nested inside one of the BaseModel classes below.
+
+def _intern_all(values: Optional[List[str]]) -> Optional[List[str]]:
+    """Intern a list of frequently repeated strings (skills, technologies)"""
+    if values is None:
+        return None
+    return [sys.intern(value) for value in values]
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Skill:
     """Skill model"""
     name: str
     category: Optional[str] = None  # technical, soft, language
     level: Optional[str] = None     # beginner, intermediate, expert
+    
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
 
-class Education(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Education:
     """Education model"""
     degree: str
     institution: str
@@ -21,7 +42,8 @@ class Education(BaseModel):
     gpa: Optional[str] = None
     relevant_courses: Optional[List[str]] = None
 
-class Experience(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Experience:
     """Work experience model"""
     title: str
     company: str
@@ -30,8 +52,12 @@ class Experience(BaseModel):
     end_date: Optional[str] = None
     description: List[str]
     technologies: Optional[List[str]] = None
+    
+    def __post_init__(self):
+        object.__setattr__(self, "technologies", _intern_all(self.technologies))
 
-class Project(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Project:
     """Project model"""
     name: str
     description: str
@@ -39,17 +65,22 @@ class Project(BaseModel):
     url: Optional[str] = None
     start_date: Optional[str] = None
     end_date: Optional[str] = None
+    
+    def __post_init__(self):
+        object.__setattr__(self, "technologies", _intern_all(self.technologies))
 
-class Certification(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Certification:
     """Certification model"""
     name: str
     issuer: Optional[str] = None
     date: Optional[str] = None
     expires: Optional[str] = None
 
-class Contact(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Contact:
     """Contact information model"""
-    email: EmailStr
+    email: Annotated[str, Field(pattern=_EMAIL_RE.pattern)]
     phone: Optional[str] = None
     location: Optional[str] = None
     linkedin: Optional[str] = None
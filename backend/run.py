@@ -7,6 +7,7 @@ import os
 import sys
 import argparse
 import asyncio
+import socket
 import subprocess
 import webbrowser
 import time
@@ -16,8 +17,16 @@ from pathlib import Path
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-def run_backend():
-    """Run the backend API server"""
+def run_backend(dev: bool = False, workers: int = 1):
+    """
+    Run the backend API server
+    
+    Args:
+        dev: Run a single auto-reloading server for development
+        workers: Number of worker processes. Caches are per process, so with more
+            than one a write leaves the other workers serving stale data until
+            their caches expire.
+    """
     print("Starting AI Job Hunt Backend Server...")
     print("API will be available at http://localhost:8000")
     print("API documentation will be available at http://localhost:8000/docs")
@@ -25,21 +34,41 @@ def run_backend():
     # Open browser after a short delay
     threading.Thread(target=lambda: [time.sleep(2), webbrowser.open("http://localhost:8000/docs")]).start()
     
-    # Run the backend
-    subprocess.run(
-        [sys.executable, "-m", "uvicorn", "main:app", "--host", "0.0.0.0", "--port", "8000", "--reload"],
-        cwd=os.path.dirname(__file__),  # Run from the backend directory
-        check=True
+    backend_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    if dev:
+        # Auto-reload needs its own supervisor process and a single worker
+        subprocess.run(
+            [sys.executable, "-m", "uvicorn", "main:app", "--host", "0.0.0.0", "--port", "8000", "--reload"],
+            cwd=backend_dir,  # Run from the backend directory
+            check=True
+        )
+        return
+    
+    # Run the backend in-process; "auto" picks uvloop/httptools when installed
+    import uvicorn
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        app_dir=backend_dir,
+        workers=workers,
+        loop="auto",
+        http="auto",
+        reload=False
     )
 
 def check_backend_running():
     """Check if the backend API is running"""
-    import requests
+    # A short TCP probe is enough to tell whether the server is listening
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    probe.settimeout(0.1)
     try:
-        response = requests.get("http://localhost:8000/api")
-        return True
-    except:
+        return probe.connect_ex(("127.0.0.1", 8000)) == 0
+    except OSError:
         return False
+    finally:
+        probe.close()
 
 def run_dashboard():
     """Run the Streamlit dashboard"""
@@ -52,7 +81,8 @@ def run_dashboard():
     if not check_backend_running():
         print("Backend API is not running. Starting it now...")
         # Start backend in a separate thread
-        threading.Thread(target=run_backend).start()
+        # Multiple workers need the main thread, so run a single one here
+        threading.Thread(target=run_backend, kwargs={"workers": 1}).start()
         time.sleep(3)  # Give backend time to start
     
     print("Dashboard will be available at http://localhost:8501")
@@ -89,11 +119,15 @@ def main():
     parser = argparse.ArgumentParser(description="AI Job Hunt - Unified Runner")
     parser.add_argument("component", choices=["backend", "dashboard", "tests", "automation", "all"],
                         help="Component to run")
+    parser.add_argument("--dev", action="store_true",
+                        help="Run the backend with auto-reload for development")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of backend worker processes (caches are per process)")
     
     args = parser.parse_args()
     
     if args.component == "backend":
-        run_backend()
+        run_backend(dev=args.dev, workers=args.workers)
     elif args.component == "dashboard":
         run_dashboard()
     elif args.component == "tests":
@@ -102,7 +136,7 @@ def main():
         run_automation()
     elif args.component == "all":
         print("Running backend and dashboard...")
-        backend_thread = threading.Thread(target=run_backend)
+        backend_thread = threading.Thread(target=run_backend, kwargs={"dev": args.dev, "workers": 1})
         backend_thread.daemon = True
         backend_thread.start()
         
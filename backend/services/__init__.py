@@ -1,17 +1,30 @@
 """
 Services module initialization
+
+Services are imported lazily on first attribute access so that importing
+one service does not pull in the dependencies of all the others.
 """
 
-from .llm_service import LLMService
-from .db_manager import DatabaseManager
-from .resume_parser import ResumeParser
-from .job_scraper import JobScraper
-from .application_engine import ApplicationEngine
+import importlib
+
+_LAZY_IMPORTS = {
+    'LLMService': 'llm_service',
+    'DatabaseManager': 'db_manager',
+    'ResumeParser': 'resume_parser',
+    'JobScraper': 'job_scraper',
+    'ApplicationEngine': 'application_engine'
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+def __getattr__(name):
+    """Import a service class on first access"""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__all__ = [
-    'LLMService',
-    'DatabaseManager',
-    'ResumeParser',
-    'JobScraper',
-    'ApplicationEngine'
-]
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -2,12 +2,11 @@
 Application Engine Service for AI Job Hunt system
 """
 
-import os
 import json
 import logging
 import asyncio
 from typing import Dict, List, Any, Optional, Union
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from ..config.settings import settings
 from ..utils.logger import setup_logger
@@ -30,11 +29,10 @@ class ApplicationEngine:
         self.application_agent = ApplicationAgent(db_manager=self.db_manager)
         
         # Ensure application directories exist
-        self.app_dir = settings.paths.application_dir
-        ensure_directory(self.app_dir)
-        ensure_directory(self.app_dir / "pending")
-        ensure_directory(self.app_dir / "submitted")
-        ensure_directory(self.app_dir / "rejected")
+        self.app_dir = ensure_directory(settings.paths.application_dir)
+        self._pending_dir = ensure_directory(self.app_dir / "pending")
+        self._submitted_dir = ensure_directory(self.app_dir / "submitted")
+        self._rejected_dir = ensure_directory(self.app_dir / "rejected")
         
         logger.info("Application Engine initialized")
     
@@ -60,7 +58,7 @@ class ApplicationEngine:
         logger.info(f"Processing {len(job_list)} new job opportunities")
         
         # Get resume data
-        resume_data = self.db_manager.get_resume(resume_id)
+        resume_data = await self.db_manager.get_resume(resume_id)
         if not resume_data:
             logger.error(f"Resume with ID {resume_id} not found")
             return {
@@ -71,15 +69,38 @@ class ApplicationEngine:
                 "failed": 0
             }
         
-        # Process jobs
-        results = await self.application_agent.process_multiple_jobs(
-            job_list=job_list,
-            resume_text=resume_data.get("text", ""),
-            candidate_skills=resume_data.get("skills", []),
-            auto_apply=auto_apply,
-            optimization_level=optimization_level
+        # Process jobs concurrently, bounded so we stay within provider rate limits
+        semaphore = asyncio.Semaphore(max(settings.llm.max_concurrency, 1))
+        
+        async def process_one(job_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.application_agent.process_job_opportunity(
+                    job_data=job_data,
+                    resume_text=resume_data.get("text", ""),
+                    candidate_skills=resume_data.get("skills", []),
+                    auto_apply=auto_apply,
+                    optimization_level=optimization_level
+                )
+        
+        outcomes = await asyncio.gather(
+            *(process_one(job_data) for job_data in job_list),
+            return_exceptions=True
         )
         
+        results = []
+        for job_data, outcome in zip(job_list, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error processing job {job_data.get('id', '')}: {str(outcome)}")
+                results.append({
+                    "job_id": job_data.get("id", ""),
+                    "title": job_data.get("title", ""),
+                    "company": job_data.get("company", ""),
+                    "application_status": "error",
+                    "error_message": str(outcome)
+                })
+            else:
+                results.append(outcome)
+        
         # Save results
         successful = [r for r in results if r.get("application_status") not in ["error", "rejected_low_match"]]
         failed = [r for r in results if r.get("application_status") == "error"]
@@ -101,7 +122,7 @@ class ApplicationEngine:
             "timestamp": datetime.now().isoformat()
         }
     
-    def get_application_statistics(self) -> Dict[str, Any]:
+    async def get_application_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about applications
         
@@ -109,7 +130,7 @@ class ApplicationEngine:
             Dictionary with application statistics
         """
         # Query the database for application stats
-        stats = self.db_manager.get_application_statistics()
+        stats = await self.db_manager.get_application_stats()
         
         # Calculate conversion rates
         total_jobs_analyzed = stats.get("total_jobs_analyzed", 0)
@@ -122,9 +143,10 @@ class ApplicationEngine:
             stats["application_rate"] = 0
             stats["success_rate"] = 0
             
-        # Add time-based metrics
-        stats["applications_last_7_days"] = self.db_manager.get_recent_application_count(days=7)
-        stats["applications_last_30_days"] = self.db_manager.get_recent_application_count(days=30)
+        # Add time-based metrics from the daily counts of the last 30 days
+        week_start = (datetime.now(timezone.utc) - timedelta(days=7)).date().isoformat()
+        stats["applications_last_7_days"] = sum(count for day, count in stats["by_date"].items() if day >= week_start)
+        stats["applications_last_30_days"] = sum(stats["by_date"].values())
         
         return stats
     
@@ -148,10 +170,10 @@ class ApplicationEngine:
             )
             
             # Move application file from pending to submitted directory
-            pending_file = self.app_dir / "pending" / f"{application_id}.json"
-            submitted_file = self.app_dir / "submitted" / f"{application_id}.json"
+            pending_file = self._pending_dir / f"{application_id}.json"
+            submitted_file = self._submitted_dir / f"{application_id}.json"
             
-            if os.path.exists(pending_file):
+            if pending_file.is_file():
                 # Load, update, and save to new location
                 data = load_json(pending_file)
                 if data:
@@ -159,7 +181,7 @@ class ApplicationEngine:
                     data["submission_result"] = result
                     data["submitted_at"] = datetime.now().isoformat()
                     save_json(data, submitted_file)
-                    os.remove(pending_file)
+                    pending_file.unlink(missing_ok=True)
             
             logger.info(f"Application {application_id} marked as submitted")
             return True
@@ -188,10 +210,10 @@ class ApplicationEngine:
             )
             
             # Move application file from pending to rejected directory
-            pending_file = self.app_dir / "pending" / f"{application_id}.json"
-            rejected_file = self.app_dir / "rejected" / f"{application_id}.json"
+            pending_file = self._pending_dir / f"{application_id}.json"
+            rejected_file = self._rejected_dir / f"{application_id}.json"
             
-            if os.path.exists(pending_file):
+            if pending_file.is_file():
                 # Load, update, and save to new location
                 data = load_json(pending_file)
                 if data:
@@ -199,7 +221,7 @@ class ApplicationEngine:
                     data["rejection_reason"] = reason
                     data["rejected_at"] = datetime.now().isoformat()
                     save_json(data, rejected_file)
-                    os.remove(pending_file)
+                    pending_file.unlink(missing_ok=True)
             
             logger.info(f"Application {application_id} rejected: {reason}")
             return True
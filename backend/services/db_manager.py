@@ -4,203 +4,860 @@ Handles all database operations
 """
 
 import os
+import copy
+import time
 import sqlite3
-import json
-from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable, AsyncIterator
+from datetime import datetime, timezone
 import asyncio
 
+import aiosqlite
+import orjson
+
 from utils.logger import setup_logger
 from config.settings import settings
+from .stats_kernels import summarize_scores
 
 logger = setup_logger(__name__)
 
+# Text payloads at least this long are stored zlib-compressed as BLOBs; shorter
+# ones stay plain TEXT, where compression would not pay for itself
+_COMPRESS_MIN_BYTES = 512
+_COMPRESSION_LEVEL = 6
+
+def _dumps(data: Any) -> str:
+    """Serialize data to compact JSON text for storage"""
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+def _pack(text: str) -> Any:
+    """Prepare a large text column value for storage, compressing it if worthwhile"""
+    encoded = text.encode()
+    if len(encoded) < _COMPRESS_MIN_BYTES:
+        return text
+    return zlib.compress(encoded, _COMPRESSION_LEVEL)
+
+def _timestamp() -> str:
+    """Current UTC time in the same format as SQLite's CURRENT_TIMESTAMP"""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+def _fts_phrase(column: str, text: str) -> str:
+    """Build an FTS5 query matching text as a literal phrase in one column"""
+    return f'{column} : "{text.replace(chr(34), chr(34) * 2)}"'
+
+def _split_skills(value: Optional[str]) -> List[str]:
+    """Split a group_concat'ed skill list back into a list"""
+    return value.split(_SKILL_SEPARATOR) if value else []
+
+def _unpack(value: Any) -> Any:
+    """Restore a text column value written by _pack (plain TEXT rows pass through)"""
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode()
+    return value
+
+def _decode_resumes(resumes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Decompress and parse listed resume rows in place"""
+    for resume in resumes:
+        resume["content"] = _unpack(resume["content"])
+        resume["parsed_data"] = orjson.loads(_unpack(resume["parsed_data"]))
+        resume["skills"] = _split_skills(resume.pop("skill_list"))
+    return resumes
+
+# PRAGMAs applied to every new connection. The writer also switches the file to
+# WAL (unless disabled with DB_WAL=false, e.g. on network filesystems), which lets
+# readers proceed while a write is in progress and, with synchronous=NORMAL,
+# avoids an fsync per commit.
+_CONNECTION_PRAGMAS = (
+    "synchronous = NORMAL",
+    "temp_store = MEMORY",
+    "cache_size = -65536",      # 64 MiB page cache
+    "mmap_size = 268435456",    # 256 MiB memory-mapped I/O
+    "busy_timeout = 5000",
+    "foreign_keys = ON"
+)
+
+# File layout PRAGMAs for the writer. SQLite only honours them while the database
+# is still empty, so they must run before anything (including WAL) touches it.
+_NEW_DATABASE_PRAGMAS = (
+    "page_size = 8192",             # Fewer overflow pages for resume and cover letter text
+    "auto_vacuum = INCREMENTAL"
+)
+
+# Free pages returned to the filesystem on each close
+_INCREMENTAL_VACUUM_PAGES = 100
+
+# Hot write statements, kept as constants so every call hands sqlite3 the same
+# SQL text and hits the connection's prepared statement cache.
+_STATEMENT_CACHE_SIZE = 256
+
+# Resumes are keyed by name: re-saving one replaces its content in place
+_INSERT_RESUME_SQL = """
+    INSERT INTO resumes (name, content, parsed_data, file_path, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (name) DO UPDATE SET
+        content = excluded.content, parsed_data = excluded.parsed_data,
+        file_path = excluded.file_path, updated_at = excluded.updated_at
+    RETURNING id
+"""
+
+_INSERT_RESUME_SKILL_SQL = "INSERT INTO resume_skills (resume_id, skill) VALUES (?, ?)"
+
+_SELECT_RESUME_SKILLS_SQL = "SELECT skill FROM resume_skills WHERE resume_id = ?"
+
+_DELETE_RESUME_SKILLS_SQL = "DELETE FROM resume_skills WHERE resume_id = ?"
+
+# Listing queries fetch each row's skills in the same statement, joined with
+# the ASCII unit separator so skill names can contain commas.
+_SKILL_SEPARATOR = "\x1f"
+
+_SELECT_RESUMES_WITH_SKILLS_SQL = """
+    SELECT r.*,
+           (SELECT group_concat(skill, char(31)) FROM resume_skills WHERE resume_id = r.id) AS skill_list
+    FROM resumes r
+    ORDER BY r.updated_at DESC
+"""
+
+# Resumes fetched and decoded per batch by iter_resumes
+_RESUME_BATCH_SIZE = 200
+
+# Applications fetched per batch by iter_applications
+_APPLICATION_BATCH_SIZE = 1000
+
+# Jobs are deduplicated by URL: re-saving a posting updates it in place
+_INSERT_JOB_SQL = """
+    INSERT INTO jobs (title, company, location, description, url,
+                      salary_range, job_type, experience_level,
+                      remote_status, platform, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (url) WHERE url IS NOT NULL AND url != '' DO UPDATE SET
+        title = excluded.title, company = excluded.company, location = excluded.location,
+        description = excluded.description, salary_range = excluded.salary_range,
+        job_type = excluded.job_type, experience_level = excluded.experience_level,
+        remote_status = excluded.remote_status, platform = excluded.platform,
+        updated_at = excluded.updated_at
+    RETURNING id
+"""
+
+# Job fields in _INSERT_JOB_SQL column order (before the timestamps); missing fields default to ""
+_JOB_KEYS = (
+    "title", "company", "location", "description", "url",
+    "salary_range", "job_type", "experience_level", "remote_status", "platform"
+)
+_EMPTY_JOB = dict.fromkeys(_JOB_KEYS, "")
+_job_fields = itemgetter(*_JOB_KEYS)
+
+_INSERT_JOB_SKILL_SQL = "INSERT INTO job_skills (job_id, skill, is_required) VALUES (?, ?, ?)"
+
+_SELECT_REQUIRED_SKILLS_SQL = "SELECT skill FROM job_skills WHERE job_id = ? AND is_required = 1"
+
+_SELECT_PREFERRED_SKILLS_SQL = "SELECT skill FROM job_skills WHERE job_id = ? AND is_required = 0"
+
+_DELETE_JOB_SKILLS_SQL = "DELETE FROM job_skills WHERE job_id = ?"
+
+_SELECT_JOBS_WITH_SKILLS_SQL = """
+    SELECT jobs.*,
+           (SELECT group_concat(skill, char(31)) FROM job_skills
+            WHERE job_id = jobs.id AND is_required = 1) AS required_list,
+           (SELECT group_concat(skill, char(31)) FROM job_skills
+            WHERE job_id = jobs.id AND is_required = 0) AS preferred_list
+    FROM jobs
+"""
+
+# get_all_jobs filters as (filter key, condition, value matched as a substring)
+_JOB_FILTERS = (
+    ("title", "title LIKE ?", True),
+    ("company", "company LIKE ?", True),
+    ("location", "location LIKE ?", True),
+    ("job_type", "job_type = ?", False),
+    ("experience_level", "experience_level = ?", False),
+    ("remote_status", "remote_status = ?", False),
+    ("platform", "platform = ?", False)
+)
+
+@lru_cache(maxsize=None)
+def _jobs_query(mask: int) -> str:
+    """Build the get_all_jobs SQL for a bitmask of active _JOB_FILTERS entries"""
+    clauses = [clause for bit, (_, clause, _) in enumerate(_JOB_FILTERS) if mask >> bit & 1]
+    where = " WHERE " + " AND ".join(clauses) if clauses else ""
+    return _SELECT_JOBS_WITH_SKILLS_SQL + where + " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+
+# Each application's job skills come from the same statement, as in get_all_jobs
+_SELECT_APPLICATIONS_SQL = """
+    SELECT a.*, j.title, j.company, j.location, j.url,
+           r.name as resume_name,
+           (SELECT group_concat(skill, char(31)) FROM job_skills
+            WHERE job_id = a.job_id AND is_required = 1) AS required_list,
+           (SELECT group_concat(skill, char(31)) FROM job_skills
+            WHERE job_id = a.job_id AND is_required = 0) AS preferred_list
+    FROM applications a
+    LEFT JOIN jobs j ON a.job_id = j.id
+    LEFT JOIN resumes r ON a.resume_id = r.id
+"""
+
+# get_all_applications exact-match filters: (filter key, clause)
+_APPLICATION_FILTERS = (
+    ("status", "a.status = ?"),
+    ("platform", "a.platform = ?"),
+    ("date_from", "a.created_at >= ?"),
+    ("date_to", "a.created_at <= ?")
+)
+
+# Substring filters on the joined job: (filter key, jobs column). Text filters go
+# last so cheaper conditions reject rows first.
+_APPLICATION_TEXT_FILTERS = (
+    ("job_title", "title"),
+    ("company", "company")
+)
+
+# Every iter_applications clause in bind order; a query's bitmask selects from these
+_APPLICATION_CLAUSES = (
+    tuple(clause for _, clause in _APPLICATION_FILTERS)
+    + tuple(f"j.{column} LIKE ?" for _, column in _APPLICATION_TEXT_FILTERS)
+    + (
+        "a.job_id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)",
+        "(a.created_at, a.id) < (?, ?)"
+    )
+)
+_APPLICATION_SEARCH_BIT = 1 << (len(_APPLICATION_CLAUSES) - 2)
+_APPLICATION_CURSOR_BIT = 1 << (len(_APPLICATION_CLAUSES) - 1)
+
+@lru_cache(maxsize=None)
+def _applications_query(mask: int) -> str:
+    """Build the iter_applications SQL for a bitmask of active _APPLICATION_CLAUSES"""
+    clauses = [clause for bit, clause in enumerate(_APPLICATION_CLAUSES) if mask >> bit & 1]
+    where = " WHERE " + " AND ".join(clauses) if clauses else ""
+    return _SELECT_APPLICATIONS_SQL + where + " ORDER BY a.created_at DESC, a.id DESC LIMIT ? OFFSET ?"
+
+_INSERT_APP_SQL = """
+    INSERT INTO applications (
+        job_id, resume_id, optimized_resume_id, cover_letter_id,
+        status, notes, platform, platform_application_id, match_score,
+        created_at, updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING id
+"""
+
+_INSERT_COVER_LETTER_SQL = """
+    INSERT INTO cover_letters (resume_id, job_id, content)
+    VALUES (?, ?, ?)
+    RETURNING id
+"""
+
+_INSERT_ACT_SQL = """
+    INSERT INTO application_activities (application_id, activity_type, details)
+    VALUES (?, ?, ?)
+"""
+
+# Status updates keep the existing notes unless an error message replaces them
+_UPDATE_STATUS_SQL = """
+    UPDATE applications
+    SET status = ?, notes = COALESCE(?, notes), updated_at = ?
+    WHERE id = ?
+"""
+
+# Standalone activity writes are queued and committed together: the writer waits
+# this long after the first queued item, then writes up to a batch per transaction.
+_ACTIVITY_BATCH_WINDOW = 0.005
+_ACTIVITY_BATCH_SIZE = 256
+
+# get_resume/get_job read-through cache: entry cap and seconds before an entry expires
+_ROW_CACHE_SIZE = 512
+_ROW_CACHE_TTL = 60.0
+
+# Seconds a get_application_stats result is served before it is recomputed. Writes
+# through this manager invalidate it at once; the TTL bounds staleness from
+# writes by other processes and the rolling 30-day window.
+_STATS_CACHE_TTL = 30.0
+
+# Columns update_application may set, in the order their SET clauses are emitted
+_APPLICATION_UPDATE_COLUMNS = ("status", "notes", "platform_application_id")
+
+@lru_cache(maxsize=None)
+def _application_update_query(mask: int) -> str:
+    """Build the update_application SQL for a bitmask of _APPLICATION_UPDATE_COLUMNS"""
+    parts = [f"{column} = ?" for bit, column in enumerate(_APPLICATION_UPDATE_COLUMNS) if mask >> bit & 1]
+    parts.append("updated_at = ?")
+    return f"UPDATE applications SET {', '.join(parts)} WHERE id = ?"
+
+# Shortest search term the trigram index can match; shorter ones fall back to LIKE
+_TRIGRAM_MIN_LENGTH = 3
+
+# Number of newest activities kept in the denormalized recent_activity_feed table
+_ACTIVITY_FEED_SIZE = 100
+
+# Full schema, applied in one executescript call inside a single transaction
+_SCHEMA_SQL = f"""
+BEGIN;
+
+-- Create resumes table
+CREATE TABLE IF NOT EXISTS resumes (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    content BLOB NOT NULL,
+    parsed_data BLOB NOT NULL,
+    file_path TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create jobs table
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    company TEXT,
+    location TEXT,
+    description TEXT NOT NULL,
+    url TEXT,
+    salary_range TEXT,
+    job_type TEXT,
+    experience_level TEXT,
+    remote_status TEXT,
+    platform TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create applications table
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY,
+    job_id INTEGER NOT NULL,
+    resume_id INTEGER NOT NULL,
+    optimized_resume_id INTEGER,
+    cover_letter_id INTEGER,
+    status TEXT DEFAULT 'pending',
+    notes TEXT,
+    platform TEXT,
+    platform_application_id TEXT,
+    match_score REAL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (job_id) REFERENCES jobs (id),
+    FOREIGN KEY (resume_id) REFERENCES resumes (id),
+    FOREIGN KEY (optimized_resume_id) REFERENCES resumes (id),
+    FOREIGN KEY (cover_letter_id) REFERENCES cover_letters (id)
+);
+
+-- Create application_activities table
+CREATE TABLE IF NOT EXISTS application_activities (
+    id INTEGER PRIMARY KEY,
+    application_id INTEGER NOT NULL,
+    activity_type TEXT NOT NULL,
+    details TEXT,
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (application_id) REFERENCES applications (id)
+);
+
+-- Create recent_activity_feed table, kept up to date by the triggers below
+CREATE TABLE IF NOT EXISTS recent_activity_feed (
+    activity_id INTEGER PRIMARY KEY,
+    application_id INTEGER NOT NULL,
+    job_title TEXT,
+    company TEXT,
+    status TEXT,
+    activity_type TEXT NOT NULL,
+    timestamp TIMESTAMP
+);
+
+-- Create cover_letters table
+CREATE TABLE IF NOT EXISTS cover_letters (
+    id INTEGER PRIMARY KEY,
+    resume_id INTEGER NOT NULL,
+    job_id INTEGER NOT NULL,
+    content BLOB NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (resume_id) REFERENCES resumes (id),
+    FOREIGN KEY (job_id) REFERENCES jobs (id)
+);
+
+-- Create search_queries table
+CREATE TABLE IF NOT EXISTS search_queries (
+    id INTEGER PRIMARY KEY,
+    query TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    location TEXT,
+    job_type TEXT,
+    date_range TEXT,
+    remote_only BOOLEAN DEFAULT 0,
+    results_count INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create settings table
+CREATE TABLE IF NOT EXISTS settings (
+    id INTEGER PRIMARY KEY,
+    key TEXT UNIQUE NOT NULL,
+    value TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create job_skills table for many-to-many relationship
+CREATE TABLE IF NOT EXISTS job_skills (
+    id INTEGER PRIMARY KEY,
+    job_id INTEGER NOT NULL,
+    skill TEXT NOT NULL,
+    is_required INTEGER DEFAULT 1,
+    FOREIGN KEY (job_id) REFERENCES jobs (id)
+);
+
+-- Create resume_skills table for many-to-many relationship
+CREATE TABLE IF NOT EXISTS resume_skills (
+    id INTEGER PRIMARY KEY,
+    resume_id INTEGER NOT NULL,
+    skill TEXT NOT NULL,
+    FOREIGN KEY (resume_id) REFERENCES resumes (id)
+);
+
+-- Create user_credentials table for storing encrypted credentials
+CREATE TABLE IF NOT EXISTS user_credentials (
+    id INTEGER PRIMARY KEY,
+    platform TEXT UNIQUE NOT NULL,
+    username TEXT NOT NULL,
+    password_encrypted TEXT NOT NULL,
+    auth_token TEXT,
+    refresh_token TEXT,
+    last_used TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create logs table
+CREATE TABLE IF NOT EXISTS logs (
+    id INTEGER PRIMARY KEY,
+    level TEXT NOT NULL,
+    message TEXT NOT NULL,
+    context TEXT,
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create precomputed analytics tables, rebuilt by refresh_analytics()
+CREATE TABLE IF NOT EXISTS skill_demand (
+    skill TEXT PRIMARY KEY COLLATE NOCASE,
+    job_count INTEGER NOT NULL,
+    in_resume BOOLEAN NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS title_trends (
+    title TEXT PRIMARY KEY COLLATE NOCASE,
+    openings INTEGER NOT NULL,
+    recent_openings INTEGER NOT NULL,
+    previous_openings INTEGER NOT NULL
+);
+
+-- Create indexes for the dashboard and listing queries
+CREATE INDEX IF NOT EXISTS idx_applications_updated_desc ON applications (updated_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_applications_status_created_id ON applications (status, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_applications_created_id ON applications (created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_applications_platform_created ON applications (platform, created_at DESC, id DESC) WHERE platform IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_applications_job_id ON applications (job_id);
+CREATE INDEX IF NOT EXISTS idx_applications_resume_id ON applications (resume_id);
+CREATE INDEX IF NOT EXISTS idx_applications_optimized_resume_id ON applications (optimized_resume_id);
+CREATE INDEX IF NOT EXISTS idx_applications_cover_letter_id ON applications (cover_letter_id);
+CREATE INDEX IF NOT EXISTS idx_activities_timestamp ON application_activities (timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_activities_app_id ON application_activities (application_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_url ON jobs (url) WHERE url IS NOT NULL AND url != '';
+CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs (created_at DESC);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_resumes_name ON resumes (name);
+CREATE INDEX IF NOT EXISTS idx_job_skills_job ON job_skills (job_id, is_required);
+CREATE INDEX IF NOT EXISTS idx_resume_skills_resume_id ON resume_skills (resume_id);
+CREATE INDEX IF NOT EXISTS idx_resume_skills_skill ON resume_skills (skill COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_skill_demand_count ON skill_demand (job_count DESC);
+CREATE INDEX IF NOT EXISTS idx_title_trends_openings ON title_trends (openings DESC);
+
+-- Denormalize each new activity into the feed and keep only the newest rows
+CREATE TRIGGER IF NOT EXISTS trg_activity_feed_insert
+AFTER INSERT ON application_activities
+BEGIN
+    INSERT OR REPLACE INTO recent_activity_feed (
+        activity_id, application_id, job_title, company, status, activity_type, timestamp
+    )
+    SELECT NEW.id, NEW.application_id, j.title, j.company, a.status, NEW.activity_type, NEW.timestamp
+    FROM applications a
+    LEFT JOIN jobs j ON a.job_id = j.id
+    WHERE a.id = NEW.application_id;
+
+    DELETE FROM recent_activity_feed
+    WHERE activity_id <= NEW.id - {_ACTIVITY_FEED_SIZE};
+END;
+
+-- Refresh the copied status, title and company when their source rows change
+CREATE TRIGGER IF NOT EXISTS trg_activity_feed_application_update
+AFTER UPDATE OF status, job_id ON applications
+BEGIN
+    UPDATE recent_activity_feed
+    SET status = NEW.status,
+        job_title = (SELECT title FROM jobs WHERE id = NEW.job_id),
+        company = (SELECT company FROM jobs WHERE id = NEW.job_id)
+    WHERE application_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_activity_feed_job_update
+AFTER UPDATE OF title, company ON jobs
+BEGIN
+    UPDATE recent_activity_feed
+    SET job_title = NEW.title, company = NEW.company
+    WHERE application_id IN (SELECT id FROM applications WHERE job_id = NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_activity_feed_delete
+AFTER DELETE ON application_activities
+BEGIN
+    DELETE FROM recent_activity_feed WHERE activity_id = OLD.id;
+END;
+
+COMMIT;
+"""
+
+# Trigram full-text index over job titles and companies for substring search.
+# Applied separately because it needs FTS5 and SQLite 3.34+; without it the
+# job_title and company filters use LIKE.
+_JOB_SEARCH_MIN_SQLITE_VERSION = (3, 34, 0)
+_JOB_SEARCH_SCHEMA_SQL = """
+BEGIN;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, content = 'jobs', content_rowid = 'id', tokenize = 'trigram'
+);
+
+-- Keep the job search index in sync with the jobs table
+CREATE TRIGGER IF NOT EXISTS trg_jobs_fts_insert
+AFTER INSERT ON jobs
+BEGIN
+    INSERT INTO jobs_fts (rowid, title, company) VALUES (NEW.id, NEW.title, NEW.company);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_jobs_fts_update
+AFTER UPDATE OF title, company ON jobs
+BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company) VALUES ('delete', OLD.id, OLD.title, OLD.company);
+    INSERT INTO jobs_fts (rowid, title, company) VALUES (NEW.id, NEW.title, NEW.company);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_jobs_fts_delete
+AFTER DELETE ON jobs
+BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company) VALUES ('delete', OLD.id, OLD.title, OLD.company);
+END;
+
+COMMIT;
+"""
+
 class DatabaseManager:
     """Database management service"""
     
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, pool_size: Optional[int] = None):
         """Initialize database manager"""
         self.logger = logger
         self.db_path = db_path or settings.database.url or "job_applications.db"
         # Convert SQLAlchemy URL to SQLite path if needed
         if self.db_path.startswith("sqlite:///"):
             self.db_path = self.db_path.replace("sqlite:///", "")
-        self.connection = None
+        self.pool_size = max(1, pool_size or settings.database.pool_size)
+        
+        # One writer connection serialized by a lock, plus a pool of read-only
+        # connections so reads never queue behind a write (WAL allows both)
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._readers: Optional[asyncio.Queue] = None
+        self._reader_connections: List[aiosqlite.Connection] = []
+        self._write_lock = asyncio.Lock()
+        self._pool_lock = asyncio.Lock()
+        self._acquire_timeout = settings.database.acquire_timeout
+        
+        # Reader pool metrics reported by pool_stats()
+        self._acquisitions = 0
+        self._acquire_wait = 0.0
+        
+        # Queue and background task that group-commit add_application_activity calls
+        self._activity_queue: Optional[asyncio.Queue] = None
+        self._activity_writer: Optional[asyncio.Task] = None
+        
+        # Whether the trigram job search index is available, set by init_db
+        self._job_search = False
+        
+        # Set whenever jobs or resumes change; the analytics getters rebuild
+        # the precomputed tables on their next call
+        self._analytics_stale = True
+        
+        # LRU cache of get_resume/get_job results keyed on ("resume"|"job", id),
+        # stored as orjson bytes so every hit decodes a fresh dict. Writers queue keys in _pending_evictions; they are dropped once the
+        # transaction ends, and the generation bump stops reads that overlapped
+        # the write from caching what they saw.
+        self._row_cache: "OrderedDict[Tuple[str, int], Tuple[float, bytes]]" = OrderedDict()
+        self._row_cache_generation = 0
+        self._pending_evictions: List[Tuple[str, int]] = []
+        
+        # Last get_application_stats result as (expiry, stats). Every write
+        # transaction clears it and bumps the generation, like the row cache.
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._stats_generation = 0
     
     async def init_db(self):
         """Initialize the database schema"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Create resumes table
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS resumes (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                content TEXT NOT NULL,
-                parsed_data TEXT NOT NULL,
-                file_path TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            ''')
-            
-            # Create jobs table
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS jobs (
-                id INTEGER PRIMARY KEY,
-                title TEXT NOT NULL,
-                company TEXT,
-                location TEXT,
-                description TEXT NOT NULL,
-                url TEXT,
-                salary_range TEXT,
-                job_type TEXT,
-                experience_level TEXT,
-                remote_status TEXT,
-                platform TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            ''')
-            
-            # Create applications table
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS applications (
-                id INTEGER PRIMARY KEY,
-                job_id INTEGER NOT NULL,
-                resume_id INTEGER NOT NULL,
-                optimized_resume_id INTEGER,
-                cover_letter_id INTEGER,
-                status TEXT DEFAULT 'pending',
-                notes TEXT,
-                platform TEXT,
-                platform_application_id TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (job_id) REFERENCES jobs (id),
-                FOREIGN KEY (resume_id) REFERENCES resumes (id),
-                FOREIGN KEY (optimized_resume_id) REFERENCES resumes (id),
-                FOREIGN KEY (cover_letter_id) REFERENCES cover_letters (id)
-            )
-            ''')
-            
-            # Create cover_letters table
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS cover_letters (
-                id INTEGER PRIMARY KEY,
-                resume_id INTEGER NOT NULL,
-                job_id INTEGER NOT NULL,
-                content TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (resume_id) REFERENCES resumes (id),
-                FOREIGN KEY (job_id) REFERENCES jobs (id)
-            )
-            ''')
-            
-            # Create search_queries table
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS search_queries (
-                id INTEGER PRIMARY KEY,
-                query TEXT NOT NULL,
-                platform TEXT NOT NULL,
-                location TEXT,
-                job_type TEXT,
-                date_range TEXT,
-                remote_only BOOLEAN DEFAULT 0,
-                results_count INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            ''')
-            
-            # Create settings table
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS settings (
-                id INTEGER PRIMARY KEY,
-                key TEXT UNIQUE NOT NULL,
-                value TEXT NOT NULL,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            ''')
-            
-            # Create job_skills table for many-to-many relationship
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS job_skills (
-                id INTEGER PRIMARY KEY,
-                job_id INTEGER NOT NULL,
-                skill TEXT NOT NULL,
-                is_required BOOLEAN DEFAULT 1,
-                FOREIGN KEY (job_id) REFERENCES jobs (id)
-            )
-            ''')
-            
-            # Create resume_skills table for many-to-many relationship
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS resume_skills (
-                id INTEGER PRIMARY KEY,
-                resume_id INTEGER NOT NULL,
-                skill TEXT NOT NULL,
-                FOREIGN KEY (resume_id) REFERENCES resumes (id)
-            )
-            ''')
-            
-            # Create user_credentials table for storing encrypted credentials
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS user_credentials (
-                id INTEGER PRIMARY KEY,
-                platform TEXT UNIQUE NOT NULL,
-                username TEXT NOT NULL,
-                password_encrypted TEXT NOT NULL,
-                auth_token TEXT,
-                refresh_token TEXT,
-                last_used TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            ''')
-            
-            # Create logs table
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS logs (
-                id INTEGER PRIMARY KEY,
-                level TEXT NOT NULL,
-                message TEXT NOT NULL,
-                context TEXT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            ''')
-            
-            conn.commit()
+            await self._ensure_pool()
+            async with self._write_lock:
+                # Jobs saved before the search index existed must be indexed once
+                cursor = await self._writer.execute("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'")
+                rebuild_job_search = await cursor.fetchone() is None
+                # New listing indexes need planner statistics before they are preferred
+                cursor = await self._writer.execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_applications_platform_created'")
+                analyze_applications = await cursor.fetchone() is None
+                try:
+                    await self._writer.executescript(_SCHEMA_SQL)
+                except Exception:
+                    await self._writer.rollback()
+                    raise
+                self._job_search = await self._create_job_search()
+            
+            async with self._transaction() as conn:
+                # Add columns introduced after the initial schema
+                cursor = await conn.execute("PRAGMA table_info(applications)")
+                application_columns = {row["name"] for row in await cursor.fetchall()}
+                if "match_score" not in application_columns:
+                    await conn.execute("ALTER TABLE applications ADD COLUMN match_score REAL")
+                
+                if rebuild_job_search and self._job_search:
+                    await conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+                
+                if analyze_applications:
+                    await conn.execute("ANALYZE applications")
+                
+                # Backfill the feed for databases created before it existed
+                cursor = await conn.execute("SELECT 1 FROM recent_activity_feed LIMIT 1")
+                if not await cursor.fetchone():
+                    await conn.execute(
+                        f"""
+                        INSERT INTO recent_activity_feed (
+                            activity_id, application_id, job_title, company, status, activity_type, timestamp
+                        )
+                        SELECT act.id, act.application_id, j.title, j.company, a.status, act.activity_type, act.timestamp
+                        FROM application_activities act
+                        JOIN applications a ON act.application_id = a.id
+                        LEFT JOIN jobs j ON a.job_id = j.id
+                        ORDER BY act.id DESC
+                        LIMIT {_ACTIVITY_FEED_SIZE}
+                        """
+                    )
+                
             self.logger.info("Database initialized successfully")
             
         except Exception as e:
             self.logger.error(f"Error initializing database: {str(e)}")
             raise
     
-    def _get_connection(self):
-        """Get a database connection"""
-        if self.connection is None:
-            self.connection = sqlite3.connect(self.db_path)
-            # Enable foreign keys
-            self.connection.execute("PRAGMA foreign_keys = ON")
-            # Configure row factory to return dictionaries
-            self.connection.row_factory = self._dict_factory
-        return self.connection
+    async def _create_job_search(self) -> bool:
+        """
+        Create the trigram job search index if this SQLite build supports it
+        
+        Returns:
+            True if the index is available, False if searches must use LIKE
+        """
+        if sqlite3.sqlite_version_info < _JOB_SEARCH_MIN_SQLITE_VERSION:
+            self.logger.warning(f"SQLite {sqlite3.sqlite_version} has no trigram tokenizer; job search will use LIKE")
+            return False
+        try:
+            await self._writer.executescript(_JOB_SEARCH_SCHEMA_SQL)
+        except sqlite3.OperationalError as e:
+            await self._writer.rollback()
+            self.logger.warning(f"Job search index unavailable, job search will use LIKE: {str(e)}")
+            return False
+        return True
+    
+    async def _open_connection(self, read_only: bool = False) -> aiosqlite.Connection:
+        """Open a database connection configured with the shared PRAGMAs"""
+        # Autocommit mode: writers open their transactions explicitly with BEGIN
+        conn = await aiosqlite.connect(
+            self.db_path,
+            **{
+                **settings.database.connect_args,
+                "cached_statements": _STATEMENT_CACHE_SIZE,
+                "isolation_level": None
+            }
+        )
+        if not read_only:
+            for pragma in _NEW_DATABASE_PRAGMAS:
+                await conn.execute(f"PRAGMA {pragma}")
+            # Journal mode is stored in the file, so only the writer sets it
+            await conn.execute(f"PRAGMA journal_mode = {'WAL' if settings.database.wal else 'DELETE'}")
+        # Configure journaling, caching and foreign keys once per connection
+        for pragma in _CONNECTION_PRAGMAS:
+            await conn.execute(f"PRAGMA {pragma}")
+        if read_only:
+            await conn.execute("PRAGMA query_only = ON")
+        # Rows are built in C and only copied into dicts where they are returned
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    async def _ensure_pool(self):
+        """Open the writer and reader connections on first use"""
+        if self._writer is not None:
+            return
+            
+        async with self._pool_lock:
+            if self._writer is not None:
+                return
+                
+            # The writer goes first so WAL mode is set before any reader attaches
+            writer = await self._open_connection()
+            readers = asyncio.Queue()
+            for _ in range(self.pool_size):
+                reader = await self._open_connection(read_only=True)
+                self._reader_connections.append(reader)
+                readers.put_nowait(reader)
+                
+            self._readers = readers
+            self._writer = writer
+    
+    @asynccontextmanager
+    async def _acquire(self):
+        """Borrow a read-only connection from the pool"""
+        await self._ensure_pool()
+        started = time.perf_counter()
+        try:
+            conn = self._readers.get_nowait()
+        except asyncio.QueueEmpty:
+            conn = await asyncio.wait_for(self._readers.get(), self._acquire_timeout)
+        self._acquisitions += 1
+        self._acquire_wait += time.perf_counter() - started
+        try:
+            yield conn
+        finally:
+            self._readers.put_nowait(conn)
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Get reader pool usage metrics
+        
+        Returns:
+            Pool size, idle readers, total acquisitions and average wait time
+        """
+        return {
+            "pool_size": self.pool_size,
+            "idle_readers": self._readers.qsize() if self._readers is not None else 0,
+            "total_acquisitions": self._acquisitions,
+            "average_wait_time_ms": self._acquire_wait * 1000 / self._acquisitions if self._acquisitions else 0.0
+        }
+    
+    @asynccontextmanager
+    async def _transaction(self):
+        """Run a write transaction on the writer connection, committing on success"""
+        await self._ensure_pool()
+        async with self._write_lock:
+            conn = self._writer
+            # Take the write lock up front so another process (e.g. a second
+            # uvicorn worker) cannot make us fail with SQLITE_BUSY mid-transaction
+            await conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                await conn.rollback()
+                raise
+            else:
+                await conn.commit()
+            finally:
+                self._flush_evictions()
+                self._stats_cache = None
+                self._stats_generation += 1
+    
+    def _cache_get(self, key: Tuple[str, int]) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached row, or None if missing or expired"""
+        entry = self._row_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._row_cache[key]
+            return None
+        self._row_cache.move_to_end(key)
+        # Decoding is several times cheaper than deep-copying the nested row
+        return orjson.loads(value)
+    
+    def _cache_put(self, key: Tuple[str, int], value: Dict[str, Any], generation: int):
+        """Cache a row read while the cache was at the given generation"""
+        if generation != self._row_cache_generation:
+            return
+        self._row_cache[key] = (time.monotonic() + _ROW_CACHE_TTL, orjson.dumps(value))
+        self._row_cache.move_to_end(key)
+        if len(self._row_cache) > _ROW_CACHE_SIZE:
+            self._row_cache.popitem(last=False)
+    
+    def _flush_evictions(self):
+        """Drop cached rows written by the transaction that just ended"""
+        if not self._pending_evictions:
+            return
+        for key in self._pending_evictions:
+            self._row_cache.pop(key, None)
+        self._pending_evictions.clear()
+        self._row_cache_generation += 1
     
     @staticmethod
-    def _dict_factory(cursor, row):
-        """Convert row to dictionary"""
-        d = {}
-        for idx, col in enumerate(cursor.description):
-            d[col[0]] = row[idx]
-        return d
+    async def _fetch_tuples(conn: aiosqlite.Connection, sql: str, parameters: Any = ()) -> List[tuple]:
+        """
+        Run a query and return plain tuples, bypassing the row factory
+        
+        Used by hot readers that unpack rows positionally.
+        
+        Args:
+            conn: Connection to query
+            sql: SQL statement
+            parameters: Statement parameters
+            
+        Returns:
+            List of row tuples
+        """
+        cursor = await conn.execute(sql, parameters)
+        cursor.row_factory = None
+        return await cursor.fetchall()
     
-    def close(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+    async def close(self):
+        """Close database connections"""
+        if self._activity_writer is not None:
+            # Flush queued activities before the writer connection goes away
+            await self._activity_queue.join()
+            self._activity_writer.cancel()
+            self._activity_writer = None
+            self._activity_queue = None
+        
+        async with self._pool_lock:
+            for reader in self._reader_connections:
+                await reader.close()
+            self._reader_connections = []
+            self._readers = None
+            
+            if self._writer:
+                # Let SQLite refresh planner statistics and release some free pages
+                # before the connection goes away
+                await self._writer.execute("PRAGMA optimize")
+                await self._writer.execute(f"PRAGMA incremental_vacuum({_INCREMENTAL_VACUUM_PAGES})")
+                await self._writer.close()
+                self._writer = None
+    
+    async def bulk_import(self, import_fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a bulk import with per-commit syncing disabled
+        
+        Only use this from trusted seeding/import code: a crash during the import
+        can lose its most recent commits (the database itself stays consistent).
+        
+        Args:
+            import_fn: Coroutine function doing the writes, e.g. calling save_jobs
+            
+        Returns:
+            Whatever import_fn returns
+        """
+        await self._ensure_pool()
+        await self._writer.execute("PRAGMA synchronous = OFF")
+        try:
+            return await import_fn()
+        finally:
+            # Restore durable commits and fold the import's WAL back into the database
+            await self._writer.execute("PRAGMA synchronous = NORMAL")
+            await self._writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self.logger.info("Bulk import finished, WAL checkpointed")
     
     async def save_resume(self, name: str, content: str, parsed_data: Dict[str, Any], file_path: Optional[str] = None) -> int:
         """
@@ -216,62 +873,60 @@ class DatabaseManager:
             ID of the saved resume
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Check if resume already exists
-            cursor.execute(
-                "SELECT id FROM resumes WHERE name = ?",
-                (name,)
-            )
-            existing = cursor.fetchone()
-            
-            if existing:
-                # Update existing resume
-                cursor.execute(
-                    """
-                    UPDATE resumes 
-                    SET content = ?, parsed_data = ?, file_path = ?, updated_at = CURRENT_TIMESTAMP 
-                    WHERE id = ?
-                    """,
-                    (content, json.dumps(parsed_data), file_path, existing["id"])
-                )
-                resume_id = existing["id"]
-                self.logger.info(f"Updated existing resume: {name} (ID: {resume_id})")
-            else:
-                # Insert new resume
-                cursor.execute(
-                    """
-                    INSERT INTO resumes (name, content, parsed_data, file_path)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (name, content, json.dumps(parsed_data), file_path)
-                )
-                resume_id = cursor.lastrowid
-                self.logger.info(f"Saved new resume: {name} (ID: {resume_id})")
-            
-            # Save resume skills if present
-            if "skills" in parsed_data and parsed_data["skills"]:
-                # Delete existing skills
-                cursor.execute("DELETE FROM resume_skills WHERE resume_id = ?", (resume_id,))
+            async with self._transaction() as conn:
+                return await self._upsert_resume(conn, name, content, parsed_data, file_path)
                 
-                # Insert new skills
-                skills = parsed_data["skills"]
-                if isinstance(skills, list):
-                    for skill in skills:
-                        cursor.execute(
-                            "INSERT INTO resume_skills (resume_id, skill) VALUES (?, ?)",
-                            (resume_id, skill)
-                        )
-            
-            conn.commit()
-            return resume_id
-            
         except Exception as e:
-            conn.rollback()
             self.logger.error(f"Error saving resume: {str(e)}")
             raise
     
+    async def _upsert_resume(self, conn: aiosqlite.Connection, name: str, content: str, parsed_data: Dict[str, Any], file_path: Optional[str] = None, now: Optional[str] = None) -> int:
+        """
+        Insert or update a resume inside the caller's transaction
+        
+        Args:
+            conn: Connection of the open transaction
+            name: Resume name
+            content: Raw resume content
+            parsed_data: Parsed resume data
+            file_path: Path to resume file
+            now: Timestamp shared by the transaction's rows (defaults to the current time)
+            
+        Returns:
+            ID of the saved resume
+        """
+        self._analytics_stale = True
+        
+        now = now or _timestamp()
+        
+        # Serialize parsed data once, compactly
+        parsed_json = _pack(_dumps(parsed_data))
+        content = _pack(content)
+        
+        # Insert the resume, or update the existing row with the same name
+        cursor = await conn.execute(
+            _INSERT_RESUME_SQL,
+            (name, content, parsed_json, file_path, now, now)
+        )
+        resume_id = (await cursor.fetchone())["id"]
+        self._pending_evictions.append(("resume", resume_id))
+        self.logger.info(f"Saved resume: {name} (ID: {resume_id})")
+        
+        # Save resume skills if present
+        if "skills" in parsed_data and parsed_data["skills"]:
+            # Delete existing skills
+            await conn.execute(_DELETE_RESUME_SKILLS_SQL, (resume_id,))
+            
+            # Insert new skills
+            skills = parsed_data["skills"]
+            if isinstance(skills, list):
+                await conn.executemany(
+                    _INSERT_RESUME_SKILL_SQL,
+                    [(resume_id, skill) for skill in skills]
+                )
+                
+        return resume_id
+    
     async def get_resume(self, resume_id: int) -> Optional[Dict[str, Any]]:
         """
         Get a resume by ID
@@ -282,32 +937,39 @@ class DatabaseManager:
         Returns:
             Resume data or None if not found
         """
+        cached = self._cache_get(("resume", resume_id))
+        if cached is not None:
+            return cached
+        generation = self._row_cache_generation
+        
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(
-                "SELECT * FROM resumes WHERE id = ?",
-                (resume_id,)
-            )
-            resume = cursor.fetchone()
-            
-            if not resume:
-                return None
-            
-            # Parse JSON data
-            resume["parsed_data"] = json.loads(resume["parsed_data"])
-            
-            # Get skills
-            cursor.execute(
-                "SELECT skill FROM resume_skills WHERE resume_id = ?",
-                (resume_id,)
-            )
-            skills = [row["skill"] for row in cursor.fetchall()]
-            resume["skills"] = skills
-            
+            async with self._acquire() as conn:
+                cursor = await conn.execute(
+                    "SELECT * FROM resumes WHERE id = ?",
+                    (resume_id,)
+                )
+                row = await cursor.fetchone()
+                
+                if not row:
+                    return None
+                    
+                resume = dict(row)
+                
+                # Decompress content and parse JSON data
+                resume["content"] = _unpack(resume["content"])
+                resume["parsed_data"] = orjson.loads(_unpack(resume["parsed_data"]))
+                
+                # Get skills
+                skills = [skill for (skill,) in await self._fetch_tuples(
+                    conn,
+                    _SELECT_RESUME_SKILLS_SQL,
+                    (resume_id,)
+                )]
+                resume["skills"] = skills
+                
+            self._cache_put(("resume", resume_id), resume, generation)
             return resume
-            
+                
         except Exception as e:
             self.logger.error(f"Error getting resume: {str(e)}")
             raise
@@ -320,30 +982,37 @@ class DatabaseManager:
             List of all resumes
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT * FROM resumes ORDER BY updated_at DESC")
-            resumes = cursor.fetchall()
-            
-            # Parse JSON data and get skills for each resume
-            for resume in resumes:
-                resume["parsed_data"] = json.loads(resume["parsed_data"])
+            return [resume async for resume in self.iter_resumes()]
                 
-                # Get skills
-                cursor.execute(
-                    "SELECT skill FROM resume_skills WHERE resume_id = ?",
-                    (resume["id"],)
-                )
-                skills = [row["skill"] for row in cursor.fetchall()]
-                resume["skills"] = skills
-            
-            return resumes
-            
         except Exception as e:
             self.logger.error(f"Error getting all resumes: {str(e)}")
             raise
     
+    async def iter_resumes(self, batch_size: int = _RESUME_BATCH_SIZE) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream all resumes, most recently updated first
+        
+        Rows are fetched and decoded a batch at a time, so memory stays bounded by
+        the batch size. A reader connection is held until the iterator is
+        exhausted or closed.
+        
+        Args:
+            batch_size: Number of resumes fetched per batch
+            
+        Yields:
+            Resume data
+        """
+        async with self._acquire() as conn:
+            cursor = await conn.execute(_SELECT_RESUMES_WITH_SKILLS_SQL)
+            while True:
+                rows = await cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                    
+                # Decompressing and parsing resumes can take a while, so keep it off the event loop
+                for resume in await asyncio.to_thread(_decode_resumes, [dict(row) for row in rows]):
+                    yield resume
+    
     async def delete_resume(self, resume_id: int) -> bool:
         """
         Delete a resume by ID
@@ -355,32 +1024,25 @@ class DatabaseManager:
             True if deleted, False if not found
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Check if resume exists
-            cursor.execute(
-                "SELECT id FROM resumes WHERE id = ?",
-                (resume_id,)
-            )
-            if not cursor.fetchone():
-                return False
-            
-            # Delete resume skills
-            cursor.execute("DELETE FROM resume_skills WHERE resume_id = ?", (resume_id,))
-            
-            # Delete resume
-            cursor.execute("DELETE FROM resumes WHERE id = ?", (resume_id,))
-            
-            conn.commit()
+            async with self._transaction() as conn:
+                # Delete resume skills
+                await conn.execute(_DELETE_RESUME_SKILLS_SQL, (resume_id,))
+                
+                # Delete resume; no row deleted means it did not exist
+                cursor = await conn.execute("DELETE FROM resumes WHERE id = ?", (resume_id,))
+                if not cursor.rowcount:
+                    return False
+                    
+                self._analytics_stale = True
+                self._pending_evictions.append(("resume", resume_id))
+                
             self.logger.info(f"Deleted resume ID: {resume_id}")
             return True
             
         except Exception as e:
-            conn.rollback()
             self.logger.error(f"Error deleting resume: {str(e)}")
             raise
-            
+    
     async def save_job(self, job_data: Dict[str, Any]) -> int:
         """
         Save a job to the database
@@ -392,102 +1054,78 @@ class DatabaseManager:
             ID of the saved job
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Extract job fields
-            title = job_data.get("title", "")
-            company = job_data.get("company", "")
-            location = job_data.get("location", "")
-            description = job_data.get("description", "")
-            url = job_data.get("url", "")
-            salary_range = job_data.get("salary_range", "")
-            job_type = job_data.get("job_type", "")
-            experience_level = job_data.get("experience_level", "")
-            remote_status = job_data.get("remote_status", "")
-            platform = job_data.get("platform", "")
-            
-            # Check if job already exists by URL
-            if url:
-                cursor.execute(
-                    "SELECT id FROM jobs WHERE url = ?",
-                    (url,)
-                )
-                existing = cursor.fetchone()
+            async with self._transaction() as conn:
+                return await self._upsert_job(conn, job_data)
                 
-                if existing:
-                    # Update existing job
-                    cursor.execute(
-                        """
-                        UPDATE jobs 
-                        SET title = ?, company = ?, location = ?, description = ?, 
-                            salary_range = ?, job_type = ?, experience_level = ?, 
-                            remote_status = ?, platform = ?, updated_at = CURRENT_TIMESTAMP 
-                        WHERE id = ?
-                        """,
-                        (title, company, location, description, salary_range, 
-                         job_type, experience_level, remote_status, platform, existing["id"])
-                    )
-                    job_id = existing["id"]
-                    self.logger.info(f"Updated existing job: {title} at {company} (ID: {job_id})")
-                else:
-                    # Insert new job
-                    cursor.execute(
-                        """
-                        INSERT INTO jobs (title, company, location, description, url, 
-                                          salary_range, job_type, experience_level, 
-                                          remote_status, platform)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (title, company, location, description, url, salary_range, 
-                         job_type, experience_level, remote_status, platform)
-                    )
-                    job_id = cursor.lastrowid
-                    self.logger.info(f"Saved new job: {title} at {company} (ID: {job_id})")
-            else:
-                # Insert new job without URL check
-                cursor.execute(
-                    """
-                    INSERT INTO jobs (title, company, location, description, url, 
-                                      salary_range, job_type, experience_level, 
-                                      remote_status, platform)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (title, company, location, description, url, salary_range, 
-                     job_type, experience_level, remote_status, platform)
-                )
-                job_id = cursor.lastrowid
-                self.logger.info(f"Saved new job: {title} at {company} (ID: {job_id})")
+        except Exception as e:
+            self.logger.error(f"Error saving job: {str(e)}")
+            raise
+    
+    async def save_jobs(self, jobs: List[Dict[str, Any]]) -> List[int]:
+        """
+        Save several jobs to the database in a single transaction
+        
+        Args:
+            jobs: List of job data
             
-            # Save job skills if present
-            if "required_skills" in job_data or "preferred_skills" in job_data:
-                # Delete existing skills
-                cursor.execute("DELETE FROM job_skills WHERE job_id = ?", (job_id,))
-                
-                # Insert required skills
-                if "required_skills" in job_data and job_data["required_skills"]:
-                    for skill in job_data["required_skills"]:
-                        cursor.execute(
-                            "INSERT INTO job_skills (job_id, skill, is_required) VALUES (?, ?, ?)",
-                            (job_id, skill, True)
-                        )
-                
-                # Insert preferred skills
-                if "preferred_skills" in job_data and job_data["preferred_skills"]:
-                    for skill in job_data["preferred_skills"]:
-                        cursor.execute(
-                            "INSERT INTO job_skills (job_id, skill, is_required) VALUES (?, ?, ?)",
-                            (job_id, skill, False)
-                        )
+        Returns:
+            IDs of the saved jobs, in input order
+        """
+        if not jobs:
+            return []
             
-            conn.commit()
-            return job_id
+        try:
+            async with self._transaction() as conn:
+                now = _timestamp()
+                job_ids = [await self._upsert_job(conn, job_data, now) for job_data in jobs]
+                
+            self.logger.info(f"Saved {len(job_ids)} jobs")
+            return job_ids
             
         except Exception as e:
-            conn.rollback()
-            self.logger.error(f"Error saving job: {str(e)}")
+            self.logger.error(f"Error saving jobs: {str(e)}")
             raise
+    
+    async def _upsert_job(self, conn: aiosqlite.Connection, job_data: Dict[str, Any], now: Optional[str] = None) -> int:
+        """
+        Insert or update a job inside the caller's transaction
+        
+        Args:
+            conn: Connection of the open transaction
+            job_data: Job data
+            now: Timestamp shared by the transaction's rows (defaults to the current time)
             
+        Returns:
+            ID of the saved job
+        """
+        self._analytics_stale = True
+        
+        # Extract job fields in one C-level pass
+        job_row = _job_fields({**_EMPTY_JOB, **job_data})
+        title, company = job_row[0], job_row[1]
+        
+        # Insert the job, or update the existing row with the same URL
+        now = now or _timestamp()
+        cursor = await conn.execute(_INSERT_JOB_SQL, (*job_row, now, now))
+        job_id = (await cursor.fetchone())["id"]
+        self._pending_evictions.append(("job", job_id))
+        self.logger.info(f"Saved job: {title} at {company} (ID: {job_id})")
+        
+        # Save job skills if present
+        if "required_skills" in job_data or "preferred_skills" in job_data:
+            # Delete existing skills
+            await conn.execute(_DELETE_JOB_SKILLS_SQL, (job_id,))
+            
+            skill_rows = [(job_id, skill, 1) for skill in job_data.get("required_skills") or []]
+            skill_rows.extend((job_id, skill, 0) for skill in job_data.get("preferred_skills") or [])
+            if skill_rows:
+                await conn.executemany(
+                    _INSERT_JOB_SKILL_SQL,
+                    skill_rows
+                )
+                
+        return job_id
+    
     async def get_job(self, job_id: int) -> Optional[Dict[str, Any]]:
         """
         Get a job by ID
@@ -498,41 +1136,47 @@ class DatabaseManager:
         Returns:
             Job data or None if not found
         """
+        cached = self._cache_get(("job", job_id))
+        if cached is not None:
+            return cached
+        generation = self._row_cache_generation
+        
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(
-                "SELECT * FROM jobs WHERE id = ?",
-                (job_id,)
-            )
-            job = cursor.fetchone()
-            
-            if not job:
-                return None
-            
-            # Get required skills
-            cursor.execute(
-                "SELECT skill FROM job_skills WHERE job_id = ? AND is_required = 1",
-                (job_id,)
-            )
-            required_skills = [row["skill"] for row in cursor.fetchall()]
-            job["required_skills"] = required_skills
-            
-            # Get preferred skills
-            cursor.execute(
-                "SELECT skill FROM job_skills WHERE job_id = ? AND is_required = 0",
-                (job_id,)
-            )
-            preferred_skills = [row["skill"] for row in cursor.fetchall()]
-            job["preferred_skills"] = preferred_skills
-            
+            async with self._acquire() as conn:
+                cursor = await conn.execute(
+                    "SELECT * FROM jobs WHERE id = ?",
+                    (job_id,)
+                )
+                row = await cursor.fetchone()
+                
+                if not row:
+                    return None
+                    
+                job = dict(row)
+                
+                # Get required skills
+                required_skills = [skill for (skill,) in await self._fetch_tuples(
+                    conn,
+                    _SELECT_REQUIRED_SKILLS_SQL,
+                    (job_id,)
+                )]
+                job["required_skills"] = required_skills
+                
+                # Get preferred skills
+                preferred_skills = [skill for (skill,) in await self._fetch_tuples(
+                    conn,
+                    _SELECT_PREFERRED_SKILLS_SQL,
+                    (job_id,)
+                )]
+                job["preferred_skills"] = preferred_skills
+                
+            self._cache_put(("job", job_id), job, generation)
             return job
-            
+                
         except Exception as e:
             self.logger.error(f"Error getting job: {str(e)}")
             raise
-            
+    
     async def get_all_jobs(self, limit: int = 100, offset: int = 0, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Get all jobs with optional filtering
@@ -546,78 +1190,34 @@ class DatabaseManager:
             List of jobs
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            query = "SELECT * FROM jobs"
+            # Reuse one SQL string per combination of filters, so sqlite3's
+            # statement cache sees identical text for identical filter shapes
+            mask = 0
             params = []
-            
-            # Apply filters if provided
             if filters:
-                where_clauses = []
-                
-                if "title" in filters and filters["title"]:
-                    where_clauses.append("title LIKE ?")
-                    params.append(f"%{filters['title']}%")
-                    
-                if "company" in filters and filters["company"]:
-                    where_clauses.append("company LIKE ?")
-                    params.append(f"%{filters['company']}%")
-                    
-                if "location" in filters and filters["location"]:
-                    where_clauses.append("location LIKE ?")
-                    params.append(f"%{filters['location']}%")
-                    
-                if "job_type" in filters and filters["job_type"]:
-                    where_clauses.append("job_type = ?")
-                    params.append(filters["job_type"])
-                    
-                if "experience_level" in filters and filters["experience_level"]:
-                    where_clauses.append("experience_level = ?")
-                    params.append(filters["experience_level"])
-                    
-                if "remote_status" in filters and filters["remote_status"]:
-                    where_clauses.append("remote_status = ?")
-                    params.append(filters["remote_status"])
-                    
-                if "platform" in filters and filters["platform"]:
-                    where_clauses.append("platform = ?")
-                    params.append(filters["platform"])
-                
-                if where_clauses:
-                    query += " WHERE " + " AND ".join(where_clauses)
-            
-            # Add sorting and pagination
-            query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-            params.extend([limit, offset])
-            
-            cursor.execute(query, params)
-            jobs = cursor.fetchall()
-            
-            # Get skills for each job
-            for job in jobs:
-                # Get required skills
-                cursor.execute(
-                    "SELECT skill FROM job_skills WHERE job_id = ? AND is_required = 1",
-                    (job["id"],)
-                )
-                required_skills = [row["skill"] for row in cursor.fetchall()]
-                job["required_skills"] = required_skills
+                for bit, (key, _, substring) in enumerate(_JOB_FILTERS):
+                    value = filters.get(key)
+                    if value:
+                        mask |= 1 << bit
+                        params.append(f"%{value}%" if substring else value)
+            params.extend((limit, offset))
+            query = _jobs_query(mask)
+            
+            async with self._acquire() as conn:
+                cursor = await conn.execute(query, params)
+                jobs = [dict(row) for row in await cursor.fetchall()]
+            
+            # Split the skills fetched alongside each job
+            for job in jobs:
+                job["required_skills"] = _split_skills(job.pop("required_list"))
+                job["preferred_skills"] = _split_skills(job.pop("preferred_list"))
                 
-                # Get preferred skills
-                cursor.execute(
-                    "SELECT skill FROM job_skills WHERE job_id = ? AND is_required = 0",
-                    (job["id"],)
-                )
-                preferred_skills = [row["skill"] for row in cursor.fetchall()]
-                job["preferred_skills"] = preferred_skills
-            
             return jobs
-            
+                
         except Exception as e:
             self.logger.error(f"Error getting all jobs: {str(e)}")
             raise
-            
+    
     async def delete_job(self, job_id: int) -> bool:
         """
         Delete a job by ID
@@ -629,29 +1229,22 @@ class DatabaseManager:
             True if deleted, False if not found
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Check if job exists
-            cursor.execute(
-                "SELECT id FROM jobs WHERE id = ?",
-                (job_id,)
-            )
-            if not cursor.fetchone():
-                return False
-            
-            # Delete job skills
-            cursor.execute("DELETE FROM job_skills WHERE job_id = ?", (job_id,))
-            
-            # Delete job
-            cursor.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
-            
-            conn.commit()
+            async with self._transaction() as conn:
+                # Delete job skills
+                await conn.execute(_DELETE_JOB_SKILLS_SQL, (job_id,))
+                
+                # Delete job; no row deleted means it did not exist
+                cursor = await conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+                if not cursor.rowcount:
+                    return False
+                    
+                self._analytics_stale = True
+                self._pending_evictions.append(("job", job_id))
+                
             self.logger.info(f"Deleted job ID: {job_id}")
             return True
             
         except Exception as e:
-            conn.rollback()
             self.logger.error(f"Error deleting job: {str(e)}")
             raise
     
@@ -667,84 +1260,243 @@ class DatabaseManager:
             ID of the saved application
         """
         try:
-            # First, save the job to get a job_id
-            job_id = await self.save_job(job_data)
-            
-            # Get resume_id from application_result or use default
-            resume_id = application_result.get("resume_id", 1)  # Default to first resume if not specified
-            
-            # Extract application fields
-            status = application_result.get("application_status", "pending")
-            notes = application_result.get("notes", "")
-            platform = job_data.get("platform", "")
-            platform_application_id = application_result.get("platform_application_id", "")
-            
-            # If we have an optimized resume, save it
-            optimized_resume_id = None
-            if "optimized_resume" in application_result and application_result["optimized_resume"]:
-                optimized_resume = application_result["optimized_resume"]
-                optimized_content = optimized_resume.get("optimized_resume", "")
-                if optimized_content:
-                    # Save optimized resume
-                    optimized_resume_name = f"{job_data.get('title', 'Job')} - Optimized"
-                    parsed_data = {
-                        "source": "ai_optimized",
-                        "original_resume_id": resume_id,
-                        "job_id": job_id,
-                        "optimization_score": optimized_resume.get("optimization_score", 0),
-                        "changes_made": optimized_resume.get("changes_made", []),
-                        "keywords_added": optimized_resume.get("keywords_added", [])
-                    }
-                    optimized_resume_id = await self.save_resume(
-                        optimized_resume_name, 
-                        optimized_content, 
-                        parsed_data
-                    )
+            async with self._transaction() as conn:
+                return await self._insert_application(conn, job_data, application_result)
+                
+        except Exception as e:
+            self.logger.error(f"Error saving application result: {str(e)}")
+            raise
+    
+    async def save_applications(self, applications: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[int]:
+        """
+        Save several application results to the database in a single transaction
+        
+        Args:
+            applications: List of (job_data, application_result) pairs
             
-            # If we have a cover letter, save it
-            cover_letter_id = None
-            if "cover_letter" in application_result and application_result["cover_letter"]:
-                cover_letter_content = application_result["cover_letter"]
-                if cover_letter_content:
-                    # Save cover letter
-                    conn = self._get_connection()
-                    cursor = conn.cursor()
-                    cursor.execute(
-                        """
-                        INSERT INTO cover_letters (resume_id, job_id, content)
-                        VALUES (?, ?, ?)
-                        """,
-                        (resume_id, job_id, cover_letter_content)
-                    )
-                    cover_letter_id = cursor.lastrowid
-                    conn.commit()
-            
-            # Save application
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(
-                """
-                INSERT INTO applications (
-                    job_id, resume_id, optimized_resume_id, cover_letter_id,
-                    status, notes, platform, platform_application_id
+        Returns:
+            IDs of the saved applications, in input order
+        """
+        if not applications:
+            return []
+            
+        try:
+            async with self._transaction() as conn:
+                now = _timestamp()
+                application_ids = [
+                    await self._insert_application(conn, job_data, application_result, now)
+                    for job_data, application_result in applications
+                ]
+                
+            self.logger.info(f"Saved {len(application_ids)} application results")
+            return application_ids
+            
+        except Exception as e:
+            self.logger.error(f"Error saving application results: {str(e)}")
+            raise
+    
+    async def _insert_application(self, conn: aiosqlite.Connection, job_data: Dict[str, Any], application_result: Dict[str, Any], now: Optional[str] = None) -> int:
+        """
+        Save an application result inside the caller's transaction
+        
+        Args:
+            conn: Connection of the open transaction
+            job_data: Job data
+            application_result: Application result data
+            now: Timestamp shared by the transaction's rows (defaults to the current time)
+            
+        Returns:
+            ID of the saved application
+        """
+        now = now or _timestamp()
+        
+        # First, save the job to get a job_id
+        job_id = await self._upsert_job(conn, job_data, now)
+        
+        # Get resume_id from application_result or use default
+        resume_id = application_result.get("resume_id", 1)  # Default to first resume if not specified
+        
+        # Extract application fields
+        status = application_result.get("application_status", "pending")
+        notes = application_result.get("notes", "")
+        platform = job_data.get("platform", "")
+        platform_application_id = application_result.get("platform_application_id", "")
+        match_score = application_result.get("match_score")
+        
+        # If we have an optimized resume, save it
+        optimized_resume_id = None
+        if "optimized_resume" in application_result and application_result["optimized_resume"]:
+            optimized_resume = application_result["optimized_resume"]
+            optimized_content = optimized_resume.get("optimized_resume", "")
+            if optimized_content:
+                # Save optimized resume
+                optimized_resume_name = f"{job_data.get('title', 'Job')} - Optimized"
+                parsed_data = {
+                    "source": "ai_optimized",
+                    "original_resume_id": resume_id,
+                    "job_id": job_id,
+                    "optimization_score": optimized_resume.get("optimization_score", 0),
+                    "changes_made": optimized_resume.get("changes_made", []),
+                    "keywords_added": optimized_resume.get("keywords_added", [])
+                }
+                optimized_resume_id = await self._upsert_resume(
+                    conn,
+                    optimized_resume_name,
+                    optimized_content,
+                    parsed_data,
+                    now=now
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    job_id, resume_id, optimized_resume_id, cover_letter_id,
-                    status, notes, platform, platform_application_id
+                
+        # If we have a cover letter, save it
+        cover_letter_id = None
+        if "cover_letter" in application_result and application_result["cover_letter"]:
+            cover_letter_content = application_result["cover_letter"]
+            if cover_letter_content:
+                cursor = await conn.execute(
+                    _INSERT_COVER_LETTER_SQL,
+                    (resume_id, job_id, _pack(cover_letter_content))
                 )
+                cover_letter_id = (await cursor.fetchone())["id"]
+                
+        # Save application
+        cursor = await conn.execute(
+            _INSERT_APP_SQL,
+            (
+                job_id, resume_id, optimized_resume_id, cover_letter_id,
+                status, notes, platform, platform_application_id, match_score,
+                now, now
             )
+        )
+        
+        application_id = (await cursor.fetchone())["id"]
+        await self._insert_activity(conn, application_id, "created", {"status": status})
+        
+        self.logger.info(f"Saved application result: ID {application_id}, Status: {status}")
+        return application_id
+    
+    @staticmethod
+    async def _insert_activity(conn: aiosqlite.Connection, application_id: int, activity_type: str, details: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Insert an application activity inside the caller's transaction
+        
+        Args:
+            conn: Connection of the open transaction
+            application_id: Application ID
+            activity_type: Activity type (created, status_change, note_added, ...)
+            details: Optional activity details
+            
+        Returns:
+            ID of the inserted activity
+        """
+        cursor = await conn.execute(
+            _INSERT_ACT_SQL,
+            (application_id, activity_type, _dumps(details or {}))
+        )
+        return cursor.lastrowid
+    
+    async def add_application_activity(self, application_id: int, activity_type: str, details: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Record an activity for an application
+        
+        Args:
+            application_id: Application ID
+            activity_type: Activity type (created, status_change, note_added, ...)
+            details: Optional activity details
+            
+        Returns:
+            ID of the saved activity
+        """
+        try:
+            # Serialize before queueing, so bad details fail only this caller
+            details_json = _dumps(details or {})
+            self._ensure_activity_writer()
+            future = asyncio.get_running_loop().create_future()
+            self._activity_queue.put_nowait((application_id, activity_type, details_json, future))
+            return await future
+            
+        except Exception as e:
+            self.logger.error(f"Error adding application activity: {str(e)}")
+            raise
+    
+    def _ensure_activity_writer(self):
+        """Start the activity writer task for the running event loop if needed"""
+        loop = asyncio.get_running_loop()
+        if self._activity_writer is None or self._activity_writer.done() or self._activity_writer.get_loop() is not loop:
+            self._activity_queue = asyncio.Queue()
+            self._activity_writer = loop.create_task(self._write_activities(self._activity_queue))
+    
+    async def _write_activities(self, queue: asyncio.Queue):
+        """
+        Drain queued activities, writing each batch in a single transaction
+        
+        Args:
+            queue: Queue of (application_id, activity_type, details JSON, future) items
+        """
+        while True:
+            batch = [await queue.get()]
+            
+            # Give concurrent callers a moment to join this batch
+            await asyncio.sleep(_ACTIVITY_BATCH_WINDOW)
+            while len(batch) < _ACTIVITY_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            try:
+                outcomes = []
+                async with self._transaction() as conn:
+                    for application_id, activity_type, details_json, _ in batch:
+                        # A savepoint per item keeps one bad row from failing the whole batch
+                        await conn.execute("SAVEPOINT activity")
+                        try:
+                            cursor = await conn.execute(_INSERT_ACT_SQL, (application_id, activity_type, details_json))
+                            outcomes.append(cursor.lastrowid)
+                        except sqlite3.DatabaseError as e:
+                            await conn.execute("ROLLBACK TO activity")
+                            outcomes.append(e)
+                        await conn.execute("RELEASE activity")
+            except Exception as e:
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                # Resolve callers only once the batch is committed
+                for outcome, (*_, future) in zip(outcomes, batch):
+                    if future.done():
+                        continue
+                    if isinstance(outcome, Exception):
+                        future.set_exception(outcome)
+                    else:
+                        future.set_result(outcome)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    async def add_application_activities(self, activities: List[Dict[str, Any]]) -> int:
+        """
+        Record several application activities in a single transaction
+        
+        Args:
+            activities: List of dicts with application_id, activity_type and optional details
             
-            application_id = cursor.lastrowid
-            conn.commit()
+        Returns:
+            Number of activities saved
+        """
+        if not activities:
+            return 0
             
-            self.logger.info(f"Saved application result: ID {application_id}, Status: {status}")
-            return application_id
+        try:
+            async with self._transaction() as conn:
+                await conn.executemany(
+                    _INSERT_ACT_SQL,
+                    [
+                        (activity["application_id"], activity["activity_type"], _dumps(activity.get("details") or {}))
+                        for activity in activities
+                    ]
+                )
+                
+            return len(activities)
             
         except Exception as e:
-            self.logger.error(f"Error saving application result: {str(e)}")
+            self.logger.error(f"Error adding application activities: {str(e)}")
             raise
     
     async def get_application(self, application_id: int) -> Optional[Dict[str, Any]]:
@@ -758,122 +1510,195 @@ class DatabaseManager:
             Application data or None if not found
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(
-                """
-                SELECT a.*, j.title, j.company, j.location, j.description, j.url,
-                       r.name as resume_name, 
-                       or.name as optimized_resume_name, 
-                       cl.content as cover_letter
-                FROM applications a
-                LEFT JOIN jobs j ON a.job_id = j.id
-                LEFT JOIN resumes r ON a.resume_id = r.id
-                LEFT JOIN resumes or ON a.optimized_resume_id = or.id
-                LEFT JOIN cover_letters cl ON a.cover_letter_id = cl.id
-                WHERE a.id = ?
-                """,
-                (application_id,)
-            )
-            
-            application = cursor.fetchone()
-            
-            if not application:
-                return None
-            
-            # Get job skills
-            cursor.execute(
-                "SELECT skill, is_required FROM job_skills WHERE job_id = ?",
-                (application["job_id"],)
-            )
-            
-            required_skills = []
-            preferred_skills = []
-            
-            for row in cursor.fetchall():
-                if row["is_required"]:
-                    required_skills.append(row["skill"])
-                else:
-                    preferred_skills.append(row["skill"])
-            
-            application["required_skills"] = required_skills
-            application["preferred_skills"] = preferred_skills
-            
-            return application
-            
+            async with self._acquire() as conn:
+                cursor = await conn.execute(
+                    """
+                    SELECT a.*, j.title, j.company, j.location, j.description, j.url,
+                           r.name as resume_name,
+                           opt.name as optimized_resume_name,
+                           cl.content as cover_letter
+                    FROM applications a
+                    LEFT JOIN jobs j ON a.job_id = j.id
+                    LEFT JOIN resumes r ON a.resume_id = r.id
+                    LEFT JOIN resumes opt ON a.optimized_resume_id = opt.id
+                    LEFT JOIN cover_letters cl ON a.cover_letter_id = cl.id
+                    WHERE a.id = ?
+                    """,
+                    (application_id,)
+                )
+                
+                row = await cursor.fetchone()
+                
+                if not row:
+                    return None
+                
+                application = dict(row)
+                application["cover_letter"] = _unpack(application["cover_letter"])
+                    
+                # Get job skills
+                skill_rows = await self._fetch_tuples(
+                    conn,
+                    "SELECT skill, is_required FROM job_skills WHERE job_id = ?",
+                    (application["job_id"],)
+                )
+                
+                required_skills = []
+                preferred_skills = []
+                
+                for skill, is_required in skill_rows:
+                    if is_required:
+                        required_skills.append(skill)
+                    else:
+                        preferred_skills.append(skill)
+                        
+                application["required_skills"] = required_skills
+                application["preferred_skills"] = preferred_skills
+                
+                return application
+                
         except Exception as e:
             self.logger.error(f"Error getting application: {str(e)}")
             raise
     
-    async def get_all_applications(self, limit: int = 100, offset: int = 0, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    async def get_all_applications(self, limit: int = 100, offset: int = 0, filters: Optional[Dict[str, Any]] = None, cursor: Optional[Tuple[str, int]] = None) -> List[Dict[str, Any]]:
         """
-        Get all applications with optional filtering
+        Get all applications with optional filtering, newest first
         
         Args:
             limit: Maximum number of applications to return
             offset: Offset for pagination
             filters: Optional filters to apply
+            cursor: (created_at, id) of the last application on the previous page;
+                when given, the page starts right after it and offset is ignored
             
         Returns:
             List of applications
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            query = """
-                SELECT a.*, j.title, j.company, j.location, j.url,
-                       r.name as resume_name
-                FROM applications a
-                LEFT JOIN jobs j ON a.job_id = j.id
-                LEFT JOIN resumes r ON a.resume_id = r.id
-            """
+            return [application async for application in self.iter_applications(limit, offset, filters, cursor)]
             
-            params = []
+        except Exception as e:
+            self.logger.error(f"Error getting all applications: {str(e)}")
+            raise
+    
+    async def iter_applications(self, limit: int = 100, offset: int = 0, filters: Optional[Dict[str, Any]] = None, cursor: Optional[Tuple[str, int]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream applications with optional filtering, newest first
+        
+        Rows are fetched in batches, so memory stays bounded however large the
+        limit. A reader connection is held until the iterator is exhausted or
+        closed.
+        
+        Args:
+            See get_all_applications
             
-            # Apply filters if provided
-            if filters:
-                where_clauses = []
-                
-                if "status" in filters and filters["status"]:
-                    where_clauses.append("a.status = ?")
-                    params.append(filters["status"])
-                    
-                if "platform" in filters and filters["platform"]:
-                    where_clauses.append("a.platform = ?")
-                    params.append(filters["platform"])
-                    
-                if "job_title" in filters and filters["job_title"]:
-                    where_clauses.append("j.title LIKE ?")
-                    params.append(f"%{filters['job_title']}%")
-                    
-                if "company" in filters and filters["company"]:
-                    where_clauses.append("j.company LIKE ?")
-                    params.append(f"%{filters['company']}%")
+        Yields:
+            Application data, including the job's required and preferred skills
+        """
+        mask = 0
+        params = []
+        
+        if filters:
+            for bit, (key, _) in enumerate(_APPLICATION_FILTERS):
+                value = filters.get(key)
+                if value:
+                    mask |= 1 << bit
+                    params.append(value)
                     
-                if "date_from" in filters and filters["date_from"]:
-                    where_clauses.append("a.created_at >= ?")
-                    params.append(filters["date_from"])
+            # Substring matches use the trigram index, when available, instead of a LIKE scan
+            search_terms = []
+            for bit, (key, column) in enumerate(_APPLICATION_TEXT_FILTERS, len(_APPLICATION_FILTERS)):
+                value = filters.get(key)
+                if not value:
+                    continue
+                if self._job_search and len(value) >= _TRIGRAM_MIN_LENGTH:
+                    search_terms.append(_fts_phrase(column, value))
+                else:
+                    mask |= 1 << bit
+                    params.append(f"%{value}%")
                     
-                if "date_to" in filters and filters["date_to"]:
-                    where_clauses.append("a.created_at <= ?")
-                    params.append(filters["date_to"])
+            if search_terms:
+                mask |= _APPLICATION_SEARCH_BIT
+                params.append(" AND ".join(search_terms))
                 
-                if where_clauses:
-                    query += " WHERE " + " AND ".join(where_clauses)
+        # Seek past the previous page instead of counting rows with OFFSET
+        if cursor:
+            mask |= _APPLICATION_CURSOR_BIT
+            params.extend(cursor)
+            offset = 0
+            
+        params.extend((limit, offset))
+        query = _applications_query(mask)
+        
+        async with self._acquire() as conn:
+            result = await conn.execute(query, params)
+            while True:
+                rows = await result.fetchmany(_APPLICATION_BATCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    application = dict(row)
+                    application["required_skills"] = _split_skills(application.pop("required_list"))
+                    application["preferred_skills"] = _split_skills(application.pop("preferred_list"))
+                    yield application
+    
+    async def get_recent_applications(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Get the most recently updated applications
+        
+        Args:
+            limit: Maximum number of applications to return
             
-            # Add sorting and pagination
-            query += " ORDER BY a.created_at DESC LIMIT ? OFFSET ?"
-            params.extend([limit, offset])
+        Returns:
+            List of applications with their job title, company and location
+        """
+        try:
+            async with self._acquire() as conn:
+                # Walk idx_applications_updated_desc and stop after `limit` rows
+                application_rows = await self._fetch_tuples(
+                    conn,
+                    """
+                    SELECT id, job_id, status, match_score, created_at, updated_at,
+                           DATE(created_at) as applied_date
+                    FROM applications
+                    ORDER BY updated_at DESC, id DESC
+                    LIMIT ?
+                    """,
+                    (limit,)
+                )
+                
+                if not application_rows:
+                    return []
+                
+                # Look up the handful of jobs by primary key and join in Python
+                job_ids = list({row[1] for row in application_rows})
+                job_rows = await self._fetch_tuples(
+                    conn,
+                    f"SELECT id, title, company, location FROM jobs WHERE id IN ({', '.join('?' * len(job_ids))})",
+                    job_ids
+                )
             
-            cursor.execute(query, params)
-            applications = cursor.fetchall()
+            jobs = {job_id: (title, company, location) for job_id, title, company, location in job_rows}
+            applications = []
+            for id_, job_id, status, match_score, created_at, updated_at, applied_date in application_rows:
+                title, company, location = jobs.get(job_id, (None, None, None))
+                applications.append({
+                    "id": id_,
+                    "job_id": job_id,
+                    "status": status,
+                    "match_score": match_score,
+                    "created_at": created_at,
+                    "updated_at": updated_at,
+                    "applied_date": applied_date,
+                    "job_title": title,
+                    "company": company,
+                    "location": location
+                })
             
             return applications
             
         except Exception as e:
-            self.logger.error(f"Error getting all applications: {str(e)}")
+            self.logger.error(f"Error getting recent applications: {str(e)}")
             raise
     
     async def update_application_status(self, application_id: int, status: str, error_message: Optional[str] = None) -> bool:
@@ -889,43 +1714,69 @@ class DatabaseManager:
             True if updated, False if not found
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            async with self._transaction() as conn:
+                # The row count tells whether the application exists; no lookup first
+                cursor = await conn.execute(_UPDATE_STATUS_SQL, (status, error_message or None, _timestamp(), application_id))
+                if not cursor.rowcount:
+                    return False
+                    
+                await conn.execute(_INSERT_ACT_SQL, (application_id, "status_change", _dumps({"status": status})))
+                
+            self.logger.info(f"Updated application ID {application_id} status to: {status}")
+            return True
             
-            # Check if application exists
-            cursor.execute(
-                "SELECT id FROM applications WHERE id = ?",
-                (application_id,)
-            )
-            if not cursor.fetchone():
-                return False
+        except Exception as e:
+            self.logger.error(f"Error updating application status: {str(e)}")
+            raise
+    
+    async def update_application_statuses(self, updates: List[Tuple[int, str, Optional[str]]]) -> List[int]:
+        """
+        Update the status of several applications in a single transaction
+        
+        Each update also records a status_change activity. Unknown application
+        IDs are skipped.
+        
+        Args:
+            updates: List of (application_id, status, error_message) tuples; an
+                error message, when given, replaces the application's notes
             
-            # Update notes if error message provided
-            if error_message:
-                cursor.execute(
-                    """
-                    UPDATE applications 
-                    SET status = ?, notes = ?, updated_at = CURRENT_TIMESTAMP 
-                    WHERE id = ?
-                    """,
-                    (status, error_message, application_id)
+        Returns:
+            IDs of the updated applications, in input order
+        """
+        if not updates:
+            return []
+            
+        try:
+            async with self._transaction() as conn:
+                # Check which applications exist with one query for the whole batch
+                rows = await self._fetch_tuples(
+                    conn,
+                    "SELECT id FROM applications WHERE id IN (SELECT value FROM json_each(?))",
+                    (_dumps([application_id for application_id, _, _ in updates]),)
                 )
-            else:
-                cursor.execute(
-                    """
-                    UPDATE applications 
-                    SET status = ?, updated_at = CURRENT_TIMESTAMP 
-                    WHERE id = ?
-                    """,
-                    (status, application_id)
+                existing = {application_id for (application_id,) in rows}
+                updates = [update for update in updates if update[0] in existing]
+                if not updates:
+                    return []
+                    
+                now = _timestamp()
+                await conn.executemany(
+                    _UPDATE_STATUS_SQL,
+                    [(status, error_message or None, now, application_id) for application_id, status, error_message in updates]
                 )
-            
-            conn.commit()
-            self.logger.info(f"Updated application ID {application_id} status to: {status}")
-            return True
+                await conn.executemany(
+                    _INSERT_ACT_SQL,
+                    [
+                        (application_id, "status_change", _dumps({"status": status}))
+                        for application_id, status, _ in updates
+                    ]
+                )
+                
+            for application_id, status, _ in updates:
+                self.logger.info(f"Updated application ID {application_id} status to: {status}")
+            return [application_id for application_id, _, _ in updates]
             
         except Exception as e:
-            conn.rollback()
             self.logger.error(f"Error updating application status: {str(e)}")
             raise
     
@@ -941,61 +1792,33 @@ class DatabaseManager:
             True if updated, False if not found
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Check if application exists
-            cursor.execute(
-                "SELECT id FROM applications WHERE id = ?",
-                (application_id,)
+            # Extract fields to update, in _APPLICATION_UPDATE_COLUMNS order
+            values = (
+                application_data.get("application_status", application_data.get("status")) or None,
+                application_data.get("notes"),  # Allow empty notes
+                application_data.get("platform_application_id") or None
             )
-            if not cursor.fetchone():
-                return False
             
-            # Extract fields to update
-            status = application_data.get("application_status", application_data.get("status"))
-            notes = application_data.get("notes")
-            platform_application_id = application_data.get("platform_application_id")
-            
-            # Build update query dynamically
-            update_parts = []
+            # One cached SQL string per combination of updated columns
+            mask = 0
             params = []
-            
-            if status:
-                update_parts.append("status = ?")
-                params.append(status)
-                
-            if notes is not None:  # Allow empty notes
-                update_parts.append("notes = ?")
-                params.append(notes)
-                
-            if platform_application_id:
-                update_parts.append("platform_application_id = ?")
-                params.append(platform_application_id)
-            
-            # Add updated_at timestamp
-            update_parts.append("updated_at = CURRENT_TIMESTAMP")
-            
-            # Only proceed if we have something to update
-            if update_parts:
-                query = f"""
-                    UPDATE applications 
-                    SET {", ".join(update_parts)}
-                    WHERE id = ?
-                """
-                params.append(application_id)
-                
-                cursor.execute(query, params)
-                conn.commit()
-                
-                self.logger.info(f"Updated application ID {application_id}")
-                return True
-            else:
-                self.logger.warning(f"No fields to update for application ID {application_id}")
-                return False
+            for bit, value in enumerate(values):
+                if value is not None:
+                    mask |= 1 << bit
+                    params.append(value)
+            params.extend((_timestamp(), application_id))
+            query = _application_update_query(mask)
+            
+            async with self._transaction() as conn:
+                # updated_at is always set, so the row count tells whether the application exists
+                cursor = await conn.execute(query, params)
+                if not cursor.rowcount:
+                    return False
+                    
+            self.logger.info(f"Updated application ID {application_id}")
+            return True
             
         except Exception as e:
-            conn.rollback()
             self.logger.error(f"Error updating application: {str(e)}")
             raise
     
@@ -1010,99 +1833,223 @@ class DatabaseManager:
             True if deleted, False if not found
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Check if application exists
-            cursor.execute(
-                "SELECT id FROM applications WHERE id = ?",
-                (application_id,)
-            )
-            if not cursor.fetchone():
-                return False
-            
-            # Delete application
-            cursor.execute("DELETE FROM applications WHERE id = ?", (application_id,))
-            
-            conn.commit()
+            async with self._transaction() as conn:
+                # Delete application activities
+                await conn.execute("DELETE FROM application_activities WHERE application_id = ?", (application_id,))
+                
+                # Delete application; no row deleted means it did not exist
+                cursor = await conn.execute("DELETE FROM applications WHERE id = ?", (application_id,))
+                if not cursor.rowcount:
+                    return False
+                    
             self.logger.info(f"Deleted application ID: {application_id}")
             return True
             
         except Exception as e:
-            conn.rollback()
             self.logger.error(f"Error deleting application: {str(e)}")
             raise
     
+    async def refresh_analytics(self):
+        """Rebuild the precomputed skill demand and job title trend tables"""
+        try:
+            self._analytics_stale = False
+            async with self._transaction() as conn:
+                await conn.execute("DELETE FROM skill_demand")
+                await conn.execute(
+                    """
+                    INSERT INTO skill_demand (skill, job_count, in_resume)
+                    SELECT js.skill, COUNT(DISTINCT js.job_id),
+                           EXISTS (SELECT 1 FROM resume_skills rs WHERE rs.skill = js.skill COLLATE NOCASE)
+                    FROM job_skills js
+                    GROUP BY js.skill COLLATE NOCASE
+                    """
+                )
+                
+                await conn.execute("DELETE FROM title_trends")
+                await conn.execute(
+                    """
+                    INSERT INTO title_trends (title, openings, recent_openings, previous_openings)
+                    SELECT title, COUNT(*),
+                           SUM(created_at >= DATETIME('now', '-30 days')),
+                           SUM(created_at >= DATETIME('now', '-60 days') AND created_at < DATETIME('now', '-30 days'))
+                    FROM jobs
+                    GROUP BY title COLLATE NOCASE
+                    """
+                )
+                
+            self.logger.info("Refreshed analytics tables")
+            
+        except Exception as e:
+            self._analytics_stale = True
+            self.logger.error(f"Error refreshing analytics: {str(e)}")
+            raise
+    
+    async def get_skills_analysis(self, limit: int = 5) -> Dict[str, Any]:
+        """
+        Get the most requested job skills and the ones missing from all resumes
+        
+        Args:
+            limit: Maximum number of skills in each list
+            
+        Returns:
+            Dictionary with most_requested, missing_skills and skill_match_percentage
+        """
+        try:
+            if self._analytics_stale:
+                await self.refresh_analytics()
+            
+            async with self._acquire() as conn:
+                most_requested = await self._fetch_tuples(
+                    conn,
+                    "SELECT skill, job_count FROM skill_demand ORDER BY job_count DESC LIMIT ?",
+                    (limit,)
+                )
+                missing_skills = await self._fetch_tuples(
+                    conn,
+                    "SELECT skill, job_count FROM skill_demand WHERE in_resume = 0 ORDER BY job_count DESC LIMIT ?",
+                    (limit,)
+                )
+                totals = await self._fetch_tuples(
+                    conn,
+                    "SELECT COALESCE(SUM(job_count), 0), COALESCE(SUM(job_count * in_resume), 0) FROM skill_demand"
+                )
+            
+            total_demand, matched_demand = totals[0]
+            return {
+                "most_requested": [{"skill": skill, "count": count} for skill, count in most_requested],
+                "missing_skills": [{"skill": skill, "count": count} for skill, count in missing_skills],
+                "skill_match_percentage": round(100 * matched_demand / total_demand) if total_demand else 0
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error getting skills analysis: {str(e)}")
+            raise
+    
+    async def get_job_trends(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get the job titles with the most openings and their 30-day growth
+        
+        Args:
+            limit: Maximum number of job titles to return
+            
+        Returns:
+            List of job title trends
+        """
+        try:
+            if self._analytics_stale:
+                await self.refresh_analytics()
+            
+            async with self._acquire() as conn:
+                rows = await self._fetch_tuples(
+                    conn,
+                    """
+                    SELECT title, openings, recent_openings, previous_openings
+                    FROM title_trends
+                    ORDER BY openings DESC
+                    LIMIT ?
+                    """,
+                    (limit,)
+                )
+            
+            return [
+                {
+                    "title": title,
+                    "openings": openings,
+                    "recent_openings": recent,
+                    "growth_rate": round(100 * (recent - previous) / previous) if previous else None
+                }
+                for title, openings, recent, previous in rows
+            ]
+            
+        except Exception as e:
+            self.logger.error(f"Error getting job trends: {str(e)}")
+            raise
+    
     async def get_application_stats(self) -> Dict[str, Any]:
         """
         Get application statistics
         
+        Results are cached for _STATS_CACHE_TTL seconds or until the next write.
+        
         Returns:
             Dictionary with application statistics
         """
-        try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+        if self._stats_cache is not None:
+            expires_at, cached = self._stats_cache
+            if expires_at >= time.monotonic():
+                return copy.deepcopy(cached)
+            self._stats_cache = None
             
+        try:
+            generation = self._stats_generation
             stats = {
                 "total_applications": 0,
                 "by_status": {},
                 "by_platform": {},
                 "by_date": {},
-                "recent_applications": []
+                "match_scores": {},
+                "recent_applications": [],
+                "recent_activity": []
             }
             
-            # Get total applications
-            cursor.execute("SELECT COUNT(*) as count FROM applications")
-            stats["total_applications"] = cursor.fetchone()["count"]
-            
-            # Get applications by status
-            cursor.execute(
-                """
-                SELECT status, COUNT(*) as count 
-                FROM applications 
-                GROUP BY status
-                """
-            )
-            for row in cursor.fetchall():
-                stats["by_status"][row["status"]] = row["count"]
-            
-            # Get applications by platform
-            cursor.execute(
-                """
-                SELECT platform, COUNT(*) as count 
-                FROM applications 
-                GROUP BY platform
-                """
-            )
-            for row in cursor.fetchall():
-                stats["by_platform"][row["platform"] or "unknown"] = row["count"]
-            
-            # Get applications by date (last 30 days)
-            cursor.execute(
-                """
-                SELECT DATE(created_at) as date, COUNT(*) as count 
-                FROM applications 
-                WHERE created_at >= DATE('now', '-30 days')
-                GROUP BY DATE(created_at)
-                ORDER BY date
-                """
-            )
-            for row in cursor.fetchall():
-                stats["by_date"][row["date"]] = row["count"]
-            
-            # Get recent applications
-            cursor.execute(
-                """
-                SELECT a.id, a.status, a.created_at, j.title, j.company
-                FROM applications a
-                LEFT JOIN jobs j ON a.job_id = j.id
-                ORDER BY a.created_at DESC
-                LIMIT 10
-                """
-            )
-            stats["recent_applications"] = cursor.fetchall()
-            
+            async with self._acquire() as conn:
+                # Read everything from one snapshot
+                await conn.execute("BEGIN")
+                try:
+                    # Get (status, platform) and daily (last 30 days) counts in one round-trip;
+                    # grouping on both columns at once needs a single pass over applications
+                    count_rows = await self._fetch_tuples(
+                        conn,
+                        """
+                        SELECT 'group' AS kind, status AS key, platform, COUNT(*) AS count
+                        FROM applications
+                        GROUP BY status, platform
+                        UNION ALL
+                        SELECT 'date', DATE(created_at), NULL, COUNT(*)
+                        FROM applications
+                        WHERE created_at >= DATE('now', '-30 days')
+                        GROUP BY DATE(created_at)
+                        ORDER BY kind, key
+                        """
+                    )
+                    by_status = stats["by_status"]
+                    by_platform = stats["by_platform"]
+                    for kind, key, platform, count in count_rows:
+                        if kind == "group":
+                            by_status[key] = by_status.get(key, 0) + count
+                            platform = platform or "unknown"
+                            by_platform[platform] = by_platform.get(platform, 0) + count
+                            stats["total_applications"] += count
+                        else:
+                            stats["by_date"][key] = count
+                            
+                    # Summarize match scores
+                    score_rows = await self._fetch_tuples(conn, "SELECT match_score FROM applications WHERE match_score IS NOT NULL")
+                    stats["match_scores"] = summarize_scores(score for (score,) in score_rows)
+                    
+                    # Get recent applications
+                    cursor = await conn.execute(
+                        """
+                        SELECT a.id, a.status, a.created_at, j.title, j.company
+                        FROM applications a
+                        LEFT JOIN jobs j ON a.job_id = j.id
+                        ORDER BY a.created_at DESC
+                        LIMIT 10
+                        """
+                    )
+                    stats["recent_applications"] = [dict(row) for row in await cursor.fetchall()]
+                    
+                    # Get recent activity from the denormalized feed
+                    cursor = await conn.execute(
+                        "SELECT * FROM recent_activity_feed ORDER BY activity_id DESC LIMIT 5"
+                    )
+                    stats["recent_activity"] = [dict(row) for row in await cursor.fetchall()]
+                finally:
+                    await conn.rollback()
+                    
+            # Skip caching if a write committed while the snapshot was being read
+            if generation == self._stats_generation:
+                self._stats_cache = (time.monotonic() + _STATS_CACHE_TTL, copy.deepcopy(stats))
             return stats
             
         except Exception as e:
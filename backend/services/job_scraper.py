@@ -16,6 +16,12 @@ from ..models.job import JobResponse, JobCreate
 
 logger = setup_logger(__name__)
 
+# Job board domain in a posting URL; the group is the platform name
+_PLATFORM_RE = re.compile(r"(linkedin|indeed|naukri)\.com")
+
+# Concurrent requests allowed against any one job board, to stay under rate limits
+_MAX_REQUESTS_PER_PLATFORM = 4
+
 class JobScraper:
     """Job scraping service"""
     
@@ -23,6 +29,14 @@ class JobScraper:
         """Initialize job scraper"""
         self.logger = logger
         self.supported_platforms = ["linkedin", "indeed", "naukri"]
+        self._platform_limits: Dict[str, asyncio.Semaphore] = {}
+    
+    def _platform_limit(self, platform: str) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent requests to a platform"""
+        limit = self._platform_limits.get(platform)
+        if limit is None:
+            limit = self._platform_limits[platform] = asyncio.Semaphore(_MAX_REQUESTS_PER_PLATFORM)
+        return limit
     
     async def search_jobs(
         self, 
@@ -46,33 +60,73 @@ class JobScraper:
             List[Dict]: List of job postings
         """
         try:
-            # In a real implementation, this would scrape job boards
-            # For now, return mock data
-            mock_jobs = []
+            # Search every platform concurrently; wall time is the slowest board, not the sum
+            platform_results = await asyncio.gather(*[
+                self._search_platform(index, keywords, location, experience_level, job_type, limit)
+                for index in range(len(self.supported_platforms))
+            ])
+            
+            # Merge, restore relevance order and trim to the requested size
+            jobs = [job for results in platform_results for job in results]
+            jobs.sort(key=lambda job: job["id"])
+            del jobs[limit:]
+            
+            self.logger.info(f"Found {len(jobs)} jobs matching criteria")
+            return jobs
+            
+        except Exception as e:
+            self.logger.error(f"Error searching jobs: {str(e)}")
+            raise
+    
+    async def _search_platform(
+        self,
+        index: int,
+        keywords: Optional[str],
+        location: Optional[str],
+        experience_level: Optional[str],
+        job_type: Optional[str],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Search a single platform for jobs
+        
+        Args:
+            index: Position of the platform in supported_platforms
+            See search_jobs for the remaining arguments
+            
+        Returns:
+            List[Dict]: Job postings found on the platform
+        """
+        platforms = self.supported_platforms
+        platform_count = len(platforms)
+        platform = platforms[index]
+        
+        async with self._platform_limit(platform):
+            # In a real implementation, this would scrape the job board
+            # For now, return this platform's share of the mock results
+            now = datetime.now()
+            location = location or "San Francisco, CA"
+            job_type = job_type or "Full-time"
+            experience_level = experience_level or "Mid-level"
             
-            for i in range(1, limit + 1):
-                mock_jobs.append({
+            return [
+                {
                     "id": i,
                     "title": f"Software Engineer {i}",
                     "company": f"Tech Company {i}",
-                    "location": location or "San Francisco, CA",
+                    "location": location,
                     "description": f"Looking for a software engineer with experience in Python and cloud technologies. #{i}",
                     "url": f"https://example.com/jobs/{i}",
                     "salary_range": "$90,000 - $120,000",
-                    "job_type": job_type or "Full-time",
-                    "experience_level": experience_level or "Mid-level",
+                    "job_type": job_type,
+                    "experience_level": experience_level,
                     "remote_status": "Hybrid",
-                    "platform": self.supported_platforms[i % len(self.supported_platforms)],
-                    "created_at": datetime.now(),
-                    "updated_at": datetime.now()
-                })
-            
-            self.logger.info(f"Found {len(mock_jobs)} jobs matching criteria")
-            return mock_jobs
-            
-        except Exception as e:
-            self.logger.error(f"Error searching jobs: {str(e)}")
-            raise
+                    "platform": platform,
+                    "created_at": now,
+                    "updated_at": now
+                }
+                for i in range(index or platform_count, limit + 1, platform_count)
+            ]
     
     async def get_job(self, job_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -138,6 +192,25 @@ class JobScraper:
             self.logger.error(f"Error scraping job URL: {str(e)}")
             raise
     
+    async def scrape_job_urls(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Scrape several job postings concurrently
+        
+        Requests to the same platform are bounded so a large batch does not
+        trip the job board's rate limits.
+        
+        Args:
+            urls: Job posting URLs
+            
+        Returns:
+            List[Dict]: Job data, in the same order as urls
+        """
+        async def scrape(url: str) -> Dict[str, Any]:
+            async with self._platform_limit(self._detect_platform(url)):
+                return await self.scrape_job_url(url)
+                
+        return await asyncio.gather(*[scrape(url) for url in urls])
+    
     def _detect_platform(self, url: str) -> str:
         """
         Detect the platform from a job URL
@@ -148,11 +221,5 @@ class JobScraper:
         Returns:
             str: Platform name
         """
-        if "linkedin.com" in url:
-            return "linkedin"
-        elif "indeed.com" in url:
-            return "indeed"
-        elif "naukri.com" in url:
-            return "naukri"
-        else:
-            return "unknown"
+        match = _PLATFORM_RE.search(url)
+        return match.group(1) if match else "unknown"
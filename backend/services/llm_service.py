@@ -4,17 +4,102 @@ LLM Service for AI Job Hunt system
 
 import os
 import json
+import time
+import hashlib
 import logging
 import aiohttp
 import asyncio
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Union
 
+import orjson
+
 from config.settings import settings
 from utils.logger import setup_logger
 from utils.automation_helpers import retry_operation
 
 logger = setup_logger(__name__)
 
+# Completions sampled at or below this temperature are deterministic enough to cache
+_CACHEABLE_TEMPERATURE = 0.1
+
+# Seconds an idle pooled connection to an LLM API is kept open
+_KEEPALIVE_TIMEOUT = 60
+
+# Request payloads are serialized with orjson and sent as raw bytes
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Delay before the first retry of a failed completion; doubled on each further attempt
+_RETRY_DELAY = 0.5
+
+# Errors raised by aiohttp for dropped connections and requests that hit the timeout
+_TRANSIENT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+
+class LLMAPIError(Exception):
+    """Error response from an LLM provider API"""
+    
+    def __init__(self, message: str, status: int):
+        super().__init__(message)
+        self.status = status
+    
+    @property
+    def transient(self) -> bool:
+        """Whether the request may succeed if sent again"""
+        return self.status >= 500 or self.status == 429
+
+class LLMUnavailableError(Exception):
+    """Raised without contacting the provider while its circuit breaker is open"""
+
+class _CircuitBreaker:
+    """
+    Fail fast after repeated provider failures
+    
+    After `failure_threshold` consecutive failures the breaker opens and every
+    call is rejected for `recovery_timeout` seconds. After that a single call is
+    let through as a probe while the others keep failing fast; a failed probe
+    opens the breaker again, a successful one closes it.
+    """
+    
+    def __init__(self, failure_threshold: int, recovery_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+    
+    def check(self, provider: str) -> bool:
+        """
+        Raise LLMUnavailableError if the breaker is open
+        
+        Returns:
+            True if the call is the probe, which must call end_probe() when done
+        """
+        if self.opened_at is None:
+            return False
+        remaining = self.opened_at + self.recovery_timeout - time.monotonic()
+        if remaining > 0 or self._probing:
+            raise LLMUnavailableError(
+                f"{provider} API unavailable after {self.failures} consecutive failures, "
+                f"retrying in {max(remaining, 0):.0f}s"
+            )
+        self._probing = True
+        return True
+    
+    def end_probe(self):
+        """Let the next call after the cooldown probe again"""
+        self._probing = False
+    
+    def record_success(self):
+        """Close the breaker"""
+        self.failures = 0
+        self.opened_at = None
+    
+    def record_failure(self):
+        """Count a failure, opening the breaker once the threshold is reached"""
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
 class LLMService:
     """
     Service for interacting with Large Language Models (LLMs)
@@ -24,6 +109,25 @@ class LLMService:
     def __init__(self):
         """Initialize the LLM service"""
         self.provider = settings.preferred_llm_provider()
+        
+        # HTTP session reused by every request so connections stay alive between calls
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # LRU of low-temperature completions keyed by a hash of the full request
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_size = settings.llm.cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Caps in-flight requests; held only while a request is on the wire, not during backoff
+        self._request_limit = asyncio.Semaphore(max(settings.llm.max_concurrency, 1))
+        
+        # Shared by every request so a failing provider is skipped instead of waited on
+        self._breaker = _CircuitBreaker(
+            failure_threshold=settings.llm.breaker_threshold,
+            recovery_timeout=settings.llm.breaker_cooldown
+        )
+        
         logger.info(f"LLM Service initialized with provider: {self.provider}")
     
     async def generate_completion(
@@ -34,11 +138,15 @@ class LLMService:
         max_tokens: int = 2048,
         top_p: float = 0.9,
         stop_sequences: Optional[List[str]] = None,
-        system_message: Optional[str] = None
+        system_message: Optional[str] = None,
+        force_refresh: bool = False
     ) -> str:
         """
         Generate a completion using the configured LLM provider
         
+        Requests with temperature <= 0.1 are answered from an in-process cache
+        when the exact same request was completed before.
+        
         Args:
             prompt: The prompt to send to the LLM
             model: Model name to use (defaults to configured model)
@@ -47,6 +155,157 @@ class LLMService:
             top_p: Nucleus sampling parameter
             stop_sequences: List of sequences that stop generation
             system_message: System message for chat models
+            force_refresh: Skip the cache lookup and overwrite any cached completion
+            
+        Returns:
+            Generated text from the LLM
+        """
+        cache_key = None
+        if self._cache_size > 0 and temperature <= _CACHEABLE_TEMPERATURE:
+            cache_key = self._cache_key(
+                provider=self.provider,
+                prompt=prompt,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                stop_sequences=stop_sequences,
+                system_message=system_message
+            )
+            cached = None if force_refresh else self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                self.cache_hits += 1
+                return cached
+            self.cache_misses += 1
+            
+        completion = await self._provider_completion(
+            prompt=prompt,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            stop_sequences=stop_sequences,
+            system_message=system_message
+        )
+        
+        if cache_key is not None:
+            self._cache[cache_key] = completion
+            self._cache.move_to_end(cache_key)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+                
+        return completion
+    
+    async def generate_completions(self, prompts: List[str], **kwargs: Any) -> List[str]:
+        """
+        Generate completions for several independent prompts concurrently
+        
+        At most settings.llm.max_concurrency requests are in flight at once.
+        
+        Args:
+            prompts: Prompts to send to the LLM
+            **kwargs: Options passed to generate_completion for every prompt
+            
+        Returns:
+            Generated text for each prompt, in the same order as prompts
+        """
+        return await asyncio.gather(*[self.generate_completion(prompt, **kwargs) for prompt in prompts])
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=settings.llm.max_concurrency,
+                    keepalive_timeout=_KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=300
+                )
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the HTTP session and its pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    @staticmethod
+    def _cache_key(**request: Any) -> str:
+        """Hash a completion request into a cache key"""
+        return hashlib.sha256(orjson.dumps(request, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    
+    async def _provider_completion(
+        self,
+        prompt: str,
+        model: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        top_p: float,
+        stop_sequences: Optional[List[str]],
+        system_message: Optional[str]
+    ) -> str:
+        """
+        Dispatch a completion to the configured provider
+        
+        Connection errors, timeouts, 5xx and 429 responses are retried with
+        exponential backoff and counted by the circuit breaker. Other errors,
+        including 4xx responses, are raised immediately.
+        
+        Args:
+            See generate_completion method
+            
+        Returns:
+            Generated text from the LLM
+            
+        Raises:
+            LLMUnavailableError: If the circuit breaker is open
+        """
+        attempts = max(settings.llm.retry_attempts, 1)
+        for attempt in range(1, attempts + 1):
+            probe = self._breaker.check(self.provider)
+            try:
+                async with self._request_limit:
+                    completion = await self._send_completion(
+                        prompt=prompt,
+                        model=model,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        top_p=top_p,
+                        stop_sequences=stop_sequences,
+                        system_message=system_message
+                    )
+            except Exception as e:
+                if not isinstance(e, _TRANSIENT_ERRORS) and not (isinstance(e, LLMAPIError) and e.transient):
+                    raise
+                self._breaker.record_failure()
+                if attempt == attempts:
+                    raise
+                delay = _RETRY_DELAY * (2 ** (attempt - 1))
+                logger.warning(f"LLM request failed: {str(e) or type(e).__name__}. Retrying in {delay}s ({attempt}/{attempts})...")
+                await asyncio.sleep(delay)
+            else:
+                self._breaker.record_success()
+                return completion
+            finally:
+                if probe:
+                    self._breaker.end_probe()
+    
+    async def _send_completion(
+        self,
+        prompt: str,
+        model: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        top_p: float,
+        stop_sequences: Optional[List[str]],
+        system_message: Optional[str]
+    ) -> str:
+        """
+        Send one completion request to the configured provider
+        
+        Args:
+            See generate_completion method
             
         Returns:
             Generated text from the LLM
@@ -112,20 +371,24 @@ class LLMService:
             payload["system"] = system_message
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    api_url, 
-                    json=payload,
-                    timeout=settings.ollama.timeout
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Ollama API error: {response.status}, {error_text}")
-                        raise Exception(f"Ollama API error: {response.status}, {error_text}")
-                    
-                    data = await response.json()
-                    return data.get("response", "")
-                    
+            session = await self._get_session()
+            async with session.post(
+                api_url, 
+                data=orjson.dumps(payload),
+                headers=_JSON_HEADERS,
+                timeout=settings.ollama.timeout
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Ollama API error: {response.status}, {error_text}")
+                    raise LLMAPIError(f"Ollama API error: {response.status}, {error_text}", response.status)
+                
+                data = orjson.loads(await response.read())
+                return data.get("response", "")
+                
+        except LLMAPIError:
+            # Already logged with the response body
+            raise
         except aiohttp.ClientError as e:
             logger.error(f"Ollama API connection error: {str(e)}")
             raise
@@ -184,21 +447,24 @@ class LLMService:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    api_url, 
-                    json=payload,
-                    headers=headers,
-                    timeout=settings.openai.timeout
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"OpenAI API error: {response.status}, {error_text}")
-                        raise Exception(f"OpenAI API error: {response.status}, {error_text}")
-                    
-                    data = await response.json()
-                    return data.get("choices", [{}])[0].get("message", {}).get("content", "")
-                    
+            session = await self._get_session()
+            async with session.post(
+                api_url, 
+                data=orjson.dumps(payload),
+                headers=headers,
+                timeout=settings.openai.timeout
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"OpenAI API error: {response.status}, {error_text}")
+                    raise LLMAPIError(f"OpenAI API error: {response.status}, {error_text}", response.status)
+                
+                data = orjson.loads(await response.read())
+                return data.get("choices", [{}])[0].get("message", {}).get("content", "")
+                
+        except LLMAPIError:
+            # Already logged with the response body
+            raise
         except aiohttp.ClientError as e:
             logger.error(f"OpenAI API connection error: {str(e)}")
             raise
@@ -3,25 +3,327 @@ Resume parser service
 Extracts structured information from resumes
 """
 
-import os
 import re
-from typing import Dict, Any, List, Optional
+import copy
+import asyncio
+import hashlib
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from fastapi import UploadFile
 import json
+import time
+import sqlite3
 from datetime import datetime
 
-from backend.utils.file_utils import save_upload_file_temp, extract_text_from_file
+from backend.utils.file_utils import extract_text_from_bytes
 from backend.utils.logger import setup_logger
 from backend.config.settings import settings
 
 logger = setup_logger(__name__)
 
+# Parsed resumes kept in memory, keyed by file type and content hash
+_PARSE_CACHE_SIZE = 256
+
+# Part of every parse cache key. Bump it whenever extraction output changes,
+# so results cached on disk by an older parser are no longer served.
+_PARSER_VERSION = 2
+
+# Batch parses queued per worker process, bounding how many files are held in memory
+_BATCH_PENDING_PER_WORKER = 4
+
+# Parsed resumes also kept on disk, so they outlive restarts of the server
+_DISK_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parsed_resumes (
+    cache_key TEXT PRIMARY KEY,
+    parsed_data TEXT NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+# Placeholder served by get_all_resumes/get_resume until they read the database.
+# Built once, with fixed timestamps so responses are stable between requests.
+_MOCK_RESUME_TIMESTAMP = datetime.now()
+_MOCK_RESUME = {
+    "id": 1,
+    "name": "John Doe",
+    "contact": {
+        "email": "john.doe@example.com",
+        "phone": "555-123-4567",
+        "location": "San Francisco, CA",
+        "linkedin": "https://linkedin.com/in/johndoe"
+    },
+    "skills": [],
+    "experience": [],
+    "education": [],
+    "created_at": _MOCK_RESUME_TIMESTAMP,
+    "updated_at": _MOCK_RESUME_TIMESTAMP
+}
+
+# Patterns are compiled once at import; each extractor only runs searches.
+# The whole-text scans (section headings, tech keywords) run on a lowercased
+# copy of the resume with lowercase patterns instead of re.IGNORECASE.
+
+# Name heuristics: a short line of letters near the top, else a leading "First Last"
+_NAME_LINE_RE = re.compile(r'^[A-Za-z\s\.\-]+$')
+_NAME_RE = re.compile(r'^([A-Z][a-z]+\s[A-Z][a-z]+)')
+
+# Lines at the top of a resume searched for the name
+_NAME_SEARCH_LINES = 5
+
+# Contact details, one named group per field so a single scan finds them all.
+# Emails are tried first so digits inside an address are not taken for a phone.
+_CONTACT_RE = re.compile(
+    r'(?P<email>[\w\.-]+@[\w\.-]+\.\w+)'
+    r'|(?P<linkedin>(?i:linkedin\.com/in/[\w\-]+))'
+    r'|(?P<phone>(?:\+\d{1,3}[-\.\s]?)?\(?\d{3}\)?[-\.\s]?\d{3}[-\.\s]?\d{4})'
+    r'|(?P<state_location>[A-Z][a-z]+,\s[A-Z]{2})'  # City, State
+    r'|(?P<country_location>[A-Z][a-z]+,\s[A-Z][a-z]+)'  # City, Country
+)
+
+# Section headings mapped to the section they open. A heading must start a line
+# and be followed by a colon or the end of the line, so words like "experience"
+# in running text do not open a section. Up to two qualifier words may precede
+# it ("PROFESSIONAL EXPERIENCE", "Technical Skills:").
+_SECTION_NAMES = {
+    "summary": "summary",
+    "professional summary": "summary",
+    "objective": "summary",
+    "profile": "profile",
+    "about me": "profile",
+    "skills": "skills",
+    "experience": "experience",
+    "work experience": "experience",
+    "employment": "experience",
+    "education": "education",
+    "projects": "projects",
+    "certifications": "certifications",
+    "certificates": "certifications"
+}
+_SECTION_HEADING_RE = re.compile(
+    r'^[ \t]*(?:[a-z]+[ \t]+){0,2}('
+    + '|'.join(
+        r'\s+'.join(map(re.escape, heading.split()))
+        for heading in sorted(_SECTION_NAMES, key=len, reverse=True)
+    )
+    + r')[ \t]*(?::|$)',
+    re.MULTILINE
+)
+
+# Entry separator within the skills section
+_SKILL_SEPARATOR_RE = re.compile(r'[,•]')
+
+# Fields within an entry
+_DEGREE_RE = re.compile(r'(Bachelor|Master|PhD|B\.S\.|M\.S\.|M\.A\.|B\.A\.|Doctorate).*?([^\|]+)', re.IGNORECASE)
+_INSTITUTION_RE = re.compile(r'\|\s*(.*?)\s*\|')
+_GRADUATION_DATE_RE = re.compile(r'(?:Graduated|Graduation):\s*(\w+\s+\d{4})', re.IGNORECASE)
+_GRADUATION_YEAR_RE = re.compile(r'\|\s*(\d{4})')
+_PROJECT_NAME_RE = re.compile(r'^(.*?)(?:\||\n|$)')
+_TECHNOLOGIES_RE = re.compile(r'Technologies:?\s*(.*?)(?:\n|$)', re.IGNORECASE)
+_CERTIFICATION_RE = re.compile(r'(.*?)(?:\s*\|\s*(.*?))?(?:\s*\|\s*(.*?))?$')
+
+# Line tags assigned by _classify_line
+_LINE_BLANK = "blank"
+_LINE_BULLET = "bullet"
+_LINE_POSITION = "position"
+_LINE_DATES = "dates"
+_LINE_CONTACT = "contact"
+_LINE_TEXT = "text"
+
+# A date range such as "Jan 2020 - Present" or "2018-2020"
+_DATE_RANGE_RE = re.compile(
+    r'^\(?(?P<start>(?:[A-Za-z]{3,9}\.?\s+)?\d{4})\s*(?:-|–|—|to)\s*'
+    r'(?P<end>(?:[A-Za-z]{3,9}\.?\s+)?\d{4}|Present|Current|Now)\)?$',
+    re.IGNORECASE
+)
+
+# (tag, pattern) tried in order against each stripped line; the first match wins
+_LINE_CLASSIFIERS = (
+    (_LINE_BULLET, re.compile(r'^[•▪*\-]\s*(?P<text>.*)$')),
+    # Title | Company | Dates
+    (_LINE_POSITION, re.compile(r'^(?P<title>[^|]+?)\s*\|\s*(?P<company>[^|]+?)\s*\|\s*(?P<dates>.*)$')),
+    # Title, Company (Dates)
+    (_LINE_POSITION, re.compile(r'^(?P<title>[^,(]+?),\s*(?P<company>[^(]+?)\s*\((?P<dates>[^)]*\d{4}[^)]*)\)$')),
+    (_LINE_DATES, _DATE_RANGE_RE),
+    (_LINE_CONTACT, re.compile(r'.*?(?:@|https?://|www\.|linkedin\.com|\d{3}[-\.\s]?\d{4})', re.IGNORECASE))
+)
+
+# Common programming languages and technologies, looked for when a resume has no skills section
+_TECH_KEYWORDS = (
+    "Python", "Java", "JavaScript", "C++", "C#", "Ruby", "PHP", "Swift",
+    "HTML", "CSS", "SQL", "React", "Angular", "Vue", "Node.js", "Django",
+    "Flask", "Spring", "AWS", "Azure", "Docker", "Kubernetes", "Git",
+    "TensorFlow", "PyTorch", "Pandas", "NumPy", "Scikit-learn"
+)
+
+def _keyword_alternation(keywords: Any) -> str:
+    """
+    Build a case-insensitive regex alternation of keywords factored by shared prefix
+    
+    "java" and "javascript" become java(?:script)?, so each text position tries
+    one branch per distinct next character rather than every keyword in turn.
+    
+    Args:
+        keywords: Keywords to match literally
+        
+    Returns:
+        str: Regex source matching any of the keywords
+    """
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword.lower():
+            node = node.setdefault(char, {})
+        node[""] = {}  # A keyword ends here
+        
+    def emit(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if "" in node else group
+        
+    return emit(trie)
+
+# All keywords in one prefix-factored alternation so the text is scanned once.
+# The lookarounds act as word boundaries that also work after a trailing "+" or "#".
+_TECH_RE = re.compile(r'(?<!\w)' + _keyword_alternation(_TECH_KEYWORDS) + r'(?!\w)')
+_TECH_NAMES = {keyword.lower(): keyword for keyword in _TECH_KEYWORDS}
+
+# Category given to every extracted skill
+_SKILL_CATEGORY = "technical"
+
+def _fold_case(text: str) -> str:
+    """
+    Lowercase text for the case-insensitive scans, keeping every offset valid
+    
+    Args:
+        text: The resume text content
+        
+    Returns:
+        str: Lowercased text of the same length as text
+    """
+    folded = text.lower()
+    if len(folded) != len(text):
+        # "\u0130" is the only character that lowers to two; fold it to a plain "i"
+        folded = text.replace("\u0130", "I").lower()
+    return folded
+
+def _split_sections(text: str, folded: str) -> Dict[str, str]:
+    """
+    Split resume text into section bodies in one pass over the headings
+    
+    Args:
+        text: The resume text content
+        folded: text as returned by _fold_case, searched for the headings
+        
+    Returns:
+        Dict: Stripped section body by section name; the first heading of a section wins
+    """
+    sections: Dict[str, str] = {}
+    headings = list(_SECTION_HEADING_RE.finditer(folded))
+    for heading, next_heading in zip(headings, headings[1:] + [None]):
+        name = _SECTION_NAMES[" ".join(heading.group(1).split())]
+        end = next_heading.start() if next_heading else len(text)
+        sections.setdefault(name, text[heading.end():end].strip())
+    return sections
+
+def _split_entries(section: str) -> List[str]:
+    """
+    Split a section body into entries separated by blank lines
+    
+    Args:
+        section: Stripped section body
+        
+    Returns:
+        List[str]: Non-blank entries, in order
+    """
+    # str.split pairs up runs of newlines; a leftover "\n" starts the next entry
+    entries = (entry.lstrip('\n') for entry in section.split('\n\n'))
+    return [entry for entry in entries if entry.strip()]
+
+def _classify_line(line: str) -> Tuple[str, Optional[re.Match]]:
+    """
+    Tag a line of resume text
+    
+    Args:
+        line: Stripped line of text
+        
+    Returns:
+        Tuple: The line's tag and the classifier's match, if any
+    """
+    if not line:
+        return _LINE_BLANK, None
+    for tag, pattern in _LINE_CLASSIFIERS:
+        match = pattern.match(line)
+        if match:
+            return tag, match
+    return _LINE_TEXT, None
+
+def _new_position(title: str, company: str, dates: str) -> Dict[str, Any]:
+    """Build an experience entry, splitting a date range into start and end dates"""
+    dates = dates.strip()
+    dates_match = _DATE_RANGE_RE.match(dates)
+    if dates_match:
+        start_date = dates_match.group("start")
+        end_date = dates_match.group("end")
+        if end_date.lower() in ("present", "current", "now"):
+            end_date = None
+    else:
+        start_date = dates
+        end_date = ""
+        
+    return {
+        "title": title.strip(),
+        "company": company.strip(),
+        "start_date": start_date,
+        "end_date": end_date,
+        "description": []
+    }
+
+def _extract_resume(contents: bytes, filename: str) -> Dict[str, Any]:
+    """
+    Extract text and structured data from a resume file's contents
+    
+    Module-level so it can run in a worker process.
+    
+    Args:
+        contents: The resume file's bytes
+        filename: Name of the resume file; its suffix selects the text extractor
+        
+    Returns:
+        Dict: Structured resume data
+    """
+    # Extract text from file (PDF, DOCX, TXT)
+    text = extract_text_from_bytes(contents, filename)
+    
+    # Extract information using AI (call to LLM happens here)
+    # For now, we'll use a simple rule-based approach
+    return ResumeParser()._extract_information(text)
+
 class ResumeParser:
     """Resume parsing service"""
     
     def __init__(self):
         """Initialize resume parser"""
         self.logger = logger
+        
+        # LRU of parse results so re-uploads of the same file skip extraction.
+        # Parsing runs in worker threads, hence the lock.
+        self._parse_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+        
+        # On-disk store behind the LRU, opened on first use
+        self._disk_cache: Optional[sqlite3.Connection] = None
+        self._disk_cache_lock = threading.Lock()
+        
+        # Worker processes for uploads, started on the first one
+        self._process_pool: Optional[ProcessPoolExecutor] = None
     
     async def parse_resume_file(self, file: UploadFile) -> Dict[str, Any]:
         """
@@ -34,27 +336,43 @@ class ResumeParser:
             Dict: Structured resume data
         """
         try:
-            # Save uploaded file temporarily
-            temp_file_path = await save_upload_file_temp(file)
+            # The upload is parsed from memory, without a temporary file
+            contents = await file.read()
+            cache_key = self._cache_key(contents, Path(file.filename).suffix)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
             
-            # Parse the resume
-            parsed_data = self.parse_resume(temp_file_path)
-            
-            # Clean up temporary file
-            os.remove(temp_file_path)
+            # The same file may have been parsed before the server last restarted
+            parsed_data = await asyncio.to_thread(self._disk_cache_get, cache_key)
+            if parsed_data is None:
+                # Parse the resume off the event loop; text extraction and the regex
+                # passes are blocking CPU work. In worker processes they also run in
+                # parallel rather than taking turns on this process's GIL.
+                process_pool = self._get_process_pool()
+                if process_pool is not None:
+                    parsed_data = await asyncio.get_running_loop().run_in_executor(
+                        process_pool, _extract_resume, contents, file.filename
+                    )
+                else:
+                    parsed_data = await asyncio.to_thread(_extract_resume, contents, file.filename)
+                await asyncio.to_thread(self._disk_cache_put, cache_key, parsed_data)
+            self._cache_put(cache_key, parsed_data)
+            self.logger.info(f"Resume parsed successfully: {parsed_data.get('name', 'Unknown')}")
             
             return parsed_data
             
         except Exception as e:
             self.logger.error(f"Error parsing resume file: {str(e)}")
-            if os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
             raise
     
     def parse_resume(self, file_path: str) -> Dict[str, Any]:
         """
         Parse a resume file and extract structured data
         
+        Results are cached by file content, in memory and on disk, so parsing
+        an identical file again returns a copy of the earlier result.
+        
         Args:
             file_path: Path to the resume file
             
@@ -62,12 +380,19 @@ class ResumeParser:
             Dict: Structured resume data
         """
         try:
-            # Extract text from file (PDF, DOCX, TXT)
-            text = extract_text_from_file(file_path)
+            # Read once; the same bytes are hashed and parsed
+            with open(file_path, 'rb') as file:
+                contents = file.read()
+            cache_key = self._cache_key(contents, Path(file_path).suffix)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
             
-            # Extract information using AI (call to LLM happens here)
-            # For now, we'll use a simple rule-based approach
-            parsed_data = self._extract_information(text)
+            parsed_data = self._disk_cache_get(cache_key)
+            if parsed_data is None:
+                parsed_data = _extract_resume(contents, str(file_path))
+                self._disk_cache_put(cache_key, parsed_data)
+            self._cache_put(cache_key, parsed_data)
             
             self.logger.info(f"Resume parsed successfully: {parsed_data.get('name', 'Unknown')}")
             return parsed_data
@@ -76,6 +401,175 @@ class ResumeParser:
             self.logger.error(f"Error parsing resume: {str(e)}")
             raise
     
+    def parse_resumes(self, file_paths: Iterable[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Parse many resume files, spreading the work over the worker processes
+        
+        Results are yielded as each file finishes, not in input order. Files
+        already in the cache, or repeated in the batch, are not parsed again.
+        
+        Args:
+            file_paths: Paths to the resume files
+            
+        Yields:
+            Tuple[str, Dict]: File path and its structured resume data
+        """
+        try:
+            process_pool = self._get_process_pool()
+            if process_pool is None:
+                for file_path in file_paths:
+                    yield file_path, self.parse_resume(file_path)
+                return
+            
+            max_pending = settings.resume.parse_workers * _BATCH_PENDING_PER_WORKER
+            pending: Dict[Future, str] = {}  # cache key of each in-flight parse
+            waiting: Dict[str, List[str]] = {}  # paths awaiting each in-flight cache key
+            
+            def collect(block: bool) -> Iterator[Tuple[str, Dict[str, Any]]]:
+                done, _ = wait(pending, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+                for future in done:
+                    cache_key = pending.pop(future)
+                    parsed_data = future.result()
+                    self._disk_cache_put(cache_key, parsed_data)
+                    self._cache_put(cache_key, parsed_data)
+                    for path in waiting.pop(cache_key):
+                        yield path, copy.deepcopy(parsed_data)
+            
+            for file_path in file_paths:
+                with open(file_path, 'rb') as file:
+                    contents = file.read()
+                cache_key = self._cache_key(contents, Path(file_path).suffix)
+                
+                if cache_key in waiting:
+                    waiting[cache_key].append(file_path)
+                    continue
+                parsed_data = self._cache_get(cache_key)
+                if parsed_data is None:
+                    parsed_data = self._disk_cache_get(cache_key)
+                    if parsed_data is not None:
+                        self._cache_put(cache_key, parsed_data)
+                if parsed_data is not None:
+                    yield file_path, parsed_data
+                    continue
+                
+                waiting[cache_key] = [file_path]
+                future = process_pool.submit(_extract_resume, contents, str(file_path))
+                pending[future] = cache_key
+                
+                # Hand back whatever has finished; block only when the queue is full
+                yield from collect(block=len(pending) >= max_pending)
+            
+            while pending:
+                yield from collect(block=True)
+            
+        except Exception as e:
+            self.logger.error(f"Error parsing resume batch: {str(e)}")
+            raise
+    
+    def _get_process_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Get the upload parsing process pool, or None if settings disable it"""
+        if self._process_pool is None and settings.resume.parse_workers > 0:
+            # Spawned rather than forked: the server process runs threads (the
+            # database connections, asyncio.to_thread) whose locks a fork could copy held
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=settings.resume.parse_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._process_pool
+    
+    def close(self):
+        """Shut down the upload parsing worker processes and close the disk cache"""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        with self._disk_cache_lock:
+            if self._disk_cache is not None:
+                self._disk_cache.close()
+                self._disk_cache = None
+    
+    @staticmethod
+    def _cache_key(contents: bytes, suffix: str) -> str:
+        """Key a resume by parser version, file type (which selects the text extractor) and content hash"""
+        return f"v{_PARSER_VERSION}:{suffix.lower()}:{hashlib.sha256(contents).hexdigest()}"
+    
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached parse result, or None if missing"""
+        with self._parse_cache_lock:
+            parsed_data = self._parse_cache.get(key)
+            if parsed_data is None:
+                return None
+            self._parse_cache.move_to_end(key)
+        return copy.deepcopy(parsed_data)
+    
+    def _cache_put(self, key: str, parsed_data: Dict[str, Any]):
+        """Cache a copy of a parse result, evicting the least recently used"""
+        parsed_data = copy.deepcopy(parsed_data)
+        with self._parse_cache_lock:
+            self._parse_cache[key] = parsed_data
+            self._parse_cache.move_to_end(key)
+            if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+    
+    def _get_disk_cache(self) -> Optional[sqlite3.Connection]:
+        """
+        Get the on-disk parse cache, opening it and dropping expired or stale entries on first use
+        
+        Must be called with _disk_cache_lock held.
+        
+        Returns:
+            sqlite3.Connection: Cache database, or None if settings disable it
+        """
+        if self._disk_cache is None and settings.resume.parse_cache_days > 0:
+            cache_path = Path(settings.resume.parse_cache_path)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Used from worker threads, one at a time under the lock
+            connection = sqlite3.connect(cache_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_DISK_CACHE_SCHEMA)
+            connection.execute(
+                "DELETE FROM parsed_resumes WHERE created_at < ? OR cache_key NOT LIKE ?",
+                (time.time() - settings.resume.parse_cache_days * 86400, f"v{_PARSER_VERSION}:%")
+            )
+            connection.commit()
+            self._disk_cache = connection
+        return self._disk_cache
+    
+    def _disk_cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a parse result stored on disk, or None if missing, expired or unreadable"""
+        try:
+            with self._disk_cache_lock:
+                disk_cache = self._get_disk_cache()
+                if disk_cache is None:
+                    return None
+                row = disk_cache.execute(
+                    "SELECT parsed_data FROM parsed_resumes WHERE cache_key = ? AND created_at >= ?",
+                    (key, time.time() - settings.resume.parse_cache_days * 86400)
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+            
+        except (sqlite3.Error, OSError, ValueError) as e:
+            # The cache only saves work; parse the file again instead
+            self.logger.warning(f"Error reading parsed resume cache: {str(e)}")
+            return None
+    
+    def _disk_cache_put(self, key: str, parsed_data: Dict[str, Any]):
+        """Store a parse result on disk"""
+        try:
+            value = json.dumps(parsed_data)
+            with self._disk_cache_lock:
+                disk_cache = self._get_disk_cache()
+                if disk_cache is None:
+                    return
+                with disk_cache:
+                    disk_cache.execute(
+                        "INSERT OR REPLACE INTO parsed_resumes (cache_key, parsed_data, created_at) VALUES (?, ?, ?)",
+                        (key, value, time.time())
+                    )
+                    
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Error writing parsed resume cache: {str(e)}")
+    
     def _extract_information(self, text: str) -> Dict[str, Any]:
         """
         Extract structured information from resume text
@@ -88,12 +582,16 @@ class ResumeParser:
         """
         # This is a simplified version - in production, use LLM or more sophisticated NLP
         
+        # Find every section once; each extractor only sees its own section
+        folded = _fold_case(text)
+        sections = _split_sections(text, folded)
+        
         # Basic information extraction
         name = self._extract_name(text)
         contact = self._extract_contact_info(text)
-        skills = self._extract_skills(text)
-        experience = self._extract_experience(text)
-        education = self._extract_education(text)
+        skills = self._extract_skills(sections.get("skills"), folded)
+        experience = self._extract_experience(sections.get("experience"))
+        education = self._extract_education(sections.get("education"))
         
         return {
             "name": name,
@@ -101,23 +599,25 @@ class ResumeParser:
             "skills": skills,
             "experience": experience,
             "education": education,
-            "summary": self._extract_summary(text),
-            "projects": self._extract_projects(text),
-            "certifications": self._extract_certifications(text)
+            "summary": self._extract_summary(sections.get("summary") or sections.get("profile")),
+            "projects": self._extract_projects(sections.get("projects")),
+            "certifications": self._extract_certifications(sections.get("certifications"))
         }
     
     def _extract_name(self, text: str) -> str:
         """Extract name from resume text"""
-        # Simple heuristic: first line is often the name
-        lines = text.strip().split('\n')
-        if lines:
-            name = lines[0].strip()
+        # The name is usually the first line, though contact lines may come first
+        for line in text.strip().split('\n')[:_NAME_SEARCH_LINES]:
+            name = line.strip()
+            tag, _ = _classify_line(name)
             # Check if it looks like a name (no special chars, not too long)
-            if len(name) < 40 and re.match(r'^[A-Za-z\s\.\-]+$', name):
+            if tag == _LINE_TEXT and len(name) < 40 and _NAME_LINE_RE.match(name):
                 return name
+            if tag not in (_LINE_BLANK, _LINE_CONTACT):
+                break
         
         # Fallback: look for common name patterns
-        name_match = re.search(r'^([A-Z][a-z]+\s[A-Z][a-z]+)', text)
+        name_match = _NAME_RE.search(text)
         if name_match:
             return name_match.group(1)
             
@@ -132,164 +632,101 @@ class ResumeParser:
             "linkedin": None
         }
         
-        # Email extraction
-        email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-        if email_match:
-            contact["email"] = email_match.group(0)
-        
-        # Phone extraction
-        phone_match = re.search(r'(\+\d{1,3}[-\.\s]?)?(\(?\d{3}\)?[-\.\s]?\d{3}[-\.\s]?\d{4})', text)
-        if phone_match:
-            contact["phone"] = phone_match.group(0)
-        
-        # LinkedIn extraction
-        linkedin_match = re.search(r'linkedin\.com/in/[\w\-]+', text, re.IGNORECASE)
-        if linkedin_match:
-            contact["linkedin"] = "https://" + linkedin_match.group(0)
-        
-        # Location extraction (simplified)
-        location_patterns = [
-            r'([A-Z][a-z]+,\s[A-Z]{2})',  # City, State
-            r'([A-Z][a-z]+,\s[A-Z][a-z]+)'  # City, Country
-        ]
-        
-        for pattern in location_patterns:
-            location_match = re.search(pattern, text)
-            if location_match:
-                contact["location"] = location_match.group(0)
+        # Keep the first match of each field; a City, State location wins over City, Country
+        found: Dict[str, str] = {}
+        for match in _CONTACT_RE.finditer(text):
+            found.setdefault(match.lastgroup, match.group(0))
+            if len(found) == 5:
                 break
         
+        contact["email"] = found.get("email")
+        contact["phone"] = found.get("phone")
+        contact["location"] = found.get("state_location") or found.get("country_location")
+        if "linkedin" in found:
+            contact["linkedin"] = "https://" + found["linkedin"]
+        
         return contact
     
-    def _extract_skills(self, text: str) -> List[Dict[str, Any]]:
-        """Extract skills from resume text"""
-        skills = []
-        
-        # Look for a skills section
-        skills_section_match = re.search(r'SKILLS[:\s]+(.*?)(?:\n\n|\Z)', text, re.IGNORECASE | re.DOTALL)
+    def _extract_skills(self, skills_section: Optional[str], folded: str) -> List[Dict[str, Any]]:
+        """Extract skills from the skills section, falling back to keywords in the whole (case-folded) text"""
+        names = {}
         
-        if skills_section_match:
-            skills_text = skills_section_match.group(1)
-            # Split by commas, or bullet points
-            skill_items = re.split(r'[,•]', skills_text)
-            
-            for item in skill_items:
-                item = item.strip()
-                if item and len(item) > 2:  # Avoid empty or too short items
-                    skills.append({"name": item, "category": "technical"})
+        if skills_section:
+            # Only the first paragraph of the section lists skills
+            skills_text = skills_section.split('\n\n', 1)[0]
+            # Split by commas, or bullet points; a skill listed twice is kept once
+            skill_items = (item.strip() for item in _SKILL_SEPARATOR_RE.split(skills_text))
+            names = dict.fromkeys(item for item in skill_items if len(item) > 2)  # Avoid empty or too short items
         
         # If no skills found, try to extract from whole text
-        if not skills:
-            # Common programming languages and technologies
-            tech_keywords = [
-                "Python", "Java", "JavaScript", "C\\+\\+", "C#", "Ruby", "PHP", "Swift",
-                "HTML", "CSS", "SQL", "React", "Angular", "Vue", "Node.js", "Django",
-                "Flask", "Spring", "AWS", "Azure", "Docker", "Kubernetes", "Git",
-                "TensorFlow", "PyTorch", "Pandas", "NumPy", "Scikit-learn"
-            ]
-            
-            for keyword in tech_keywords:
-                if re.search(r'\b' + keyword + r'\b', text, re.IGNORECASE):
-                    skills.append({"name": keyword, "category": "technical"})
+        if not names:
+            found = {_TECH_NAMES[match] for match in _TECH_RE.findall(folded)}
+            names = [keyword for keyword in _TECH_KEYWORDS if keyword in found]
         
-        return skills
+        return [{"name": name, "category": _SKILL_CATEGORY} for name in names]
     
-    def _extract_experience(self, text: str) -> List[Dict[str, Any]]:
-        """Extract work experience"""
+    def _extract_experience(self, experience_text: Optional[str]) -> List[Dict[str, Any]]:
+        """Extract work experience from the experience section"""
         experience = []
         
-        # Look for experience section
-        experience_section_match = re.search(
-            r'(?:EXPERIENCE|EMPLOYMENT|WORK\sEXPERIENCE)[:\s]+(.*?)(?:EDUCATION|SKILLS|PROJECTS|\Z)', 
-            text, 
-            re.IGNORECASE | re.DOTALL
-        )
-        
-        if experience_section_match:
-            experience_text = experience_section_match.group(1)
-            
-            # Split into individual positions (simplified approach)
-            positions = re.split(r'\n\n+', experience_text)
+        if experience_text:
+            # Walk the section line by line. A position starts at a
+            # "Title | Company | Dates" or "Title, Company (Dates)" line, or at a
+            # date range below title and company lines; bullets describe the
+            # current position.
+            position = None
+            heading_lines = []
             
-            for position in positions:
-                if not position.strip():
-                    continue
-                    
-                # Extract title and company
-                title_company_match = re.search(r'(.*?)\s*\|\s*(.*?)\s*\|', position)
+            for line in experience_text.split('\n'):
+                line = line.strip()
+                tag, match = _classify_line(line)
                 
-                if title_company_match:
-                    title = title_company_match.group(1).strip()
-                    company = title_company_match.group(2).strip()
-                    
-                    # Extract dates
-                    dates_match = re.search(r'\|\s*(.*?)(?:\n|$)', position)
-                    dates = dates_match.group(1).strip() if dates_match else ""
-                    
-                    start_date = ""
-                    end_date = ""
-                    
-                    if " - " in dates:
-                        date_parts = dates.split(" - ")
-                        start_date = date_parts[0].strip()
-                        end_date = date_parts[1].strip()
-                    else:
-                        start_date = dates
-                    
-                    # Extract description bullets
-                    description_lines = []
-                    for line in position.split('\n'):
-                        if line.strip().startswith('•'):
-                            description_lines.append(line.strip()[1:].strip())
-                    
-                    experience.append({
-                        "title": title,
-                        "company": company,
-                        "start_date": start_date,
-                        "end_date": end_date if end_date != "Present" else None,
-                        "description": description_lines
-                    })
+                if tag == _LINE_POSITION:
+                    position = _new_position(match.group("title"), match.group("company"), match.group("dates"))
+                    experience.append(position)
+                    heading_lines = []
+                elif tag == _LINE_DATES and heading_lines:
+                    company = heading_lines[-1] if len(heading_lines) > 1 else ""
+                    position = _new_position(heading_lines[-2 if company else -1], company, line)
+                    experience.append(position)
+                    heading_lines = []
+                elif tag == _LINE_BULLET:
+                    if position is not None:
+                        position["description"].append(match.group("text").strip())
+                    heading_lines = []
+                elif tag == _LINE_TEXT:
+                    heading_lines.append(line)
+                elif tag == _LINE_BLANK:
+                    heading_lines = []
         
         return experience
     
-    def _extract_education(self, text: str) -> List[Dict[str, Any]]:
-        """Extract education information"""
+    def _extract_education(self, education_text: Optional[str]) -> List[Dict[str, Any]]:
+        """Extract education information from the education section"""
         education = []
         
-        # Look for education section
-        education_section_match = re.search(
-            r'EDUCATION[:\s]+(.*?)(?:EXPERIENCE|SKILLS|PROJECTS|\Z)', 
-            text, 
-            re.IGNORECASE | re.DOTALL
-        )
-        
-        if education_section_match:
-            education_text = education_section_match.group(1)
-            
+        if education_text:
             # Split into individual education entries
-            entries = re.split(r'\n\n+', education_text)
+            entries = _split_entries(education_text)
             
             for entry in entries:
-                if not entry.strip():
-                    continue
-                
                 # Extract degree and institution
-                degree_match = re.search(r'(Bachelor|Master|PhD|B\.S\.|M\.S\.|M\.A\.|B\.A\.|Doctorate).*?([^\|]+)', entry, re.IGNORECASE)
+                degree_match = _DEGREE_RE.search(entry)
                 
                 if degree_match:
                     degree = degree_match.group(0).strip()
                     
                     # Extract institution
-                    institution_match = re.search(r'\|\s*(.*?)\s*\|', entry)
+                    institution_match = _INSTITUTION_RE.search(entry)
                     institution = institution_match.group(1).strip() if institution_match else ""
                     
                     # Extract graduation date
-                    grad_date_match = re.search(r'(?:Graduated|Graduation):\s*(\w+\s+\d{4})', entry, re.IGNORECASE)
+                    grad_date_match = _GRADUATION_DATE_RE.search(entry)
                     grad_date = grad_date_match.group(1) if grad_date_match else ""
                     
                     if not grad_date:
                         # Try another pattern
-                        date_match = re.search(r'\|\s*(\d{4})', entry)
+                        date_match = _GRADUATION_YEAR_RE.search(entry)
                         grad_date = date_match.group(1) if date_match else ""
                     
                     education.append({
@@ -300,43 +737,24 @@ class ResumeParser:
         
         return education
     
-    def _extract_summary(self, text: str) -> Optional[str]:
-        """Extract summary/objective section"""
-        summary_patterns = [
-            r'(?:SUMMARY|PROFESSIONAL\sSUMMARY|OBJECTIVE)[:\s]+(.*?)(?:\n\n|\Z)',
-            r'(?:PROFILE|ABOUT\sME)[:\s]+(.*?)(?:\n\n|\Z)'
-        ]
-        
-        for pattern in summary_patterns:
-            summary_match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if summary_match:
-                return summary_match.group(1).strip()
+    def _extract_summary(self, summary_section: Optional[str]) -> Optional[str]:
+        """Extract the first paragraph of the summary/objective section"""
+        if summary_section:
+            return summary_section.split('\n\n', 1)[0].strip()
         
         return None
     
-    def _extract_projects(self, text: str) -> List[Dict[str, Any]]:
-        """Extract projects information"""
+    def _extract_projects(self, projects_text: Optional[str]) -> List[Dict[str, Any]]:
+        """Extract projects information from the projects section"""
         projects = []
         
-        # Look for projects section
-        projects_section_match = re.search(
-            r'PROJECTS[:\s]+(.*?)(?:EDUCATION|EXPERIENCE|SKILLS|\Z)', 
-            text, 
-            re.IGNORECASE | re.DOTALL
-        )
-        
-        if projects_section_match:
-            projects_text = projects_section_match.group(1)
-            
+        if projects_text:
             # Split into individual projects
-            project_entries = re.split(r'\n\n+', projects_text)
+            project_entries = _split_entries(projects_text)
             
             for entry in project_entries:
-                if not entry.strip():
-                    continue
-                
                 # Extract project name
-                name_match = re.search(r'^(.*?)(?:\||\n|$)', entry)
+                name_match = _PROJECT_NAME_RE.search(entry)
                 if name_match:
                     name = name_match.group(1).strip()
                     
@@ -350,7 +768,7 @@ class ResumeParser:
                             description += line.strip() + " "
                     
                     # Extract technologies
-                    tech_match = re.search(r'Technologies:?\s*(.*?)(?:\n|$)', entry, re.IGNORECASE)
+                    tech_match = _TECHNOLOGIES_RE.search(entry)
                     technologies = []
                     
                     if tech_match:
@@ -365,29 +783,17 @@ class ResumeParser:
         
         return projects
     
-    def _extract_certifications(self, text: str) -> List[Dict[str, Any]]:
-        """Extract certifications information"""
+    def _extract_certifications(self, cert_text: Optional[str]) -> List[Dict[str, Any]]:
+        """Extract certifications information from the certifications section"""
         certifications = []
         
-        # Look for certifications section
-        cert_section_match = re.search(
-            r'(?:CERTIFICATIONS|CERTIFICATES)[:\s]+(.*?)(?:EDUCATION|EXPERIENCE|SKILLS|PROJECTS|\Z)', 
-            text, 
-            re.IGNORECASE | re.DOTALL
-        )
-        
-        if cert_section_match:
-            cert_text = cert_section_match.group(1)
-            
+        if cert_text:
             # Split into individual certifications
-            cert_entries = re.split(r'\n+', cert_text)
+            cert_entries = [line for line in cert_text.split('\n') if line.strip()]
             
             for entry in cert_entries:
-                if not entry.strip():
-                    continue
-                
                 # Look for certification name and issuer
-                cert_match = re.search(r'(.*?)(?:\s*\|\s*(.*?))?(?:\s*\|\s*(.*?))?$', entry)
+                cert_match = _CERTIFICATION_RE.search(entry)
                 
                 if cert_match:
                     name = cert_match.group(1).strip()
@@ -411,18 +817,7 @@ class ResumeParser:
         """
         # This would typically involve a database call
         # For now, return a mock response
-        return [{
-            "id": 1,
-            "name": "John Doe",
-            "contact": {
-                "email": "john.doe@example.com",
-                "phone": "555-123-4567",
-                "location": "San Francisco, CA",
-                "linkedin": "https://linkedin.com/in/johndoe"
-            },
-            "created_at": datetime.now(),
-            "updated_at": datetime.now()
-        }]
+        return [copy.deepcopy(_MOCK_RESUME)]
     
     async def get_resume(self, resume_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -436,17 +831,6 @@ class ResumeParser:
         """
         # This would typically involve a database call
         # For now, return a mock response if ID is 1
-        if resume_id == 1:
-            return {
-                "id": 1,
-                "name": "John Doe",
-                "contact": {
-                    "email": "john.doe@example.com",
-                    "phone": "555-123-4567",
-                    "location": "San Francisco, CA",
-                    "linkedin": "https://linkedin.com/in/johndoe"
-                },
-                "created_at": datetime.now(),
-                "updated_at": datetime.now()
-            }
+        if resume_id == _MOCK_RESUME["id"]:
+            return copy.deepcopy(_MOCK_RESUME)
         return None
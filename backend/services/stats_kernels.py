@@ -0,0 +1,30 @@
+"""
+Statistics kernels for application metrics
+"""
+
+from typing import Dict, Iterable
+
+def summarize_scores(scores: Iterable[float]) -> Dict[str, float]:
+    """
+    Summarize a stream of match scores
+    
+    Args:
+        scores: Iterable of match scores (e.g. a database cursor)
+        
+    Returns:
+        Dictionary with count, mean, p50 and p95
+    """
+    # Imported lazily so importing the services package stays cheap
+    import numpy as np
+    
+    values = np.fromiter(scores, dtype=np.float32)
+    if values.size == 0:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0}
+    
+    p50, p95 = np.percentile(values, (50, 95))
+    return {
+        "count": int(values.size),
+        "mean": float(values.mean()),
+        "p50": float(p50),
+        "p95": float(p95)
+    }
@@ -13,7 +13,6 @@ from unittest.mock import MagicMock, patch
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 # Import services
-from services.llm_service import LLMService
 from services.db_manager import DatabaseManager
 from services.resume_parser import ResumeParser
 from services.job_scraper import JobScraper
@@ -24,17 +23,27 @@ from backend.agents.resume_optimizer_agent import ResumeOptimizerAgent
 from backend.agents.job_description_agent import JobDescriptionAnalysisAgent
 from backend.agents.application_agent import ApplicationAgent
 
-@pytest.fixture
-def mock_llm_service():
-    """Fixture for a mocked LLM service"""
-    mock_service = MagicMock(spec=LLMService)
+class FakeLLMService:
+    """Stand-in for LLMService that records each completion request"""
+    
+    def __init__(self, response: str = "Mocked LLM response"):
+        self.response = response
+        self.calls = []  # (args, kwargs) of each generate_completion call
     
-    # Setup common mock behaviors
-    async def mock_generate_completion(*args, **kwargs):
-        return "Mocked LLM response"
+    async def generate_completion(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.response
     
-    mock_service.generate_completion.side_effect = mock_generate_completion
-    return mock_service
+    async def generate_completions(self, prompts, **kwargs):
+        return [await self.generate_completion(prompt, **kwargs) for prompt in prompts]
+    
+    async def close(self):
+        pass
+
+@pytest.fixture
+def mock_llm_service():
+    """Fixture for a fake LLM service"""
+    return FakeLLMService()
 
 @pytest.fixture
 def mock_db_manager():
@@ -56,7 +65,7 @@ def mock_application_engine():
     """Fixture for a mocked application engine"""
     return MagicMock(spec=ApplicationEngine)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_resume_text():
     """Sample resume text for testing"""
     return """
@@ -88,7 +97,7 @@ Bachelor of Science in Computer Science
 University of Technology (2014-2018)
     """
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_job_description():
     """Sample job description for testing"""
     return """
@@ -0,0 +1,439 @@
+"""
+Tests for the database manager
+"""
+
+import pytest
+import pytest_asyncio
+import asyncio
+import json
+import sqlite3
+from contextlib import asynccontextmanager
+
+from services import db_manager as db_module
+from services.db_manager import DatabaseManager
+
+def _job(title: str, company: str = "Tech Company", **fields):
+    """Job data for a new application"""
+    return {"title": title, "company": company, "description": "Job description", **fields}
+
+async def _open_db_manager(db_path: str) -> DatabaseManager:
+    """Open a database manager holding a resume for applications to reference"""
+    db_manager = DatabaseManager(db_path=db_path)
+    await db_manager.init_db()
+    await db_manager.save_resume("Resume", "Resume text", {"skills": ["Python"]})
+    return db_manager
+
+@pytest_asyncio.fixture
+async def db_manager(tmp_path):
+    """Database manager on a fresh database file"""
+    db_manager = await _open_db_manager(str(tmp_path / "test.db"))
+    yield db_manager
+    await db_manager.close()
+
+class TestActivityGroupCommit:
+    """Test cases for queued application activity writes"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_activities_share_a_transaction(self, db_manager, monkeypatch):
+        """Test that activities queued together are committed in one transaction"""
+        application_id = await db_manager.save_application_result(_job("Engineer"), {"application_status": "pending"})
+
+        transactions = 0
+        transaction = db_manager._transaction
+        def counting_transaction():
+            nonlocal transactions
+            transactions += 1
+            return transaction()
+        monkeypatch.setattr(db_manager, "_transaction", counting_transaction)
+
+        activity_ids = await asyncio.gather(*[
+            db_manager.add_application_activity(application_id, "note_added", {"note": i})
+            for i in range(20)
+        ])
+
+        assert transactions == 1
+        assert len(set(activity_ids)) == 20
+
+    @pytest.mark.asyncio
+    async def test_failing_activity_only_fails_its_caller(self, db_manager):
+        """Test that a constraint violation rolls back only that activity"""
+        application_id = await db_manager.save_application_result(_job("Engineer"), {"application_status": "pending"})
+
+        results = await asyncio.gather(
+            db_manager.add_application_activity(application_id, "note_added", {"note": "first"}),
+            db_manager.add_application_activity(999999, "note_added", {"note": "orphan"}),
+            db_manager.add_application_activity(application_id, "note_added", {"note": "second"}),
+            return_exceptions=True
+        )
+
+        assert isinstance(results[0], int)
+        assert isinstance(results[1], sqlite3.IntegrityError)
+        assert isinstance(results[2], int)
+
+        async with db_manager._acquire() as conn:
+            rows = await db_manager._fetch_tuples(
+                conn,
+                "SELECT id FROM application_activities WHERE activity_type = 'note_added' ORDER BY id"
+            )
+        assert [activity_id for (activity_id,) in rows] == [results[0], results[2]]
+
+    @pytest.mark.asyncio
+    async def test_unserializable_details_only_fail_their_caller(self, db_manager):
+        """Test that details that cannot be serialized fail only that activity"""
+        application_id = await db_manager.save_application_result(_job("Engineer"), {"application_status": "pending"})
+
+        results = await asyncio.gather(
+            db_manager.add_application_activity(application_id, "note_added", {"note": "first"}),
+            db_manager.add_application_activity(application_id, "note_added", {"note": object()}),
+            db_manager.add_application_activity(application_id, "note_added", {"note": "second"}),
+            return_exceptions=True
+        )
+
+        assert isinstance(results[0], int)
+        assert isinstance(results[1], TypeError)
+        assert isinstance(results[2], int)
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_queued_activities(self, tmp_path):
+        """Test that close() waits for queued activities to be written"""
+        db_path = str(tmp_path / "test.db")
+        db_manager = await _open_db_manager(db_path)
+        application_id = await db_manager.save_application_result(_job("Engineer"), {"application_status": "pending"})
+
+        pending = asyncio.ensure_future(db_manager.add_application_activity(application_id, "note_added"))
+        await asyncio.sleep(0)
+        await db_manager.close()
+
+        assert isinstance(await pending, int)
+        with sqlite3.connect(db_path) as conn:
+            count, = conn.execute("SELECT COUNT(*) FROM application_activities WHERE activity_type = 'note_added'").fetchone()
+        assert count == 1
+
+class TestRowCache:
+    """Test cases for the resume and job row cache"""
+
+    @pytest.mark.asyncio
+    async def test_returned_rows_are_independent_copies(self, db_manager):
+        """Test that mutating a returned row does not change the cached one"""
+        resume = await db_manager.get_resume(1)
+        resume["skills"].append("Cobol")
+        resume["parsed_data"]["skills"].clear()
+
+        resume = await db_manager.get_resume(1)
+        assert resume["skills"] == ["Python"]
+        assert resume["parsed_data"] == {"skills": ["Python"]}
+
+    @pytest.mark.asyncio
+    async def test_save_evicts_cached_rows(self, db_manager):
+        """Test that saving a resume or job replaces the cached row"""
+        await db_manager.get_resume(1)
+        await db_manager.save_resume("Resume", "New text", {"skills": ["Go"]})
+
+        resume = await db_manager.get_resume(1)
+        assert resume["content"] == "New text"
+        assert resume["skills"] == ["Go"]
+
+        job_id = await db_manager.save_job(_job("Engineer", url="https://example.com/job"))
+        await db_manager.get_job(job_id)
+        await db_manager.save_job(_job("Senior Engineer", url="https://example.com/job"))
+        assert (await db_manager.get_job(job_id))["title"] == "Senior Engineer"
+
+    @pytest.mark.asyncio
+    async def test_delete_evicts_cached_rows(self, db_manager):
+        """Test that deleted resumes and jobs are no longer served from the cache"""
+        job_id = await db_manager.save_job(_job("Engineer"))
+        await db_manager.get_job(job_id)
+        await db_manager.get_resume(1)
+
+        assert await db_manager.delete_job(job_id)
+        assert await db_manager.delete_resume(1)
+        assert await db_manager.get_job(job_id) is None
+        assert await db_manager.get_resume(1) is None
+
+    @pytest.mark.asyncio
+    async def test_rows_read_before_a_write_are_not_cached(self, db_manager):
+        """Test that a row read while a write committed is not put in the cache"""
+        generation = db_manager._row_cache_generation
+        stale = await db_manager.get_resume(1)
+        db_manager._row_cache.clear()
+
+        # The write commits between the read and the cache put
+        await db_manager.save_resume("Resume", "New text", {"skills": ["Go"]})
+        db_manager._cache_put(("resume", 1), stale, generation)
+
+        assert (await db_manager.get_resume(1))["content"] == "New text"
+
+class TestApplicationSearch:
+    """Test cases for the job title and company filters"""
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def applications(self, db_manager):
+        """Save applications for a few jobs"""
+        self.ids = await db_manager.save_applications([
+            (_job("Senior Python Developer", "Acme Corp"), {}),
+            (_job("Data Engineer", "Globex"), {}),
+            (_job("Go Developer", "AcmeSoft"), {}),
+            (_job('Engineer "Platform"', "Initech"), {})
+        ])
+
+    async def search(self, db_manager, **filters):
+        """IDs of the applications matching the filters"""
+        return {application["id"] for application in await db_manager.get_all_applications(filters=filters)}
+
+    @pytest.mark.asyncio
+    async def test_title_matches_case_insensitive_substrings(self, db_manager):
+        """Test that a title filter matches anywhere in the title, ignoring case"""
+        assert await self.search(db_manager, job_title="developer") == {self.ids[0], self.ids[2]}
+        assert await self.search(db_manager, job_title="ENGIN") == {self.ids[1], self.ids[3]}
+        assert await self.search(db_manager, job_title="thon dev") == {self.ids[0]}
+
+    @pytest.mark.asyncio
+    async def test_title_and_company_filters_combine(self, db_manager):
+        """Test that title and company filters must both match"""
+        assert await self.search(db_manager, job_title="Developer", company="acme") == {self.ids[0], self.ids[2]}
+        assert await self.search(db_manager, job_title="Python", company="Globex") == set()
+
+    @pytest.mark.asyncio
+    async def test_search_terms_are_literal(self, db_manager):
+        """Test that quotes and FTS syntax in a filter are matched literally"""
+        assert await self.search(db_manager, job_title='"Platform"') == {self.ids[3]}
+        assert await self.search(db_manager, job_title="Data OR Go") == set()
+
+    @pytest.mark.asyncio
+    async def test_short_terms_fall_back_to_like(self, db_manager):
+        """Test that terms shorter than a trigram still match substrings"""
+        assert await self.search(db_manager, job_title="go") == {self.ids[2]}
+        assert await self.search(db_manager, company="ex") == {self.ids[1]}
+
+    @pytest.mark.asyncio
+    async def test_search_follows_job_updates(self, db_manager):
+        """Test that the index follows a job renamed by an upsert"""
+        job_id = await db_manager.save_job(_job("Rust Developer", url="https://example.com/job"))
+        await db_manager.save_job(_job("Haskell Developer", url="https://example.com/job"))
+        application_id = await db_manager.save_application_result(
+            _job("Haskell Developer", url="https://example.com/job"), {}
+        )
+
+        assert await self.search(db_manager, job_title="Rust") == set()
+        assert await self.search(db_manager, job_title="Haskell") == {application_id}
+        assert (await db_manager.get_application(application_id))["job_id"] == job_id
+
+    @pytest.mark.asyncio
+    async def test_search_without_trigram_support(self, tmp_path, monkeypatch):
+        """Test that filters fall back to LIKE when SQLite lacks the trigram tokenizer"""
+        monkeypatch.setattr(db_module, "_JOB_SEARCH_MIN_SQLITE_VERSION", (99, 0, 0))
+        db_path = str(tmp_path / "no_fts.db")
+        db_manager = await _open_db_manager(db_path)
+        try:
+            ids = await db_manager.save_applications([
+                (_job("Senior Python Developer", "Acme Corp"), {}),
+                (_job("Data Engineer", "Globex"), {})
+            ])
+            assert await self.search(db_manager, job_title="python dev") == {ids[0]}
+            assert await self.search(db_manager, company="GLOBEX") == {ids[1]}
+        finally:
+            await db_manager.close()
+
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'").fetchone() is None
+
+class TestApplicationPagination:
+    """Test cases for keyset pagination of applications"""
+
+    async def pages(self, db_manager, limit, **filters):
+        """Walk all pages with the cursor of each page's last application"""
+        pages, cursor = [], None
+        while True:
+            page = await db_manager.get_all_applications(limit=limit, filters=filters or None, cursor=cursor)
+            if not page:
+                return pages
+            pages.append([application["id"] for application in page])
+            cursor = (page[-1]["created_at"], page[-1]["id"])
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_match_offset_pages(self, db_manager):
+        """Test that cursor pages have no gaps or duplicates when created_at ties"""
+        # Each batch shares one created_at timestamp
+        await db_manager.save_applications([(_job(f"Engineer {i}"), {}) for i in range(5)])
+        await db_manager.save_application_result(_job("Engineer 5"), {})
+        await db_manager.save_applications([(_job(f"Engineer {i}"), {}) for i in range(6, 10)])
+
+        expected = [
+            [application["id"] for application in await db_manager.get_all_applications(limit=3, offset=offset)]
+            for offset in range(0, 10, 3)
+        ]
+        assert await self.pages(db_manager, 3) == expected
+        assert sorted(sum(expected, [])) == list(range(1, 11))
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_with_filters(self, db_manager):
+        """Test that the cursor combines with filters"""
+        ids = await db_manager.save_applications([
+            (_job(f"Engineer {i}"), {"application_status": "applied" if i % 2 else "pending"})
+            for i in range(7)
+        ])
+
+        pages = await self.pages(db_manager, 2, status="applied")
+        assert pages == [[ids[5], ids[3]], [ids[1]]]
+
+    @pytest.mark.asyncio
+    async def test_cursor_ignores_offset(self, db_manager):
+        """Test that a cursor page starts right after the cursor whatever the offset"""
+        ids = await db_manager.save_applications([(_job(f"Engineer {i}"), {}) for i in range(4)])
+        first = (await db_manager.get_all_applications(limit=1))[0]
+
+        page = await db_manager.get_all_applications(limit=2, offset=2, cursor=(first["created_at"], first["id"]))
+        assert [application["id"] for application in page] == [ids[2], ids[1]]
+
+class TestUpdateApplicationStatuses:
+    """Test cases for batched application status updates"""
+
+    async def status_changes(self, db_manager):
+        """(application_id, details) of the recorded status changes"""
+        async with db_manager._acquire() as conn:
+            return await db_manager._fetch_tuples(
+                conn,
+                "SELECT application_id, details FROM application_activities WHERE activity_type = 'status_change' ORDER BY id"
+            )
+
+    @pytest.mark.asyncio
+    async def test_updates_known_applications_in_input_order(self, db_manager):
+        """Test that unknown IDs are skipped and updated IDs keep input order"""
+        ids = await db_manager.save_applications([(_job(f"Engineer {i}"), {}) for i in range(3)])
+
+        updated = await db_manager.update_application_statuses([
+            (ids[2], "applied", None),
+            (999999, "applied", None),
+            (ids[0], "rejected", None)
+        ])
+
+        assert updated == [ids[2], ids[0]]
+        assert (await db_manager.get_application(ids[0]))["status"] == "rejected"
+        assert (await db_manager.get_application(ids[1]))["status"] == "pending"
+        assert (await db_manager.get_application(ids[2]))["status"] == "applied"
+
+    @pytest.mark.asyncio
+    async def test_error_message_replaces_notes(self, db_manager):
+        """Test that notes are kept unless an error message is given"""
+        ids = await db_manager.save_applications([
+            (_job(f"Engineer {i}"), {"notes": "Referred"}) for i in range(3)
+        ])
+
+        await db_manager.update_application_statuses([
+            (ids[0], "failed", "Form did not submit"),
+            (ids[1], "applied", None),
+            (ids[2], "applied", "")
+        ])
+
+        assert (await db_manager.get_application(ids[0]))["notes"] == "Form did not submit"
+        assert (await db_manager.get_application(ids[1]))["notes"] == "Referred"
+        assert (await db_manager.get_application(ids[2]))["notes"] == "Referred"
+
+    @pytest.mark.asyncio
+    async def test_records_status_change_activities(self, db_manager):
+        """Test that each updated application gets a status_change activity"""
+        ids = await db_manager.save_applications([(_job(f"Engineer {i}"), {}) for i in range(2)])
+
+        await db_manager.update_application_statuses([
+            (ids[1], "applied", None),
+            (999999, "applied", None),
+            (ids[0], "interview", None)
+        ])
+
+        assert [
+            (application_id, json.loads(details)) for application_id, details in await self.status_changes(db_manager)
+        ] == [(ids[1], {"status": "applied"}), (ids[0], {"status": "interview"})]
+
+    @pytest.mark.asyncio
+    async def test_updates_stamp_updated_at_like_inserts(self, db_manager, monkeypatch):
+        """Test that updates write updated_at with the same clock and format as inserts"""
+        ids = await db_manager.save_applications([(_job(f"Engineer {i}"), {}) for i in range(3)])
+        monkeypatch.setattr(db_module, "_timestamp", lambda: "2999-01-01 00:00:00")
+
+        await db_manager.update_application_status(ids[0], "applied")
+        await db_manager.update_application_statuses([(ids[1], "applied", None)])
+        await db_manager.update_application(ids[2], {"notes": "Called back"})
+
+        for application_id in ids:
+            assert (await db_manager.get_application(application_id))["updated_at"] == "2999-01-01 00:00:00"
+
+    @pytest.mark.asyncio
+    async def test_unknown_ids_only(self, db_manager):
+        """Test that a batch of unknown IDs or no updates changes nothing"""
+        assert await db_manager.update_application_statuses([]) == []
+        assert await db_manager.update_application_statuses([(999999, "applied", None)]) == []
+        assert await self.status_changes(db_manager) == []
+
+class TestApplicationStatsCache:
+    """Test cases for caching application statistics"""
+
+    def acquisitions(self, db_manager):
+        """Number of reader connections borrowed so far"""
+        return db_manager.pool_stats()["total_acquisitions"]
+
+    @pytest.mark.asyncio
+    async def test_cached_stats_are_copies(self, db_manager):
+        """Test that repeated calls are served from the cache as independent copies"""
+        await db_manager.save_application_result(_job("Engineer"), {})
+        stats = await db_manager.get_application_stats()
+        acquisitions = self.acquisitions(db_manager)
+
+        stats["by_status"]["pending"] = 100
+        stats["recent_applications"].clear()
+
+        stats = await db_manager.get_application_stats()
+        assert self.acquisitions(db_manager) == acquisitions
+        assert stats["by_status"] == {"pending": 1}
+        assert len(stats["recent_applications"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cached_stats(self, db_manager):
+        """Test that any committed write makes the next call recompute"""
+        application_id = await db_manager.save_application_result(_job("Engineer"), {})
+        assert (await db_manager.get_application_stats())["by_status"] == {"pending": 1}
+
+        await db_manager.update_application_status(application_id, "applied")
+        assert (await db_manager.get_application_stats())["by_status"] == {"applied": 1}
+
+        await db_manager.add_application_activity(application_id, "note_added")
+        acquisitions = self.acquisitions(db_manager)
+        await db_manager.get_application_stats()
+        assert self.acquisitions(db_manager) == acquisitions + 1
+
+    @pytest.mark.asyncio
+    async def test_stats_read_during_a_write_are_not_cached(self, db_manager, monkeypatch):
+        """Test that stats computed while a write committed are not cached"""
+        acquire = db_manager._acquire
+
+        @asynccontextmanager
+        async def acquire_then_write():
+            async with acquire() as conn:
+                # Another request commits after the stats read started
+                monkeypatch.setattr(db_manager, "_acquire", acquire)
+                await db_manager.save_application_result(_job("Engineer"), {})
+                yield conn
+
+        monkeypatch.setattr(db_manager, "_acquire", acquire_then_write)
+        await db_manager.get_application_stats()
+
+        assert db_manager._stats_cache is None
+        assert (await db_manager.get_application_stats())["total_applications"] == 1
+
+class TestRecentActivityFeed:
+    """Test cases for the recent activity feed"""
+
+    @pytest.mark.asyncio
+    async def test_feed_follows_status_and_job_changes(self, db_manager):
+        """Test that feed rows show the current status, title and company"""
+        job = _job("Engineer", "Acme", url="https://example.com/job")
+        application_id = await db_manager.save_application_result(job, {})
+
+        await db_manager.update_application_status(application_id, "applied")
+        await db_manager.save_job({**job, "title": "Senior Engineer", "company": "Acme Corp"})
+
+        recent_activity = (await db_manager.get_application_stats())["recent_activity"]
+        assert [activity["activity_type"] for activity in recent_activity] == ["status_change", "created"]
+        for activity in recent_activity:
+            assert activity["status"] == "applied"
+            assert activity["job_title"] == "Senior Engineer"
+            assert activity["company"] == "Acme Corp"
@@ -0,0 +1,180 @@
+"""
+Tests for LLM request retries and the circuit breaker
+"""
+
+import pytest
+import asyncio
+
+from services import llm_service as llm_module
+from services.llm_service import LLMService, LLMAPIError, LLMUnavailableError
+from config.settings import settings
+
+class TestLLMRetry:
+    """Test cases for retrying failed LLM requests and failing fast"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        """Create a service whose provider replies from a scripted list"""
+        # No backoff between attempts
+        monkeypatch.setattr(llm_module, "_RETRY_DELAY", 0)
+        monkeypatch.setattr(settings.llm, "retry_attempts", 3)
+        monkeypatch.setattr(settings.llm, "breaker_threshold", 5)
+        monkeypatch.setattr(settings.llm, "breaker_cooldown", 30.0)
+
+        self.llm_service = LLMService()
+        self.replies = []
+        self.calls = 0
+
+        async def send_completion(**kwargs):
+            self.calls += 1
+            reply = self.replies.pop(0)
+            if isinstance(reply, BaseException):
+                raise reply
+            return reply
+
+        monkeypatch.setattr(self.llm_service, "_send_completion", send_completion)
+
+    async def complete(self):
+        """Request an uncached completion"""
+        return await self.llm_service.generate_completion(prompt="Test prompt", temperature=0.7)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error", [
+        LLMAPIError("Server error", status=503),
+        LLMAPIError("Too many requests", status=429),
+        asyncio.TimeoutError()
+    ])
+    async def test_transient_errors_are_retried(self, error):
+        """Test that 5xx, 429 and timeouts are retried until a request succeeds"""
+        self.replies = [error, error, "Recovered"]
+
+        assert await self.complete() == "Recovered"
+        assert self.calls == 3
+        assert self.llm_service._breaker.failures == 0
+
+    @pytest.mark.asyncio
+    async def test_retries_give_up_after_retry_attempts(self):
+        """Test that the last transient error is raised once attempts run out"""
+        self.replies = [LLMAPIError("Server error", status=500)] * 3
+
+        with pytest.raises(LLMAPIError):
+            await self.complete()
+        assert self.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self):
+        """Test that a 4xx response is raised at once and not counted as a failure"""
+        self.replies = [LLMAPIError("Bad request", status=400), "Unreachable"]
+
+        with pytest.raises(LLMAPIError) as exc_info:
+            await self.complete()
+        assert exc_info.value.status == 400
+        assert self.calls == 1
+        assert self.llm_service._breaker.failures == 0
+
+    @pytest.mark.asyncio
+    async def test_breaker_opens_at_threshold(self, monkeypatch):
+        """Test that requests fail fast once breaker_threshold failures occurred"""
+        monkeypatch.setattr(settings.llm, "retry_attempts", 1)
+        monkeypatch.setattr(settings.llm, "breaker_threshold", 2)
+        llm_service = LLMService()
+        monkeypatch.setattr(llm_service, "_send_completion", self.llm_service._send_completion)
+        self.replies = [LLMAPIError("Server error", status=500)] * 2
+
+        for _ in range(2):
+            with pytest.raises(LLMAPIError):
+                await llm_service.generate_completion(prompt="Test prompt")
+
+        # The provider is not contacted while the breaker is open
+        with pytest.raises(LLMUnavailableError):
+            await llm_service.generate_completion(prompt="Test prompt")
+        assert self.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_breaker_closes_after_successful_probe(self, monkeypatch):
+        """Test that the first request after the cooldown probes and closes the breaker"""
+        monkeypatch.setattr(settings.llm, "retry_attempts", 1)
+        monkeypatch.setattr(settings.llm, "breaker_threshold", 1)
+        llm_service = LLMService()
+        monkeypatch.setattr(llm_service, "_send_completion", self.llm_service._send_completion)
+        self.replies = [LLMAPIError("Server error", status=500), "Probe", "After"]
+
+        with pytest.raises(LLMAPIError):
+            await llm_service.generate_completion(prompt="Test prompt")
+        with pytest.raises(LLMUnavailableError):
+            await llm_service.generate_completion(prompt="Test prompt")
+
+        # Let the cooldown elapse
+        llm_service._breaker.opened_at -= settings.llm.breaker_cooldown
+
+        assert await llm_service.generate_completion(prompt="Test prompt") == "Probe"
+        assert llm_service._breaker.opened_at is None
+        assert await llm_service.generate_completion(prompt="Test prompt") == "After"
+        assert self.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_reopens_breaker(self, monkeypatch):
+        """Test that a failing probe opens the breaker again"""
+        monkeypatch.setattr(settings.llm, "retry_attempts", 1)
+        monkeypatch.setattr(settings.llm, "breaker_threshold", 1)
+        llm_service = LLMService()
+        monkeypatch.setattr(llm_service, "_send_completion", self.llm_service._send_completion)
+        self.replies = [LLMAPIError("Server error", status=500)] * 2
+
+        with pytest.raises(LLMAPIError):
+            await llm_service.generate_completion(prompt="Test prompt")
+        llm_service._breaker.opened_at -= settings.llm.breaker_cooldown
+
+        with pytest.raises(LLMAPIError):
+            await llm_service.generate_completion(prompt="Test prompt")
+        with pytest.raises(LLMUnavailableError):
+            await llm_service.generate_completion(prompt="Test prompt")
+        assert self.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_only_one_probe_runs_at_a_time(self, monkeypatch):
+        """Test that calls made while the probe is in flight still fail fast"""
+        monkeypatch.setattr(settings.llm, "retry_attempts", 1)
+        monkeypatch.setattr(settings.llm, "breaker_threshold", 1)
+        llm_service = LLMService()
+        release = asyncio.Event()
+
+        async def send_completion(**kwargs):
+            self.calls += 1
+            if self.calls == 1:
+                raise LLMAPIError("Server error", status=500)
+            await release.wait()
+            return "Probe"
+
+        monkeypatch.setattr(llm_service, "_send_completion", send_completion)
+
+        with pytest.raises(LLMAPIError):
+            await llm_service.generate_completion(prompt="Test prompt")
+        llm_service._breaker.opened_at -= settings.llm.breaker_cooldown
+
+        probe = asyncio.ensure_future(llm_service.generate_completion(prompt="Test prompt"))
+        await asyncio.sleep(0)
+        with pytest.raises(LLMUnavailableError):
+            await asyncio.wait_for(llm_service.generate_completion(prompt="Test prompt"), timeout=1)
+
+        release.set()
+        assert await probe == "Probe"
+        assert await llm_service.generate_completion(prompt="Test prompt") == "Probe"
+        assert self.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_client_error_probe_allows_another_probe(self, monkeypatch):
+        """Test that a probe ending in a 4xx lets the next call probe"""
+        monkeypatch.setattr(settings.llm, "retry_attempts", 1)
+        monkeypatch.setattr(settings.llm, "breaker_threshold", 1)
+        llm_service = LLMService()
+        monkeypatch.setattr(llm_service, "_send_completion", self.llm_service._send_completion)
+        self.replies = [LLMAPIError("Server error", status=500), LLMAPIError("Bad request", status=400), "Probe"]
+
+        with pytest.raises(LLMAPIError):
+            await llm_service.generate_completion(prompt="Test prompt")
+        llm_service._breaker.opened_at -= settings.llm.breaker_cooldown
+
+        with pytest.raises(LLMAPIError):
+            await llm_service.generate_completion(prompt="Test prompt")
+        assert await llm_service.generate_completion(prompt="Test prompt") == "Probe"
@@ -0,0 +1,127 @@
+"""
+Tests for the resume parser
+"""
+
+import pytest
+from collections import Counter
+
+from services import resume_parser as parser_module
+from services.resume_parser import ResumeParser
+
+RESUME_TEXT = """Jane Smith
+jane.smith@example.com
+
+Skills
+Python, SQL, Docker
+"""
+
+class TestParseResumes:
+    """Test cases for parsing a batch of resume files"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        """Create a parser with two workers and a disk cache under tmp_path"""
+        monkeypatch.setattr(parser_module.settings.resume, "parse_workers", 2)
+        monkeypatch.setattr(parser_module.settings.resume, "parse_cache_days", 30)
+        monkeypatch.setattr(parser_module.settings.resume, "parse_cache_path", tmp_path / "cache" / "parsed_resumes.db")
+
+        self.tmp_path = tmp_path
+        self.parsers = []
+        self.submitted = []
+        yield
+        for parser in self.parsers:
+            parser.close()
+
+    def new_parser(self):
+        """Create a parser that records the files submitted to its workers"""
+        parser = ResumeParser()
+        self.parsers.append(parser)
+        process_pool = parser._get_process_pool()
+        if process_pool is not None:
+            submit = process_pool.submit
+            def recording_submit(fn, contents, filename):
+                self.submitted.append(filename)
+                return submit(fn, contents, filename)
+            process_pool.submit = recording_submit
+        return parser
+
+    def write_resume(self, name, text=RESUME_TEXT):
+        """Write a resume file and return its path"""
+        path = self.tmp_path / name
+        path.write_text(text)
+        return str(path)
+
+    def test_every_path_is_yielded_once(self):
+        """Test that each path is yielded once and duplicate contents are parsed once"""
+        paths = [
+            self.write_resume("a.txt"),
+            self.write_resume("b.txt", RESUME_TEXT.replace("Jane", "John")),
+            self.write_resume("a_copy.txt"),
+            self.write_resume("c.txt", RESUME_TEXT.replace("Docker", "Kubernetes"))
+        ]
+        parser = self.new_parser()
+
+        results = list(parser.parse_resumes(paths))
+
+        assert Counter(path for path, _ in results) == Counter(paths)
+        assert Counter(self.submitted) == Counter(paths[0:2] + paths[3:4])
+
+        parsed = dict(results)
+        assert parsed[paths[0]] == parsed[paths[2]]
+        assert parsed[paths[0]] is not parsed[paths[2]]
+        assert parsed[paths[1]]["name"] == "John Smith"
+
+    def test_repeated_path_is_yielded_for_each_occurrence(self):
+        """Test that a path listed twice is yielded twice from a single parse"""
+        path = self.write_resume("a.txt")
+        parser = self.new_parser()
+
+        assert [result_path for result_path, _ in parser.parse_resumes([path, path])] == [path, path]
+        assert self.submitted == [path]
+
+    def test_cached_files_are_not_resubmitted(self):
+        """Test that files in the memory or disk cache skip the workers"""
+        cached = self.write_resume("a.txt")
+        new = self.write_resume("b.txt", RESUME_TEXT.replace("Jane", "John"))
+        parser = self.new_parser()
+        expected = parser.parse_resume(cached)
+
+        assert dict(parser.parse_resumes([cached, new]))[cached] == expected
+        assert self.submitted == [new]
+
+        # A new parser finds both files in the disk cache
+        self.submitted.clear()
+        assert len(list(self.new_parser().parse_resumes([cached, new]))) == 2
+        assert self.submitted == []
+
+    def test_batch_without_workers_keeps_input_order(self, monkeypatch):
+        """Test that parse_workers=0 parses inline, in input order"""
+        monkeypatch.setattr(parser_module.settings.resume, "parse_workers", 0)
+        paths = [self.write_resume(f"{name}.txt", RESUME_TEXT.replace("Jane", name)) for name in ("Anna", "Bert", "Carl")]
+
+        results = list(self.new_parser().parse_resumes(paths))
+
+        assert [path for path, _ in results] == paths
+        assert [parsed["name"] for _, parsed in results] == ["Anna Smith", "Bert Smith", "Carl Smith"]
+
+class TestSectionHeadings:
+    """Test cases for finding resume sections by their headings"""
+
+    def test_qualified_headings_open_sections(self):
+        """Test that headings like PROFESSIONAL EXPERIENCE and Technical Skills: are found"""
+        parsed = ResumeParser()._extract_information(
+            "Al Wu\n\nPROFESSIONAL EXPERIENCE\nSWE | Google | 2019 - Present\n• Did search\n\nTECHNICAL SKILLS\nGo, Rust, Elixir\n"
+        )
+        assert [(position["title"], position["company"]) for position in parsed["experience"]] == [("SWE", "Google")]
+        assert [skill["name"] for skill in parsed["skills"]] == ["Rust", "Elixir"]
+
+        parsed = ResumeParser()._extract_information("Al Wu\n\nTechnical Skills:\nPython, Docker\n")
+        assert [skill["name"] for skill in parsed["skills"]] == ["Python", "Docker"]
+
+    def test_headings_must_end_the_line(self):
+        """Test that a section keyword in running text does not open a section"""
+        parsed = ResumeParser()._extract_information(
+            "Al Wu\n\nSummary\nGained experience in Python\n"
+        )
+        assert parsed["experience"] == []
+        assert parsed["summary"] == "Gained experience in Python"
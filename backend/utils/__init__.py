@@ -9,11 +9,14 @@ from .file_utils import (
     load_json, 
     backup_file, 
     save_upload_file_temp,
-    extract_text_from_file
+    extract_text_from_file,
+    extract_text_from_bytes
 )
 from .automation_helpers import (
     add_human_delay, 
+    HumanDelayStream,
     retry_operation, 
+    aretry_operation,
     parse_boolean_env
 )
 
@@ -25,7 +28,10 @@ __all__ = [
     'backup_file',
     'save_upload_file_temp',
     'extract_text_from_file',
+    'extract_text_from_bytes',
     'add_human_delay',
+    'HumanDelayStream',
     'retry_operation',
+    'aretry_operation',
     'parse_boolean_env'
 ]
@@ -4,13 +4,59 @@ Automation helpers for AI Job Hunt system
 
 import os
 import time
-import random
+import asyncio
+import inspect
 from typing import Dict, List, Any, Optional, Callable
 
+import numpy as np
+
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+class HumanDelayStream:
+    """
+    Stream of random human-like delays drawn from pre-generated samples
+    
+    Uniform samples are generated in blocks of `size` and rescaled to each
+    requested range, so a long automation run draws from the generator once
+    per block. Pass a seed to replay the same delays, e.g. in tests.
+    """
+    
+    def __init__(self, size: int = 1024, seed: Optional[int] = None):
+        """
+        Initialize the delay stream
+        
+        Args:
+            size: Number of samples generated at a time
+            seed: Seed for the random generator (random if not provided)
+        """
+        self.size = size
+        self._rng = np.random.default_rng(seed)
+        self._samples = self._rng.random(size)
+        self._index = 0
+    
+    def next_delay(self, min_seconds: float = 0.5, max_seconds: float = 3.0) -> float:
+        """
+        Get the next delay
+        
+        Args:
+            min_seconds: Minimum delay in seconds
+            max_seconds: Maximum delay in seconds
+            
+        Returns:
+            Delay in seconds between min_seconds and max_seconds
+        """
+        if self._index == self.size:
+            self._samples = self._rng.random(self.size)
+            self._index = 0
+        sample = self._samples[self._index]
+        self._index += 1
+        return min_seconds + float(sample) * (max_seconds - min_seconds)
+
+# Stream used by add_human_delay
+_delay_stream = HumanDelayStream()
+
 def add_human_delay(min_seconds: float = 0.5, max_seconds: float = 3.0) -> None:
     """
     Add a random delay to simulate human interaction
@@ -19,8 +65,21 @@ def add_human_delay(min_seconds: float = 0.5, max_seconds: float = 3.0) -> None:
         min_seconds: Minimum delay in seconds
         max_seconds: Maximum delay in seconds
     """
-    delay = random.uniform(min_seconds, max_seconds)
-    time.sleep(delay)
+    time.sleep(_delay_stream.next_delay(min_seconds, max_seconds))
+
+def _compute_delay(attempt: int, retry_delay: float, backoff_factor: float) -> float:
+    """
+    Delay before retrying after a failed attempt, with exponential backoff
+    
+    Args:
+        attempt: Number of the attempt that failed, starting at 1
+        retry_delay: Initial delay between retries in seconds
+        backoff_factor: Factor by which to increase delay after each failure
+        
+    Returns:
+        Delay in seconds
+    """
+    return retry_delay * (backoff_factor ** (attempt - 1))
 
 def retry_operation(
     operation: Callable,
@@ -33,6 +92,9 @@ def retry_operation(
     """
     Retry an operation with exponential backoff
     
+    If operation is a coroutine function this returns the aretry_operation
+    coroutine, which the caller must await.
+    
     Args:
         operation: Function to retry
         max_attempts: Maximum number of retry attempts
@@ -47,6 +109,16 @@ def retry_operation(
     Raises:
         The last exception encountered if all attempts fail
     """
+    if inspect.iscoroutinefunction(operation):
+        return aretry_operation(
+            operation,
+            max_attempts=max_attempts,
+            retry_delay=retry_delay,
+            backoff_factor=backoff_factor,
+            exceptions_to_catch=exceptions_to_catch,
+            retry_message=retry_message
+        )
+        
     attempt = 1
     last_exception = None
     
@@ -61,7 +133,7 @@ def retry_operation(
                 logger.warning(message)
                 
                 # Calculate delay with exponential backoff
-                current_delay = retry_delay * (backoff_factor ** (attempt - 1))
+                current_delay = _compute_delay(attempt, retry_delay, backoff_factor)
                 time.sleep(current_delay)
                 
                 attempt += 1
@@ -72,6 +144,56 @@ def retry_operation(
     # If we got here, all attempts failed
     raise last_exception
 
+async def aretry_operation(
+    operation: Callable,
+    max_attempts: int = 3,
+    retry_delay: float = 2.0,
+    backoff_factor: float = 1.5,
+    exceptions_to_catch: tuple = (Exception,),
+    retry_message: Optional[str] = None
+) -> Any:
+    """
+    Retry an async operation with exponential backoff
+    
+    Backoff waits with asyncio.sleep, so other tasks keep running between attempts.
+    
+    Args:
+        operation: Coroutine function to retry
+        max_attempts: Maximum number of retry attempts
+        retry_delay: Initial delay between retries in seconds
+        backoff_factor: Factor by which to increase delay after each failure
+        exceptions_to_catch: Tuple of exceptions that should trigger a retry
+        retry_message: Custom message to log on retry (defaults to generic message)
+        
+    Returns:
+        The result of the operation if successful
+        
+    Raises:
+        The last exception encountered if all attempts fail
+    """
+    attempt = 1
+    last_exception = None
+    
+    while attempt <= max_attempts:
+        try:
+            return await operation()
+        except exceptions_to_catch as e:
+            last_exception = e
+            
+            if attempt < max_attempts:
+                message = retry_message or f"Operation failed: {str(e)}. Retrying ({attempt}/{max_attempts})..."
+                logger.warning(message)
+                
+                await asyncio.sleep(_compute_delay(attempt, retry_delay, backoff_factor))
+                
+                attempt += 1
+            else:
+                logger.error(f"Operation failed after {max_attempts} attempts: {str(e)}")
+                break
+    
+    # If we got here, all attempts failed
+    raise last_exception
+
 def parse_boolean_env(env_var: str, default: bool = False) -> bool:
     """
     Parse a boolean environment variable
@@ -2,21 +2,32 @@
 File utility functions for AI Job Hunt system
 """
 
+import io
 import os
-import json
+import errno
 import shutil
 from pathlib import Path
-from typing import Dict, List, Any, Union, Optional
+from typing import Dict, List, Any, Union, Optional, BinaryIO
 import logging
 import tempfile
 from fastapi import UploadFile
+import orjson
 import PyPDF2
 import docx2txt
 
+# PDFium extracts text far faster than PyPDF2; without it PDFs go through PyPDF2
+try:
+    import pypdfium2
+except ImportError:
+    pypdfium2 = None
+
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# save_json output: two-space indented, with non-string dict keys written as strings
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 def ensure_directory(directory_path: Union[str, Path]) -> Path:
     """
     Ensure a directory exists, creating it if necessary
@@ -35,17 +46,26 @@ def save_json(data: Union[Dict, List], file_path: Union[str, Path]) -> None:
     """
     Save data to a JSON file
     
+    The data is written to a temporary file beside the target, which then
+    replaces it in one rename, so readers never see a partially written file.
+    
     Args:
         data: Data to save (must be JSON serializable)
         file_path: Path where the JSON file will be saved
     """
     path = Path(file_path)
     ensure_directory(path.parent)
+    temp_path = path.with_name(f".{path.name}.{os.urandom(4).hex()}.tmp")
     
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # orjson writes UTF-8 without escaping non-ASCII characters
+        content = orjson.dumps(data, option=_JSON_OPTIONS)
+        # Exclusive create, so the file gets the usual permissions for a new file
+        with open(temp_path, 'xb') as f:
+            f.write(content)
+        os.replace(temp_path, path)
     except Exception as e:
+        temp_path.unlink(missing_ok=True)
         logger.error(f"Error saving JSON to {file_path}: {str(e)}")
         raise
 
@@ -66,8 +86,8 @@ def load_json(file_path: Union[str, Path]) -> Any:
             logger.warning(f"JSON file does not exist: {file_path}")
             return None
             
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
     except Exception as e:
         logger.error(f"Error loading JSON from {file_path}: {str(e)}")
         raise
@@ -104,13 +124,47 @@ def backup_file(file_path: Union[str, Path], backup_dir: Optional[Union[str, Pat
     
     # Copy the file
     try:
-        shutil.copy2(source_path, backup_path)
+        _copy_file(source_path, backup_path)
         logger.info(f"Created backup of {source_path} at {backup_path}")
         return backup_path
     except Exception as e:
         logger.error(f"Error creating backup of {source_path}: {str(e)}")
         raise
 
+def _copy_file(source_path: Path, target_path: Path) -> None:
+    """
+    Copy a file with its metadata, like shutil.copy2
+    
+    Where available, copy_file_range lets the kernel copy the data itself, which
+    is a reflink (no data copied) on XFS/Btrfs and a server-side copy on NFS.
+    A hard link would be cheaper still, but would not be a backup: the link
+    would change along with any in-place edit of the original.
+    
+    Args:
+        source_path: File to copy
+        target_path: Path of the copy, replaced if it exists
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source_path, 'rb') as source, open(target_path, 'wb') as target:
+                remaining = os.fstat(source.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(source.fileno(), target.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            # copy_file_range can stop early (some filesystems, or a file that
+            # shrank); copy normally rather than keep a truncated backup
+            if remaining == 0:
+                shutil.copystat(source_path, target_path)
+                return
+        except OSError as e:
+            # Not supported for this pair of files (e.g. across filesystems); copy normally
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL):
+                raise
+    
+    shutil.copy2(source_path, target_path)
+
 async def save_upload_file_temp(upload_file: UploadFile) -> Path:
     """
     Save an uploaded file to a temporary location
@@ -149,47 +203,96 @@ def extract_text_from_file(file_path: Union[str, Path]) -> str:
     path = Path(file_path)
     suffix = path.suffix.lower()
     
+    if suffix not in _TEXT_EXTRACTORS:
+        logger.warning(f"Unsupported file type for text extraction: {suffix}")
+        return ""
     try:
-        if suffix == '.pdf':
-            return _extract_text_from_pdf(path)
-        elif suffix in ['.docx', '.doc']:
-            return _extract_text_from_docx(path)
-        elif suffix in ['.txt', '.md', '.csv']:
-            return _extract_text_from_text_file(path)
-        else:
-            logger.warning(f"Unsupported file type for text extraction: {suffix}")
-            return ""
+        with open(path, 'rb') as file:
+            return _TEXT_EXTRACTORS[suffix](file, path)
     except Exception as e:
         logger.error(f"Error extracting text from {file_path}: {str(e)}")
         return ""
 
-def _extract_text_from_pdf(file_path: Path) -> str:
+def extract_text_from_bytes(contents: bytes, filename: str) -> str:
+    """
+    Extract text content from in-memory file contents, e.g. an upload
+    
+    Args:
+        contents: The file's bytes
+        filename: Original file name; its suffix selects the extractor
+        
+    Returns:
+        Extracted text content
+    """
+    suffix = Path(filename).suffix.lower()
+    
+    if suffix not in _TEXT_EXTRACTORS:
+        logger.warning(f"Unsupported file type for text extraction: {suffix}")
+        return ""
+    try:
+        return _TEXT_EXTRACTORS[suffix](io.BytesIO(contents), filename)
+    except Exception as e:
+        logger.error(f"Error extracting text from {filename}: {str(e)}")
+        return ""
+
+def _extract_text_from_pdf(file: BinaryIO, name: Union[str, Path]) -> str:
     """Extract text from a PDF file"""
+    if pypdfium2 is not None:
+        try:
+            return _extract_text_from_pdf_pdfium(file)
+        except pypdfium2.PdfiumError as e:
+            logger.warning(f"PDFium could not read PDF {name}, trying PyPDF2: {str(e)}")
+            file.seek(0)
+    
     text = ""
     try:
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page_num in range(len(pdf_reader.pages)):
-                text += pdf_reader.pages[page_num].extract_text() + "\n"
+        pdf_reader = PyPDF2.PdfReader(file)
+        for page_num in range(len(pdf_reader.pages)):
+            text += pdf_reader.pages[page_num].extract_text() + "\n"
         return text
     except Exception as e:
-        logger.error(f"Error extracting text from PDF {file_path}: {str(e)}")
+        logger.error(f"Error extracting text from PDF {name}: {str(e)}")
         raise
 
-def _extract_text_from_docx(file_path: Path) -> str:
+def _extract_text_from_pdf_pdfium(file: BinaryIO) -> str:
+    """Extract text from a PDF file with PDFium, one line break after each page"""
+    pdf = pypdfium2.PdfDocument(file)
+    try:
+        text = ""
+        for page in pdf:
+            text_page = page.get_textpage()
+            # PDFium ends lines with "\r\n"; the parsers expect "\n"
+            text += text_page.get_text_range().replace("\r\n", "\n") + "\n"
+            text_page.close()
+            page.close()
+        return text
+    finally:
+        pdf.close()
+
+def _extract_text_from_docx(file: BinaryIO, name: Union[str, Path]) -> str:
     """Extract text from a DOCX file"""
     try:
-        text = docx2txt.process(file_path)
+        text = docx2txt.process(file)
         return text
     except Exception as e:
-        logger.error(f"Error extracting text from DOCX {file_path}: {str(e)}")
+        logger.error(f"Error extracting text from DOCX {name}: {str(e)}")
         raise
 
-def _extract_text_from_text_file(file_path: Path) -> str:
+def _extract_text_from_text_file(file: BinaryIO, name: Union[str, Path]) -> str:
     """Extract text from a plain text file"""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
-            return file.read()
+        # Decode like open() in text mode, including newline translation
+        return io.TextIOWrapper(file, encoding='utf-8', errors='replace').read()
     except Exception as e:
-        logger.error(f"Error reading text file {file_path}: {str(e)}")
+        logger.error(f"Error reading text file {name}: {str(e)}")
         raise
+
+# Text extractor by lower-case file suffix; each reads a binary file object
+_TEXT_EXTRACTORS = {
+    '.pdf': _extract_text_from_pdf,
+    '.docx': _extract_text_from_docx,
+    '.doc': _extract_text_from_docx,
+    '.txt': _extract_text_from_text_file,
+    '.md': _extract_text_from_text_file,
+    '.csv': _extract_text_from_text_file
+}